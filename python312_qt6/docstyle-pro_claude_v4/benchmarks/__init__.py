@@ -0,0 +1,17 @@
+"""
+benchmarks — DocStyle Pro 변환 성능 측정
+
+    synth.py  재현 가능한 합성 원고(.md / .docx) 생성
+    run.py    파서 · JSON 직렬화 · 엔진 · convert() 측정과 기준값 비교
+    micro.py  파서 함수 단독 측정 (git 리비전과 비교)
+    payload.py  엔진 입력 형식(JSON / MessagePack) 크기 · 인코딩 · 디코딩 비교
+    memory.py   파싱 결과 요소 메모리 (목록 / ElementStore)
+    incremental.py  편집기용 증분 파싱 (편집마다 전체 재파싱과 비교)
+
+    python -m benchmarks.run --sizes 10,1000 --templates 01 --save-baseline
+    python -m benchmarks.run --sizes 10,1000 --templates 01
+    python -m benchmarks.micro --against HEAD~1
+    python -m benchmarks.payload --sizes 1000,10000
+    python -m benchmarks.memory --sizes 10000,50000
+    python -m benchmarks.incremental --sizes 1000,10000
+"""
@@ -0,0 +1,115 @@
+"""
+incremental.py — 편집기용 증분 파싱(IncrementalMdParser.edit) 측정 · 점검
+
+    python -m benchmarks.incremental
+    python -m benchmarks.incremental --sizes 1000,50000 --edits 300
+
+synth.py 원고에 임의 편집(줄 교체 · 삽입 · 삭제, 끝에 빈 줄 추가 등)을 --edits 회
+적용하면서 매번 전체 재파싱과 비교한다.
+
+- text().splitlines() 가 lines 와 같은지 (원고 끝 줄바꿈 유무 모두)
+- document 의 meta · 요소 · src_lines 가 parse_md_text(text()) 와 같은지
+  다르면 어느 편집에서 갈라졌는지 적고 종료 코드 1.
+
+그다음 본문 가운데 한 줄 편집과 전체 파싱의 CPU 시간 최소값(ms)을 비교한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+
+from parser import md_parser
+from parser.md_parser import IncrementalMdParser
+
+from .micro import _resolve, _time_cpu
+from .run import _BENCH_ROOT
+from .synth import make_markdown
+
+
+_DEFAULT_SIZES = (1_000, 10_000)
+
+# 원고 줄 외에 끼워 넣는 줄 — 블록 경계 · 상태를 바꾸는 것 위주
+_EXTRA_LINES = ("", "", "[empty]", "[tip]", "## 새 절", "# 1. 새 장", "- 새 항목", "새 문단입니다.", "---")
+
+
+def _mismatch(inc: IncrementalMdParser) -> str:
+    """증분 결과와 전체 재파싱 비교 — 다르면 설명, 같으면 빈 문자열"""
+    text = inc.text()
+    if text.splitlines() != inc.lines:
+        return "text() 가 lines 로 되돌아가지 않습니다"
+    full = md_parser.parse_md_text(text, _resolve)
+    doc = inc.document
+    if doc.meta != full.meta:
+        return "meta 가 다릅니다"
+    if doc.elements != full.elements:
+        return f"요소가 다릅니다 ({len(doc.elements)} / 전체 {len(full.elements)})"
+    if [e.src_lines for e in doc.elements] != [e.src_lines for e in full.elements]:
+        return "src_lines 가 다릅니다"
+    return ""
+
+
+def check_edits(text: str, n_edits: int, seed: int = 0) -> str:
+    """text 에 임의 편집 n_edits 회 — 편집마다 전체 재파싱과 비교"""
+    rng = random.Random(seed)
+    inc = IncrementalMdParser(text, image_resolver=_resolve)
+    problem = _mismatch(inc)
+    if problem:
+        return f"초기 파싱: {problem}"
+    for i in range(n_edits):
+        lines = inc.lines
+        n = len(lines)
+        start = n if rng.random() < 0.1 else rng.randint(0, n)   # 끝에 덧붙이기를 자주
+        end = min(n, start + rng.choice((0, 0, 1, 1, 2, 3)))
+        pool = lines + list(_EXTRA_LINES) if lines else list(_EXTRA_LINES)
+        new_lines = [rng.choice(pool) for _ in range(rng.choice((0, 1, 1, 2, 3)))]
+        inc.edit(start, end, new_lines)
+        problem = _mismatch(inc)
+        if problem:
+            return f"{i + 1}번째 편집 edit({start}, {end}, {new_lines!r}): {problem}"
+    return ""
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.incremental", description="증분 파싱 측정 · 점검")
+    ap.add_argument("--sizes", default=",".join(map(str, _DEFAULT_SIZES)), help="요소 수 목록")
+    ap.add_argument("--edits", type=int, default=100, help="점검 편집 횟수")
+    ap.add_argument("--repeat", type=int, default=7, help="반복 횟수 (최소값 사용)")
+    args = ap.parse_args(argv)
+
+    for problem in (check_edits(t, 50, seed) for seed, t in enumerate(("", "[empty]", "[empty]\n", "문단\n\n"))):
+        if problem:
+            print(f"짧은 원고: {problem}", file=sys.stderr)
+            return 1
+
+    print(f"{'input':<28}{'lines':>9}{'edit':>12}{'full':>12}{'speedup':>10}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        for images, tables, variant in ((False, False, "plain"), (True, True, "rich")):
+            text = make_markdown(_BENCH_ROOT / "data", size, images, tables).read_text(encoding="utf-8")
+            name = f"md-{size}-{variant}"
+            # 원고 끝 줄바꿈이 있는 경우와 없는 경우 모두
+            for seed, src in enumerate((text, text.rstrip("\n"))):
+                problem = check_edits(src, args.edits, seed)
+                if problem:
+                    print(f"{name}: {problem}", file=sys.stderr)
+                    return 1
+
+            inc = IncrementalMdParser(text, image_resolver=_resolve)
+            mid = len(inc.lines) // 2
+            line = inc.lines[mid]
+            edit_ms, full_ms = _time_cpu([
+                lambda: inc.edit(mid, mid + 1, [line]),
+                lambda: md_parser.parse_md_text(text, _resolve),
+            ], args.repeat)
+            print(f"{name:<28}{len(inc.lines):>9}{edit_ms:>10.2f}ms{full_ms:>10.1f}ms"
+                  f"{f'×{full_ms / max(edit_ms, 0.01):.0f}':>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+memory.py — 파싱 결과 요소 메모리 측정
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --sizes 10000,50000
+
+synth.py 원고를 parse_md_text 로 파싱해, 결과가 붙잡고 있는 메모리를
+tracemalloc 으로 잰다 (파싱 중 임시 객체는 빼고 남은 것만).
+
+    list   — ParsedDocument.elements 기본 (slots dataclass 목록)
+    store  — ParsedDocument.compact() 의 ElementStore (열 단위)
+
+원고 텍스트 자체(UTF-8 바이트)도 함께 적어 요소 모델의 부담을 비교한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Callable
+
+from parser import md_parser
+
+from .micro import _resolve
+from .run import _BENCH_ROOT
+from .synth import make_markdown
+
+
+_DEFAULT_SIZES = (10_000, 50_000)
+
+
+def _retained_kib(build: Callable[[], object]) -> tuple[object, float]:
+    """build() 결과가 붙잡고 있는 메모리 (KiB) — 결과도 함께 반환"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        return result, (tracemalloc.get_traced_memory()[0] - base) / 1024
+    finally:
+        tracemalloc.stop()
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.memory", description="요소 모델 메모리 측정")
+    ap.add_argument("--sizes", default=",".join(map(str, _DEFAULT_SIZES)), help="요소 수 목록")
+    args = ap.parse_args(argv)
+
+    print(f"{'input':<22}{'text':>11}{'list':>11}{'store':>11}{'B/el list':>11}{'B/el store':>12}{'saved':>8}")
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        for images, tables, variant in ((False, False, "plain"), (True, True, "rich")):
+            text = make_markdown(_BENCH_ROOT / "data", size, images, tables).read_text(encoding="utf-8")
+            doc, list_kib = _retained_kib(lambda: md_parser.parse_md_text(text, _resolve))
+            n = len(doc.elements)
+            if doc.compact().elements != doc.elements:
+                print(f"md-{size}-{variant}: ElementStore 내용이 다릅니다", file=sys.stderr)
+                return 1
+            del doc
+            _, store_kib = _retained_kib(lambda: md_parser.parse_md_text(text, _resolve).compact())
+            print(f"{f'md-{size}-{variant}':<22}"
+                  f"{len(text.encode('utf-8')) / 1024:>9.0f}K{list_kib:>10.0f}K{store_kib:>10.0f}K"
+                  f"{list_kib * 1024 / n:>11.0f}{store_kib * 1024 / n:>12.0f}{1 - store_kib / list_kib:>8.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+micro.py — 단일 함수 마이크로 벤치마크
+
+    python -m benchmarks.micro                      # 현재 트리의 parse_md_text
+    python -m benchmarks.micro --against HEAD~1     # 이전 리비전 md_parser 와 비교
+
+run.py 와 달리 파일 I/O · 이미지 확인 · 엔진을 빼고 파서 함수만 잰다.
+입력은 synth.py 원고 텍스트(메모리), 이미지 해석은 고정 리졸버로 대신한다.
+--against 는 git show 로 해당 리비전의 parser/md_parser.py 를 읽어
+parser 패키지 안의 별도 모듈로 불러온다 (models 등은 현재 트리 것을 공유).
+그 리비전에 parse_md_text 가 없으면(메모리 파싱 이전) 모든 구현을 원고 파일
+경로의 parse_md 로 잰다 — 이때는 파일 읽기와 이미지 확인이 포함되고,
+이전 파서가 비워 두던 이미지 크기(width_emu / height_emu)는 비교에서 뺀다.
+
+각 항목은 두 구현을 번갈아 repeat 회 실행하고 CPU 시간 최소값(ms)을 쓴다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import subprocess
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+import parser as parser_pkg
+from parser import md_parser
+from parser.models import ImageElement
+
+from .run import _BENCH_ROOT
+from .synth import make_markdown
+
+
+_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_SIZES = (1_000, 10_000, 50_000)
+
+
+def _resolve(filename: str) -> str:
+    return filename   # 이미지 존재 확인(stat)은 재지 않는다 — 모두 있다고 본다
+
+
+def _without_image_size(elements: list) -> list:
+    return [replace(el, width_emu=0, height_emu=0) if isinstance(el, ImageElement) else el for el in elements]
+
+
+def load_md_parser(rev: str) -> ModuleType:
+    """git 리비전 rev 의 md_parser 를 parser._md_parser_at_rev 로 불러온다"""
+    src = subprocess.run(
+        ["git", "show", f"{rev}:./parser/md_parser.py"],
+        capture_output=True, text=True, encoding="utf-8", cwd=str(_ROOT), check=True,
+    ).stdout
+    name = "parser._md_parser_at_rev"
+    spec = importlib.util.spec_from_loader(name, loader=None, origin=f"{rev}:parser/md_parser.py")
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = parser_pkg.__name__
+    sys.modules[name] = module
+    exec(compile(src, spec.origin, "exec"), module.__dict__)
+    return module
+
+
+def _time_cpu(fns: list[Callable[[], object]], repeat: int) -> list[float]:
+    """fns 를 번갈아 repeat 회 — 각 CPU 시간 최소값(ms)"""
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            t0 = time.process_time()
+            fn()
+            best[i] = min(best[i], time.process_time() - t0)
+    return [round(b * 1000, 2) for b in best]
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.micro", description="md_parser 마이크로 벤치마크")
+    ap.add_argument("--sizes", default=",".join(map(str, _DEFAULT_SIZES)), help="요소 수 목록")
+    ap.add_argument("--repeat", type=int, default=7, help="반복 횟수 (최소값 사용)")
+    ap.add_argument("--against", default="", help="비교할 git 리비전 (예: HEAD~1)")
+    args = ap.parse_args(argv)
+
+    impls: list[tuple[str, ModuleType]] = [("current", md_parser)]
+    if args.against:
+        impls.insert(0, (args.against, load_md_parser(args.against)))
+    from_text = all(hasattr(m, "parse_md_text") for _, m in impls)
+    if not from_text:
+        print(f"{args.against} 에 parse_md_text 가 없어 parse_md(파일)로 잽니다", file=sys.stderr)
+
+    print(f"{'input':<28}{'lines':>9}" + "".join(f"{name:>14}" for name, _ in impls)
+          + ("    speedup" if len(impls) > 1 else ""))
+    for size in (int(s) for s in args.sizes.split(",") if s.strip()):
+        for images, tables, variant in ((False, False, "plain"), (True, True, "rich")):
+            path = make_markdown(_BENCH_ROOT / "data", size, images, tables)
+            text = path.read_text(encoding="utf-8")
+            if from_text:
+                fns = [lambda m=m: m.parse_md_text(text, _resolve) for _, m in impls]
+            else:
+                fns = [lambda m=m: m.parse_md(str(path)) for _, m in impls]
+            results = [fn().elements for fn in fns]
+            if not from_text:
+                results = [_without_image_size(r) for r in results]
+            if any(r != results[0] for r in results[1:]):
+                print(f"md-{size}-{variant}: 출력이 다릅니다", file=sys.stderr)
+                return 1
+            ms = _time_cpu(fns, args.repeat)
+            lines = text.count("\n") + 1
+            row = f"{f'md-{size}-{variant}':<28}{lines:>9}" + "".join(f"{v:>12.1f}ms" for v in ms)
+            if len(ms) > 1:
+                row += f"    ×{ms[0] / ms[-1]:.2f}"
+            print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
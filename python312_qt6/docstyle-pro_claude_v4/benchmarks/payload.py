@@ -0,0 +1,152 @@
+"""
+payload.py — 엔진 입력 형식 비교 (JSON indent / JSON compact / MessagePack)
+
+    python -m benchmarks.payload
+    python -m benchmarks.payload --sizes 1000,10000 --repeat 5
+
+synth.py 원고를 한 번 파싱한 ParsedDocument 로 세 형식을 만들어
+크기, 파이썬 직렬화 CPU 시간, 엔진(node) 디코딩 시간을 비교한다.
+
+- rich 입력의 이미지는 파일 참조라 본문이 실리지 않는다.
+  docx-mem 은 parse_bytes(메모리 이미지)로 data_b64 / bin 본문이 실리는 경우다.
+- node 측은 engine/core/payload.js 의 decodeInput 만 잰다 (빌드 · 패킹 제외).
+  node 가 없으면 그 열은 비운다.
+- 재기 전에 MessagePack 결과를 되읽어 JSON 입력 객체와 같은지, 설치된 인코더
+  (msgpack 패키지 또는 순수 파이썬) 출력이 순수 파이썬 인코더와 같은지 확인한다.
+  다르면 종료 코드 1.
+
+각 항목은 형식들을 번갈아 repeat 회 실행하고 CPU 시간 최소값(ms)을 쓴다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from bridge.json_builder import JSON_BACKEND, build_json, build_payload, iter_json_chunks
+from bridge.msgpack_codec import MSGPACK_BACKEND, _packb_py, packb, unpack_payload
+from parser import md_parser
+from parser.docx_parser import parse_bytes
+
+from .micro import _resolve, _time_cpu
+from .run import _BENCH_ROOT
+from .synth import make_docx, make_markdown
+
+
+_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_SIZES = (1_000, 10_000)
+
+_FORMATS = {
+    "json-indent":  lambda p: build_json(p).encode("utf-8"),
+    "json-compact": lambda p: b"".join(iter_json_chunks(p)),
+    "msgpack":      lambda p: b"".join(iter_json_chunks(p, format="msgpack")),
+}
+
+# 파일마다 decodeInput 을 repeat 회 — 최소 CPU 시간(ms) 을 JSON 한 줄로
+_NODE_SCRIPT = r"""
+const fs = require("fs");
+const { decodeInput } = require("./core/payload");
+const [repeat, ...files] = process.argv.slice(1);
+const out = {};
+for (const f of files) {
+  const buf = fs.readFileSync(f);
+  let best = Infinity;
+  for (let i = 0; i < Number(repeat); i++) {
+    const t0 = process.cpuUsage();
+    decodeInput(buf);
+    const d = process.cpuUsage(t0);
+    best = Math.min(best, (d.user + d.system) / 1000);
+  }
+  out[f] = best;
+}
+console.log(JSON.stringify(out));
+"""
+
+
+def _node_decode_ms(paths: list[Path], repeat: int) -> dict[str, float] | None:
+    node = shutil.which("node")
+    if not node:
+        return None
+    proc = subprocess.run(
+        [node, "-e", _NODE_SCRIPT, str(repeat), *map(str, paths)],
+        capture_output=True, text=True, encoding="utf-8", cwd=str(_ROOT / "engine"),
+    )
+    if proc.returncode != 0:
+        print(proc.stderr.strip(), file=sys.stderr)
+        return None
+    return json.loads(proc.stdout)
+
+
+def check_msgpack(parsed, data: bytes) -> str:
+    """MessagePack 입력 점검 — 문제가 있으면 설명, 없으면 빈 문자열"""
+    expected = build_payload(parsed)
+    decoded = unpack_payload(data)
+    for el in decoded["elements"]:
+        if "data" in el:
+            el["data_b64"] = base64.b64encode(el.pop("data")).decode("ascii")
+    if decoded != expected:
+        return "MessagePack 을 되읽은 결과가 JSON 입력과 다릅니다"
+    if MSGPACK_BACKEND != "python":
+        header = dict(expected)
+        elements = header.pop("elements")
+        for obj in (header, *elements):
+            if packb(obj) != _packb_py(obj):
+                return f"{MSGPACK_BACKEND} 인코더 출력이 순수 파이썬 인코더와 다릅니다"
+    return ""
+
+
+def _inputs(sizes: list[int]):
+    data_dir = _BENCH_ROOT / "data"
+    for size in sizes:
+        for images, tables, variant in ((False, False, "plain"), (True, True, "rich")):
+            text = make_markdown(data_dir, size, images, tables).read_text(encoding="utf-8")
+            yield f"md-{size}-{variant}", md_parser.parse_md_text(text, _resolve)
+        docx = make_docx(data_dir, size, True, True).read_bytes()
+        yield f"docx-mem-{size}", parse_bytes(docx)
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.payload", description="엔진 입력 형식 비교")
+    ap.add_argument("--sizes", default=",".join(map(str, _DEFAULT_SIZES)), help="요소 수 목록")
+    ap.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소값 사용)")
+    args = ap.parse_args(argv)
+
+    out_dir = _BENCH_ROOT / "payload"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    print(f"JSON 백엔드 {JSON_BACKEND} · MessagePack 인코더 {MSGPACK_BACKEND}")
+    print(f"{'input':<20}{'format':<14}{'bytes':>12}{'size%':>8}{'encode':>12}{'decode(node)':>14}")
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    for name, parsed in _inputs(sizes):
+        payloads = {fmt: fn(parsed) for fmt, fn in _FORMATS.items()}
+        problem = check_msgpack(parsed, payloads["msgpack"])
+        if problem:
+            print(f"{name}: {problem}", file=sys.stderr)
+            return 1
+        encode_ms = _time_cpu([lambda fn=fn: fn(parsed) for fn in _FORMATS.values()], args.repeat)
+        paths = []
+        for fmt, data in payloads.items():
+            path = out_dir / f"{name}.{fmt}"
+            path.write_bytes(data)
+            paths.append(path)
+        decode_ms = _node_decode_ms(paths, args.repeat) or {}
+        base = len(payloads["json-indent"])
+        for (fmt, data), enc, path in zip(payloads.items(), encode_ms, paths):
+            dec = decode_ms.get(str(path))
+            print(f"{name:<20}{fmt:<14}{len(data):>12,}{len(data) / base:>8.0%}{enc:>10.1f}ms"
+                  + (f"{dec:>12.1f}ms" if dec is not None else f"{'-':>14}"))
+    shutil.rmtree(out_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+run.py — 변환 파이프라인 벤치마크 실행 / 기준값 비교
+
+    python -m benchmarks.run                         # 전체 (느림)
+    python -m benchmarks.run --sizes 10,1000 --templates 01,07
+    python -m benchmarks.run --save-baseline         # 현재 결과를 기준값으로 저장
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.2
+
+측정 항목 (시나리오마다)
+    parse_md          구조화 마크다운 파싱
+    parse_docx        .docx 파싱 (이미지 추출 포함)
+    build_json        ParsedDocument → JSON 파일
+    engine/tXX        node generate.js 단독 (JSON 파일 입력)
+    convert/tXX       convert() 전체 (캐시 미사용)
+
+각 항목은 repeat 회 실행 후 최소값(ms)으로 비교한다.
+기준값보다 tolerance 비율 이상 그리고 min-delta ms 이상 느려지면
+회귀로 보고하고 종료 코드 1 을 반환한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from bridge.converter import _ENGINE_PATH, _TEMP_ROOT, _find_node, convert
+from bridge.json_builder import build_json
+from parser.docx_parser import parse as parse_docx
+from parser.image_extractor import cleanup_session
+from parser.md_parser import parse_md
+
+from .synth import make_docx, make_markdown
+
+
+_BENCH_ROOT       = _TEMP_ROOT / "bench"
+_DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+_DEFAULT_SIZES    = (10, 1_000, 10_000, 50_000)
+
+# (이름, 이미지, 표)
+_VARIANTS = {
+    "plain": (False, False),
+    "rich":  (True, True),
+}
+
+
+# ─────────────────────────────────────────────
+# 측정
+# ─────────────────────────────────────────────
+
+def _measure(fn: Callable[[], object], repeat: int, after: Callable[[object], None] | None = None) -> dict:
+    """fn 을 repeat 회 실행 — {"ms": 최소, "median_ms", "runs"}"""
+    runs: list[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        value = fn()
+        runs.append((time.perf_counter() - t0) * 1000)
+        if after:
+            after(value)
+    return {
+        "ms": round(min(runs), 3),
+        "median_ms": round(statistics.median(runs), 3),
+        "runs": [round(r, 3) for r in runs],
+    }
+
+
+def all_template_ids() -> list[str]:
+    """generate.js 레지스트리에 있는 템플릿 ID"""
+    import re
+    src = _ENGINE_PATH.read_text(encoding="utf-8")
+    return sorted(set(re.findall(r'^\s*"(\d{2})":\s*"\./templates/', src, re.MULTILINE)))
+
+
+def _run_node(json_path: Path, out_path: Path, template_id: str) -> None:
+    proc = subprocess.run(
+        [_find_node(), str(_ENGINE_PATH), str(json_path), str(out_path), "--template", template_id],
+        capture_output=True, text=True, cwd=str(_ENGINE_PATH.parent), timeout=600,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"engine t{template_id} 실패:\n{proc.stderr.strip()}")
+
+
+def _check_convert(result) -> None:
+    if not result.success:
+        raise RuntimeError(f"convert 실패: {result.error}")
+
+
+def bench_scenario(
+    size: int,
+    variant: str,
+    template_ids: list[str],
+    inputs: list[str],
+    repeat: int,
+    engine: str,
+    progress: Callable[[str], None] = print,
+) -> dict[str, dict]:
+    """시나리오 하나 — {"md-1000-rich/parse_md": {...}, ...}"""
+    images, tables = _VARIANTS[variant]
+    data_dir = _BENCH_ROOT / "data"
+    out_dir  = _BENCH_ROOT / "out"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results: dict[str, dict] = {}
+
+    if "md" in inputs:
+        md_path = make_markdown(data_dir, size, images, tables)
+        name = f"md-{size}-{variant}"
+
+        progress(f"{name}: parse_md")
+        results[f"{name}/parse_md"] = _measure(lambda: parse_md(str(md_path)), repeat)
+        parsed = parse_md(str(md_path))
+
+        json_path = out_dir / f"{name}.json"
+        progress(f"{name}: build_json")
+        results[f"{name}/build_json"] = _measure(
+            lambda: build_json(parsed, output_path=str(json_path)), repeat
+        )
+
+        for tid in template_ids:
+            progress(f"{name}: engine t{tid}")
+            results[f"{name}/engine/t{tid}"] = _measure(
+                lambda: _run_node(json_path, out_dir / f"{name}_engine_t{tid}.docx", tid), repeat
+            )
+            progress(f"{name}: convert t{tid}")
+            results[f"{name}/convert/t{tid}"] = _measure(
+                lambda: convert(str(md_path), str(out_dir / f"{name}_t{tid}.docx"), tid,
+                                engine=engine, use_cache=False),
+                repeat, after=_check_convert,
+            )
+
+    if "docx" in inputs:
+        docx_path = make_docx(data_dir, size, images, tables)
+        name = f"docx-{size}-{variant}"
+
+        progress(f"{name}: parse_docx")
+        results[f"{name}/parse_docx"] = _measure(
+            lambda: parse_docx(str(docx_path), temp_root=str(_BENCH_ROOT / "images")),
+            repeat, after=lambda doc: cleanup_session(doc.image_base_dir),
+        )
+        for tid in template_ids:
+            progress(f"{name}: convert t{tid}")
+            results[f"{name}/convert/t{tid}"] = _measure(
+                lambda: convert(str(docx_path), str(out_dir / f"{name}_t{tid}.docx"), tid,
+                                engine=engine, use_cache=False),
+                repeat, after=_check_convert,
+            )
+
+    return results
+
+
+def _machine() -> dict:
+    node = _find_node()
+    node_version = ""
+    if node:
+        node_version = subprocess.run([node, "--version"], capture_output=True, text=True).stdout.strip()
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "node": node_version,
+        "cpu_count": os.cpu_count(),
+    }
+
+
+# ─────────────────────────────────────────────
+# 기준값 비교
+# ─────────────────────────────────────────────
+
+def compare(
+    current: dict[str, dict],
+    baseline: dict[str, dict],
+    tolerance: float = 0.20,
+    min_delta_ms: float = 5.0,
+) -> tuple[list[dict], list[dict]]:
+    """
+    Returns
+    -------
+    (회귀 목록, 개선 목록) — 각 항목 {"key", "baseline_ms", "current_ms", "ratio"}
+    """
+    regressions, improvements = [], []
+    for key, cur in current.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        b, c = base["ms"], cur["ms"]
+        row = {"key": key, "baseline_ms": b, "current_ms": c, "ratio": round(c / b, 3) if b else None}
+        if c > b * (1 + tolerance) and c - b >= min_delta_ms:
+            regressions.append(row)
+        elif c < b * (1 - tolerance) and b - c >= min_delta_ms:
+            improvements.append(row)
+    return regressions, improvements
+
+
+def _print_table(rows: list[dict], title: str) -> None:
+    if not rows:
+        return
+    print(f"\n{title}")
+    width = max(len(r["key"]) for r in rows)
+    for r in sorted(rows, key=lambda r: -(r["ratio"] or 0)):
+        print(f"  {r['key']:<{width}}  {r['baseline_ms']:>10.1f}ms → {r['current_ms']:>10.1f}ms  (×{r['ratio']})")
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def _build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="python -m benchmarks.run", description="DocStyle Pro 변환 벤치마크")
+    ap.add_argument("--sizes", default=",".join(map(str, _DEFAULT_SIZES)), help="요소 수 목록 (기본 10,1000,10000,50000)")
+    ap.add_argument("--variants", default="plain,rich", help="plain(본문만) / rich(이미지+표)")
+    ap.add_argument("--inputs", default="md,docx", help="입력 형식 md,docx")
+    ap.add_argument("--templates", default="all", help="템플릿 ID 목록 또는 all")
+    ap.add_argument("--repeat", type=int, default=3, help="항목당 반복 횟수 (최소값 사용)")
+    ap.add_argument("--engine", default="subprocess", choices=("subprocess", "pool"), help="convert 엔진 모드")
+    ap.add_argument("--baseline", default=str(_DEFAULT_BASELINE), help="기준값 JSON")
+    ap.add_argument("--save-baseline", action="store_true", help="결과를 기준값으로 저장 (비교 안 함)")
+    ap.add_argument("--tolerance", type=float, default=0.20, help="허용 감속 비율 (기본 0.20 = 20%%)")
+    ap.add_argument("--min-delta", type=float, default=5.0, help="이보다 작은 ms 차이는 무시 (기본 5)")
+    ap.add_argument("--output", default="", help="결과 JSON 저장 경로 (기본 temp/bench/results.json)")
+    ap.add_argument("--keep", action="store_true", help="생성한 원고·결과 문서 유지")
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if not _find_node():
+        print("Node.js 를 찾을 수 없습니다.", file=sys.stderr)
+        return 2
+
+    sizes     = [int(s) for s in args.sizes.split(",") if s.strip()]
+    variants  = [v.strip() for v in args.variants.split(",") if v.strip()]
+    inputs    = [i.strip() for i in args.inputs.split(",") if i.strip()]
+    templates = (
+        all_template_ids() if args.templates == "all"
+        else [t.strip().zfill(2) for t in args.templates.split(",") if t.strip()]
+    )
+    unknown = [v for v in variants if v not in _VARIANTS]
+    if unknown:
+        _build_parser().error(f"알 수 없는 variant: {', '.join(unknown)}")
+
+    results: dict[str, dict] = {}
+    t0 = time.perf_counter()
+    try:
+        for size in sizes:
+            for variant in variants:
+                results.update(bench_scenario(
+                    size, variant, templates, inputs, args.repeat, args.engine,
+                    progress=lambda msg: print(f"  · {msg}", flush=True),
+                ))
+    finally:
+        if not args.keep:
+            shutil.rmtree(_BENCH_ROOT / "out", ignore_errors=True)
+            shutil.rmtree(_BENCH_ROOT / "images", ignore_errors=True)
+
+    report = {
+        "machine": _machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "settings": {"repeat": args.repeat, "engine": args.engine},
+        "results": results,
+    }
+    out_path = Path(args.output) if args.output else _BENCH_ROOT / "results.json"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n측정 {len(results)}개 — {time.perf_counter() - t0:.1f}s, 결과: {out_path}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        merged = {}
+        if baseline_path.exists():
+            merged = json.loads(baseline_path.read_text(encoding="utf-8")).get("results", {})
+        merged.update(results)
+        baseline_path.write_text(
+            json.dumps({**report, "results": merged}, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        print(f"기준값 저장: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"기준값이 없습니다 ({baseline_path}) — --save-baseline 으로 먼저 저장하세요.")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline.get("machine", {}).get("platform") != report["machine"]["platform"]:
+        print("⚠️  기준값과 실행 환경이 다릅니다 — 결과 비교가 부정확할 수 있습니다.")
+
+    regressions, improvements = compare(
+        results, baseline.get("results", {}), args.tolerance, args.min_delta
+    )
+    _print_table(improvements, f"✅ 개선 {len(improvements)}건")
+    if regressions:
+        _print_table(regressions, f"❌ 성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+        return 1
+    print("\n회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+synth.py — 벤치마크용 합성 원고 생성
+
+같은 (크기, 이미지, 표, seed) 면 항상 같은 바이트의 원고를 만든다.
+요소 구성은 실제 원고 비율을 흉내 낸다 — 대부분 body, 사이사이 헤딩 /
+박스 / Q&A / 불릿, 옵션에 따라 이미지와 표.
+
+    md_path   = make_markdown(out_dir, 1000, images=True, tables=True)
+    docx_path = make_docx(out_dir, 1000, images=True, tables=True)
+
+이미지는 Pillow 없이 직접 만든 작은 PNG (단색, 크기만 다름).
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+import zlib
+from pathlib import Path
+
+
+# ─────────────────────────────────────────────
+# 요소 시퀀스
+# ─────────────────────────────────────────────
+
+_WORDS = (
+    "문서 서식 템플릿 원고 챕터 독자 편집 구조 레이아웃 표지 목차 인용 "
+    "데이터 분석 결과 요약 사례 절차 기준 검토 단계 설계 적용 품질 개선"
+).split()
+
+# (종류, 가중치) — body 가 대부분
+_MIX_BASE = [
+    ("body", 60), ("h2", 6), ("h3", 6), ("bullets", 8),
+    ("insight", 3), ("tip", 3), ("warning", 2), ("quote", 3),
+    ("qa", 3), ("prompt", 2), ("conclusion", 1), ("hr", 1), ("empty", 2),
+]
+_MIX_IMAGES = [("image", 4)]
+_MIX_TABLES = [("table2", 2), ("table3", 2)]
+
+_H1_EVERY = 50   # 요소 50개마다 h1 하나
+
+# 생성 규칙이 바뀌면 올린다 — 파일명에 들어가 이전에 만든 원고를 재사용하지 않게
+_SYNTH_VERSION = 1
+
+
+def _sentence(rng: random.Random, lo: int = 8, hi: int = 24) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(lo, hi))) + "."
+
+
+def element_plan(n: int, images: bool = False, tables: bool = False, seed: int = 0) -> list[dict]:
+    """
+    원고 요소 n 개의 계획 (md / docx 공용).
+    [{"kind": "body", "text": ...}, {"kind": "image", "name": "img_0003.png", ...}, ...]
+    """
+    rng = random.Random(seed)
+    mix = _MIX_BASE + (_MIX_IMAGES if images else []) + (_MIX_TABLES if tables else [])
+    kinds, weights = zip(*mix)
+
+    plan: list[dict] = [{"kind": "chapter_title"}]
+    img_no = 0
+    while len(plan) < n:
+        if len(plan) % _H1_EVERY == 1:
+            plan.append({"kind": "h1", "num": str(len(plan) // _H1_EVERY + 1), "text": _sentence(rng, 2, 5)})
+            continue
+        kind = rng.choices(kinds, weights)[0]
+        el: dict = {"kind": kind}
+        if kind in ("body", "insight", "tip", "warning", "quote"):
+            el["text"] = " ".join(_sentence(rng) for _ in range(rng.randint(1, 4)))
+        elif kind in ("h2", "h3"):
+            el["text"] = _sentence(rng, 2, 6)
+        elif kind == "bullets":
+            el["items"] = [_sentence(rng, 3, 10) for _ in range(rng.randint(2, 6))]
+        elif kind == "qa":
+            el["question"] = _sentence(rng, 4, 10)
+            el["answers"] = [_sentence(rng) for _ in range(rng.randint(1, 3))]
+        elif kind == "prompt":
+            el["label"] = _sentence(rng, 1, 3).rstrip(".")
+            el["text"] = _sentence(rng, 20, 40)
+        elif kind == "conclusion":
+            el["lines"] = [_sentence(rng) for _ in range(rng.randint(2, 4))]
+        elif kind == "image":
+            img_no += 1
+            el["name"] = f"img_{img_no:04d}.png"
+            el["size"] = (rng.randint(200, 1600), rng.randint(150, 1200))
+            el["caption"] = _sentence(rng, 2, 6)
+        elif kind in ("table2", "table3"):
+            cols = 2 if kind == "table2" else 3
+            el["headers"] = [_sentence(rng, 1, 2).rstrip(".") for _ in range(cols)]
+            el["rows"] = [
+                [_sentence(rng, 1, 4).rstrip(".") for _ in range(cols)]
+                for _ in range(rng.randint(2, 8))
+            ]
+        plan.append(el)
+    return plan[:n]
+
+
+# ─────────────────────────────────────────────
+# PNG
+# ─────────────────────────────────────────────
+
+def write_png(path: Path, width: int, height: int, rgb: tuple[int, int, int] = (90, 120, 200)) -> None:
+    """단색 RGB PNG (IHDR / IDAT / IEND 만)"""
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    row = b"\x00" + bytes(rgb) * width
+    raw = zlib.compress(row * height, 9)
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", raw)
+        + chunk(b"IEND", b"")
+    )
+
+
+def _write_images(plan: list[dict], img_dir: Path) -> None:
+    img_dir.mkdir(parents=True, exist_ok=True)
+    for el in plan:
+        if el["kind"] == "image" and not (img_dir / el["name"]).exists():
+            write_png(img_dir / el["name"], *el["size"])
+
+
+def _stem(n: int, images: bool, tables: bool, seed: int) -> str:
+    return f"synth_v{_SYNTH_VERSION}_{n}{'_img' if images else ''}{'_tbl' if tables else ''}_s{seed}"
+
+
+# ─────────────────────────────────────────────
+# 구조화 마크다운
+# ─────────────────────────────────────────────
+
+# 태그 블록은 다음 태그/헤딩까지 이어지므로, 그 뒤 본문은 [body] 로 다시 연다
+_TAGGED = {
+    "chapter_title", "insight", "tip", "warning", "quote", "qa", "prompt",
+    "conclusion", "image", "table2", "table3", "hr", "empty",
+}
+
+
+def render_markdown(plan: list[dict]) -> str:
+    out = [
+        "---",
+        "title:   합성 벤치마크 원고",
+        "author:  DocStyle Pro",
+        'chapter: "[Phase 1]"',
+        "sub:     성능 측정용",
+        "---",
+        "",
+    ]
+    prev = ""
+    for el in plan:
+        k = el["kind"]
+        if k in ("body", "bullets") and prev in _TAGGED:
+            out.append("[body]")
+        prev = k
+        if k == "chapter_title":
+            out += ["[chapter_title]", ""]
+        elif k == "h1":
+            out += [f"# {el['num']}. {el['text']}", ""]
+        elif k == "h2":
+            out += [f"## {el['text']}", ""]
+        elif k == "h3":
+            out += [f"### {el['text']}", ""]
+        elif k == "body":
+            out += [el["text"], ""]
+        elif k == "bullets":
+            out += [f"- {item}" for item in el["items"]] + [""]
+        elif k in ("insight", "tip", "warning", "quote"):
+            out += [f"[{k}]", el["text"], ""]
+        elif k == "qa":
+            out += ["[qa]", f"Q: {el['question']}"] + [f"A: {a}" for a in el["answers"]] + [""]
+        elif k == "prompt":
+            out += [f"[prompt | {el['label']}]", el["text"], ""]
+        elif k == "conclusion":
+            out += ["[conclusion]"] + el["lines"] + [""]
+        elif k == "image":
+            out += [f"[image | {el['caption']}]", el["name"], ""]
+        elif k in ("table2", "table3"):
+            out += [f"[{k} | " + " | ".join(el["headers"]) + "]"]
+            out += [" | ".join(r) for r in el["rows"]] + [""]
+        elif k == "hr":
+            out += ["[hr]", ""]
+        elif k == "empty":
+            out += ["[empty]", ""]
+    return "\n".join(out)
+
+
+def make_markdown(
+    out_dir: str | Path,
+    n: int,
+    images: bool = False,
+    tables: bool = False,
+    seed: int = 0,
+) -> Path:
+    """합성 .md (+ 같은 폴더에 이미지) 를 만들고 경로를 반환. 이미 있으면 재사용."""
+    out_dir = Path(out_dir)
+    path = out_dir / f"{_stem(n, images, tables, seed)}.md"
+    if path.exists():
+        return path
+    out_dir.mkdir(parents=True, exist_ok=True)
+    plan = element_plan(n, images, tables, seed)
+    _write_images(plan, out_dir)
+    tmp = path.with_suffix(".md.tmp")
+    tmp.write_text(render_markdown(plan), encoding="utf-8")
+    tmp.replace(path)
+    return path
+
+
+# ─────────────────────────────────────────────
+# .docx (DS-* 스타일)
+# ─────────────────────────────────────────────
+
+_DS_STYLES = (
+    "DS-ChapterTitle", "DS-Insight", "DS-Tip", "DS-Warning", "DS-Quote",
+    "DS-QA-Question", "DS-QA-Answer", "DS-Prompt", "DS-Conclusion", "DS-Caption",
+)
+
+
+def make_docx(
+    out_dir: str | Path,
+    n: int,
+    images: bool = False,
+    tables: bool = False,
+    seed: int = 0,
+) -> Path:
+    """
+    합성 .docx 를 만들고 경로를 반환. 이미 있으면 재사용.
+    DS-* 스타일을 써서 parse() 가 md 와 같은 요소 구성을 복원하게 한다.
+    """
+    import docx
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import Emu
+
+    out_dir = Path(out_dir)
+    path = out_dir / f"{_stem(n, images, tables, seed)}.docx"
+    if path.exists():
+        return path
+    out_dir.mkdir(parents=True, exist_ok=True)
+    plan = element_plan(n, images, tables, seed)
+    img_dir = out_dir / "docx_images"
+    _write_images(plan, img_dir)
+
+    doc = docx.Document()
+    doc.core_properties.title = "합성 벤치마크 원고"
+    doc.core_properties.author = "DocStyle Pro"
+    for name in _DS_STYLES:
+        doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+
+    for el in plan:
+        k = el["kind"]
+        if k == "chapter_title":
+            doc.add_paragraph("합성 벤치마크 원고 | [Phase 1] | 성능 측정용", style="DS-ChapterTitle")
+        elif k == "h1":
+            doc.add_heading(f"{el['num']}. {el['text']}", level=1)
+        elif k in ("h2", "h3"):
+            doc.add_heading(el["text"], level=int(k[1]))
+        elif k == "body":
+            doc.add_paragraph(el["text"])
+        elif k == "bullets":
+            for item in el["items"]:
+                doc.add_paragraph(item, style="List Bullet")
+        elif k in ("insight", "tip", "warning", "quote"):
+            doc.add_paragraph(el["text"], style=f"DS-{k.capitalize()}")
+        elif k == "qa":
+            doc.add_paragraph(el["question"], style="DS-QA-Question")
+            for a in el["answers"]:
+                doc.add_paragraph(a, style="DS-QA-Answer")
+        elif k == "prompt":
+            doc.add_paragraph(f"{el['label']}: {el['text']}", style="DS-Prompt")
+        elif k == "conclusion":
+            for line in el["lines"]:
+                doc.add_paragraph(line, style="DS-Conclusion")
+        elif k == "image":
+            w, h = el["size"]
+            doc.add_picture(str(img_dir / el["name"]), width=Emu(w * 9525), height=Emu(h * 9525))
+            doc.add_paragraph(el["caption"], style="DS-Caption")
+        elif k in ("table2", "table3"):
+            rows = [el["headers"]] + el["rows"]
+            tbl = doc.add_table(rows=len(rows), cols=len(el["headers"]))
+            for r, values in enumerate(rows):
+                for c, v in enumerate(values):
+                    tbl.cell(r, c).text = v
+        elif k == "hr":
+            doc.add_paragraph("")   # docx 경로에는 hr 입력 수단이 없어 빈 단락
+        elif k == "empty":
+            doc.add_paragraph("")
+
+    tmp = path.with_suffix(".docx.tmp")
+    doc.save(str(tmp))
+    tmp.replace(path)
+    return path
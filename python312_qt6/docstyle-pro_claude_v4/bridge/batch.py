@@ -0,0 +1,382 @@
+"""
+batch.py — 디렉터리 / 매니페스트 단위 병렬 일괄 변환
+
+    python -m bridge.batch manuscripts/ -o out/ -t 01 -j 8
+    python -m bridge.batch --manifest chapters.txt -o out/ -t 01,07
+
+- 입력: 디렉터리(하위 폴더 포함 .md / .docx) 또는 매니페스트
+  매니페스트는 한 줄에 경로 하나인 텍스트, 또는 JSON 배열
+  (문자열 또는 {"input": ..., "template": ...} 객체)
+- 프로세스 풀: 워커 프로세스마다 Node 엔진 워커 1개를 미리 띄워두고
+  파일 사이에 재사용한다 (convert(engine="pool"))
+- 저널: 결과를 한 줄씩 JSONL 로 기록 — 중단 후 다시 실행하면
+  입력 mtime/크기가 같고 결과 파일이 남아있는 항목은 건너뛴다
+- 리포트: 파일별 소요 시간·입출력 크기를 JSON 으로 저장
+
+출력 경로는 입력 디렉터리 구조를 그대로 따른다.
+    {output_dir}/{상대 경로}/{stem}_t{template}.docx
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+
+_INPUT_SUFFIXES  = (".md", ".docx")
+_JOURNAL_NAME    = ".docstyle-batch.journal.jsonl"
+_REPORT_NAME     = "batch_report.json"
+
+
+# ─────────────────────────────────────────────
+# 작업 목록
+# ─────────────────────────────────────────────
+
+def _walk(root: Path) -> list[Path]:
+    files = []
+    for p in sorted(root.rglob("*")):
+        if p.suffix.lower() not in _INPUT_SUFFIXES or not p.is_file():
+            continue
+        if p.name.startswith(("~$", ".")):   # Word 잠금 파일 / 숨김 파일
+            continue
+        files.append(p)
+    return files
+
+
+def _read_manifest(path: Path) -> list[tuple[Path, str | None]]:
+    """매니페스트 → [(입력 경로, 템플릿 또는 None)] — 상대 경로는 매니페스트 기준"""
+    base = path.parent
+    text = path.read_text(encoding="utf-8")
+    items: list[tuple[Path, str | None]] = []
+
+    if path.suffix.lower() == ".json":
+        for entry in json.loads(text):
+            if isinstance(entry, str):
+                items.append((base / entry, None))
+            else:
+                items.append((base / entry["input"], entry.get("template")))
+        return items
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            items.append((base / line, None))
+    return items
+
+
+def collect_jobs(
+    sources: list[str],
+    manifest: str = "",
+    output_dir: str = "out",
+    template_ids: list[str] | None = None,
+) -> list[dict]:
+    """
+    변환 작업 목록을 만든다.
+
+    Returns
+    -------
+    [{"input", "output", "template"}, ...]  (입력 경로는 절대 경로)
+    """
+    template_ids = template_ids or ["01"]
+    out_root = Path(output_dir)
+    pairs: list[tuple[Path, Path, str | None]] = []   # (입력, 출력 하위 디렉터리, 템플릿)
+
+    for src in sources:
+        p = Path(src)
+        if p.is_dir():
+            for f in _walk(p):
+                pairs.append((f, f.parent.relative_to(p), None))
+        else:
+            pairs.append((p, Path(), None))
+
+    if manifest:
+        for f, tid in _read_manifest(Path(manifest)):
+            pairs.append((f, Path(), tid))
+
+    jobs: list[dict] = []
+    for f, rel, tid in pairs:
+        for t in ([tid] if tid else template_ids):
+            jobs.append({
+                "input": str(f.resolve()),
+                "output": str((out_root / rel / f"{f.stem}_t{t}.docx").resolve()),
+                "template": t,
+            })
+    return jobs
+
+
+# ─────────────────────────────────────────────
+# 저널 (재시작 지원)
+# ─────────────────────────────────────────────
+
+def _stat_stamp(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_journal(path: Path) -> dict[tuple[str, str], dict]:
+    """(입력, 템플릿) → 마지막 기록. 중단 시 잘린 마지막 줄은 무시."""
+    done: dict[tuple[str, str], dict] = {}
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return done
+    for line in lines:
+        try:
+            rec = json.loads(line)
+        except ValueError:
+            continue
+        done[(rec["input"], rec["template"])] = rec
+    return done
+
+
+def _already_done(job: dict, journal: dict[tuple[str, str], dict]) -> bool:
+    rec = journal.get((job["input"], job["template"]))
+    if not rec or rec.get("status") != "ok" or rec.get("output") != job["output"]:
+        return False
+    stamp = _stat_stamp(job["input"])
+    return (
+        stamp is not None
+        and [rec.get("input_mtime_ns"), rec.get("input_bytes")] == list(stamp)
+        and os.path.exists(job["output"])
+    )
+
+
+class _Journal:
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(path, "a", encoding="utf-8")
+
+    def write(self, rec: dict) -> None:
+        self._f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        self._f.close()
+
+
+# ─────────────────────────────────────────────
+# 워커 프로세스
+# ─────────────────────────────────────────────
+
+_worker_settings: dict | None = None
+_worker_use_cache = True
+
+
+def _init_worker(custom_settings: dict | None, use_cache: bool) -> None:
+    """
+    워커 프로세스 시작 시 Node 엔진 워커 1개를 미리 띄운다.
+
+    풀 워커 프로세스는 종료할 때 atexit 를 실행하지 않으므로, 파싱 캐시가
+    가진 .docx 이미지 세션 디렉터리는 multiprocessing 종료 처리로 정리한다.
+    """
+    global _worker_settings, _worker_use_cache
+    _worker_settings  = custom_settings
+    _worker_use_cache = use_cache
+
+    from multiprocessing.util import Finalize
+    from parser.parse_cache import get_parse_cache
+    Finalize(None, get_parse_cache().clear, exitpriority=10)
+
+    from .engine_pool import get_pool
+    try:
+        get_pool(size=1).warm()
+    except RuntimeError:
+        pass   # node 가 없으면 첫 변환에서 오류로 보고됨
+
+
+def _run_job(job: dict) -> dict:
+    from .converter import convert
+
+    stamp = _stat_stamp(job["input"])
+    cpu0  = time.process_time()
+    t0    = time.perf_counter()
+    result = convert(
+        job["input"],
+        job["output"],
+        template_id=job["template"],
+        custom_settings=_worker_settings,
+        engine="pool",
+        use_cache=_worker_use_cache,
+    )
+    seconds = time.perf_counter() - t0
+
+    rec = {
+        **job,
+        "status": "ok" if result.success else "error",
+        "seconds": round(seconds, 4),
+        "cpu_seconds": round(time.process_time() - cpu0, 4),
+        "input_mtime_ns": stamp[0] if stamp else None,
+        "input_bytes": stamp[1] if stamp else None,
+        "output_bytes": None,
+        "elements": result.element_count,
+        "images": result.image_count,
+        "cache_hit": result.cache_hit,
+        "worker_pid": os.getpid(),
+        "timings": result.timings,
+    }
+    if result.success:
+        rec["output_bytes"] = (_stat_stamp(job["output"]) or (None, None))[1]
+    else:
+        rec["error"] = result.error
+    return rec
+
+
+# ─────────────────────────────────────────────
+# 일괄 실행
+# ─────────────────────────────────────────────
+
+def run_batch(
+    jobs: list[dict],
+    workers: int | None = None,
+    journal_path: str | Path = "",
+    custom_settings: dict | None = None,
+    use_cache: bool = True,
+    resume: bool = True,
+    progress=None,
+) -> dict:
+    """
+    작업 목록을 프로세스 풀로 변환하고 리포트 dict 를 반환한다.
+
+    progress : fn(done: int, total: int, rec: dict) — 항목 하나가 끝날 때마다 호출
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    journal = load_journal(Path(journal_path)) if (journal_path and resume) else {}
+
+    skipped: list[dict] = []
+    pending: list[dict] = []
+    for j in jobs:
+        (skipped if _already_done(j, journal) else pending).append(j)
+
+    records: list[dict] = [
+        {**journal[(j["input"], j["template"])], "status": "skipped"} for j in skipped
+    ]
+    writer = _Journal(Path(journal_path)) if journal_path else None
+
+    started = time.time()
+    t0 = time.perf_counter()
+    try:
+        if pending:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(pending)),
+                initializer=_init_worker,
+                initargs=(custom_settings, use_cache),
+            ) as ex:
+                futures = {ex.submit(_run_job, j): j for j in pending}
+                for fut in as_completed(futures):
+                    try:
+                        rec = fut.result()
+                    except Exception as e:   # 워커 프로세스 자체가 죽은 경우
+                        rec = {**futures[fut], "status": "error", "error": repr(e)}
+                    records.append(rec)
+                    if writer:
+                        writer.write(rec)
+                    if progress:
+                        progress(len(records), len(jobs), rec)
+    finally:
+        if writer:
+            writer.close()
+
+    wall = time.perf_counter() - t0
+    ok     = sum(1 for r in records if r["status"] == "ok")
+    failed = sum(1 for r in records if r["status"] == "error")
+    busy   = sum(r.get("seconds") or 0 for r in records if r["status"] != "skipped")
+
+    order = {(j["input"], j["template"]): i for i, j in enumerate(jobs)}
+    records.sort(key=lambda r: order.get((r["input"], r["template"]), 0))
+
+    return {
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(started)),
+        "wall_seconds": round(wall, 3),
+        "workers": workers,
+        "summary": {
+            "total": len(jobs),
+            "ok": ok,
+            "failed": failed,
+            "skipped": len(skipped),
+            "busy_seconds": round(busy, 3),
+            "files_per_second": round((ok + failed) / wall, 3) if wall > 0 else 0,
+        },
+        "files": records,
+    }
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def _build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(
+        prog="python -m bridge.batch",
+        description="디렉터리 또는 매니페스트의 .md / .docx 를 병렬로 일괄 변환",
+    )
+    ap.add_argument("sources", nargs="*", help="입력 디렉터리 또는 파일")
+    ap.add_argument("-m", "--manifest", default="", help="매니페스트 (.txt 한 줄 한 경로 / .json 배열)")
+    ap.add_argument("-o", "--output-dir", default="out", help="출력 디렉터리 (기본 ./out)")
+    ap.add_argument("-t", "--templates", default="01", help="템플릿 ID, 쉼표로 여러 개 (기본 01)")
+    ap.add_argument("-j", "--jobs", type=int, default=0, help="워커 프로세스 수 (기본 CPU 코어 수)")
+    ap.add_argument("--settings", default="", help="custom_settings JSON 파일")
+    ap.add_argument("--journal", default="", help=f"저널 경로 (기본 {{output_dir}}/{_JOURNAL_NAME})")
+    ap.add_argument("--report", default="", help=f"리포트 경로 (기본 {{output_dir}}/{_REPORT_NAME})")
+    ap.add_argument("--no-resume", action="store_true", help="저널을 무시하고 전부 다시 변환")
+    ap.add_argument("--no-cache", action="store_true", help="변환/파싱 캐시 사용 안 함")
+    ap.add_argument("-q", "--quiet", action="store_true", help="진행 상황 출력 안 함")
+    return ap
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if not args.sources and not args.manifest:
+        _build_parser().error("입력 디렉터리/파일 또는 --manifest 가 필요합니다")
+
+    out_dir = Path(args.output_dir)
+    template_ids = [t.strip().zfill(2) for t in args.templates.split(",") if t.strip()]
+    custom_settings = (
+        json.loads(Path(args.settings).read_text(encoding="utf-8")) if args.settings else None
+    )
+
+    jobs = collect_jobs(args.sources, args.manifest, str(out_dir), template_ids)
+    if not jobs:
+        print("변환할 파일이 없습니다.", file=sys.stderr)
+        return 1
+
+    def _progress(done: int, total: int, rec: dict) -> None:
+        if args.quiet:
+            return
+        mark = "✅" if rec["status"] == "ok" else "❌"
+        tail = f"{rec.get('seconds', 0):.2f}s" if rec["status"] == "ok" else rec.get("error", "")
+        print(f"  [{done}/{total}] {mark} {Path(rec['input']).name} (t{rec['template']}) {tail}")
+
+    report = run_batch(
+        jobs,
+        workers=args.jobs or None,
+        journal_path=args.journal or out_dir / _JOURNAL_NAME,
+        custom_settings=custom_settings,
+        use_cache=not args.no_cache,
+        resume=not args.no_resume,
+        progress=_progress,
+    )
+
+    report_path = Path(args.report) if args.report else out_dir / _REPORT_NAME
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    s = report["summary"]
+    print(
+        f"\n완료: 성공 {s['ok']} / 실패 {s['failed']} / 건너뜀 {s['skipped']} "
+        f"— {report['wall_seconds']:.1f}s, 워커 {report['workers']}개\n"
+        f"리포트: {report_path}"
+    )
+    return 1 if s["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+convert_cache.py — 변환 결과(.docx) 디스크 캐시
+
+같은 원고를 같은 템플릿·설정으로 다시 변환하면 파싱 / JSON 직렬화 /
+Node 엔진을 모두 건너뛰고 저장된 .docx 를 복사해 돌려준다.
+
+캐시 키 (SHA-256)
+    - 입력 파일 바이트
+    - 참조 이미지 바이트 (.md — [image] 블록 / .docx 는 입력 ZIP 에 포함)
+    - template_id, chapter_override
+    - 정규화된 custom_settings (키 정렬 JSON)
+    - 파이프라인 버전 (engine/*.js · 템플릿 · docx 패키지 lock · 파서/직렬화 소스)
+
+저장 구조
+    temp/cache/convert/{key}.docx   결과 문서
+    temp/cache/convert/{key}.json   요소/이미지 수 등 ConvertResult 복원용 메타
+
+용량이 max_bytes 를 넘으면 가장 오래 쓰지 않은(mtime) 항목부터 지운다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+from parser.disk_lru import env_mb, evict_lru
+
+
+# ─────────────────────────────────────────────
+# 경로 / 기본값
+# ─────────────────────────────────────────────
+
+_ROOT       = Path(__file__).resolve().parent.parent
+_CACHE_DIR  = _ROOT / "temp" / "cache" / "convert"
+_ENGINE_DIR = _ROOT / "engine"
+
+_DEFAULT_MAX_BYTES = env_mb("DOCSTYLE_CACHE_MAX_MB", 512)
+
+# 키 형식이 바뀌면 올린다 — 이전 항목은 자연스럽게 무효화
+_KEY_SCHEMA = "1"
+
+_CHUNK = 1024 * 1024
+
+
+def _hash_file(h, path: Path) -> None:
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            h.update(chunk)
+
+
+# ─────────────────────────────────────────────
+# 파이프라인 버전
+# ─────────────────────────────────────────────
+
+_version_lock  = threading.Lock()
+_version_cache: dict[tuple, str] = {}
+
+
+def _pipeline_sources(template_id: str) -> list[Path]:
+    """변환 결과에 영향을 주는 소스 파일 목록"""
+    files = [
+        _ENGINE_DIR / "generate.js",
+        _ENGINE_DIR / "worker.js",
+        _ENGINE_DIR / "package-lock.json",
+        _ROOT / "bridge" / "json_builder.py",
+        _ROOT / "bridge" / "msgpack_codec.py",
+        _ROOT / "bridge" / "image_optimizer.py",
+    ]
+    files += sorted((_ENGINE_DIR / "core").glob("*.js"))
+    files += sorted((_ROOT / "parser").glob("*.py"))
+    files += sorted((_ENGINE_DIR / "templates").glob(f"template_{template_id}_*.js"))
+    return [f for f in files if f.exists()]
+
+
+def pipeline_version(template_id: str) -> str:
+    """
+    엔진·템플릿·파서 소스의 해시.
+    (경로, mtime, 크기) 가 같으면 다시 읽지 않는다.
+    """
+    files = _pipeline_sources(template_id)
+    stamp = tuple((str(f), f.stat().st_mtime_ns, f.stat().st_size) for f in files)
+    with _version_lock:
+        cached = _version_cache.get(stamp)
+        if cached:
+            return cached
+    h = hashlib.sha256()
+    for f in files:
+        h.update(f.name.encode("utf-8"))
+        _hash_file(h, f)
+    version = h.hexdigest()
+    with _version_lock:
+        _version_cache[stamp] = version
+    return version
+
+
+# ─────────────────────────────────────────────
+# 캐시 본체
+# ─────────────────────────────────────────────
+
+class ConvertCache:
+    """
+    크기 제한이 있는 LRU .docx 캐시.
+
+    Parameters
+    ----------
+    root      : 캐시 디렉터리
+    max_bytes : 전체 .docx 용량 상한
+    """
+
+    def __init__(self, root: str | Path = _CACHE_DIR, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.root      = Path(root)
+        self.max_bytes = max_bytes
+        self.hits      = 0
+        self.misses    = 0
+        self._lock     = threading.Lock()
+
+    # ── 키 ───────────────────────────────────
+
+    def make_key(
+        self,
+        input_path: str,
+        template_id: str,
+        custom_settings: dict | None = None,
+        chapter_override: str = "",
+        image_paths: list[str] | None = None,
+    ) -> str:
+        h = hashlib.sha256()
+        h.update(f"schema:{_KEY_SCHEMA}\0".encode())
+        h.update(f"template:{template_id}\0chapter:{chapter_override}\0".encode("utf-8"))
+        h.update(json.dumps(
+            custom_settings or {}, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"))
+        h.update(f"\0version:{pipeline_version(template_id)}\0".encode())
+
+        h.update(b"input\0")
+        _hash_file(h, Path(input_path))
+
+        for img in image_paths or []:
+            p = Path(img)
+            h.update(f"\0image:{p.name}\0".encode("utf-8"))
+            if p.is_file():
+                _hash_file(h, p)
+            else:
+                h.update(b"<missing>")   # 없는 이미지 → placeholder 로 렌더됨
+        return h.hexdigest()
+
+    # ── 조회 / 저장 ──────────────────────────
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.root / f"{key}.docx", self.root / f"{key}.json"
+
+    def get(self, key: str, output_path: str) -> dict | None:
+        """
+        적중하면 .docx 를 output_path 로 복사하고 저장된 메타 dict 를 반환.
+        없으면 None.
+        """
+        docx_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(docx_path, output_path)
+            os.utime(docx_path)   # LRU 갱신
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return meta
+
+    def put(self, key: str, output_path: str, meta: dict) -> None:
+        """변환 결과를 저장한다. 실패해도 변환 자체에는 영향이 없도록 조용히 무시."""
+        docx_path, meta_path = self._paths(key)
+        tmp = self.root / f".{key}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, tmp)
+            os.replace(tmp, docx_path)
+            meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            evict_lru(self.root.glob("*.docx"), self.max_bytes, remove=_remove_entry)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+def _remove_entry(docx: Path) -> None:
+    docx.unlink(missing_ok=True)
+    docx.with_suffix(".json").unlink(missing_ok=True)
+
+
+# ─────────────────────────────────────────────
+# 프로세스 전역 캐시
+# ─────────────────────────────────────────────
+
+_cache: ConvertCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ConvertCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ConvertCache()
+        return _cache
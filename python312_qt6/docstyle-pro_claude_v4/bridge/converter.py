@@ -4,19 +4,34 @@ converter.py — DocStyle Pro Python → Node.js 변환 브릿지
 입력 파일 종류에 따라 파서를 자동 분기한다.
     .md   → parser/md_parser.py   (방향 A — 구조화 마크다운, 권장)
     .docx → parser/docx_parser.py (방향 B — Word 파일, 서식 추론)
+    챕터 여러 개 → parser/book.py (convert_book)
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
 import subprocess
 import sys
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
-from parser.md_parser   import parse_md
+from parser.book        import BookManifest, parse_book
+from parser.md_parser   import list_image_refs, parse_md, parse_md_text, stream_md
 from parser.docx_parser import parse as parse_docx
+from parser.docx_parser import parse_bytes as parse_docx_bytes
 from parser.image_extractor import cleanup_session
-from .json_builder import build_json
+from parser.models import ImageElement, ImageResolver, ParsedDocument
+from parser.parse_cache import file_states, get_parse_cache
+from .convert_cache import get_cache
+from .image_optimizer import ImageOptions, optimize_images
+from .json_builder import build_json, build_payload, iter_json_chunks, write_json
+from .timings import StageTimer, log_timings
 
 
 # ─────────────────────────────────────────────
@@ -27,6 +42,9 @@ _THIS_DIR    = Path(__file__).resolve().parent
 _ENGINE_PATH = _THIS_DIR.parent / "engine" / "generate.js"
 _TEMP_ROOT   = _THIS_DIR.parent / "temp"
 
+# 엔진 stdin 전송 형식 — json | msgpack (keep_temp 의 입력 파일은 항상 읽기 쉬운 JSON)
+_ENGINE_FORMAT = os.getenv("DOCSTYLE_ENGINE_FORMAT", "json")
+
 
 # ─────────────────────────────────────────────
 # node_modules 자동 설치
@@ -82,7 +100,12 @@ class ConvertResult:
         element_count: int = 0,
         image_count: int = 0,
         template_id: str = "01",
-        input_type: str = "",     # "md" | "docx"
+        input_type: str = "",     # "md" | "docx" | "book"
+        cache_hit: bool = False,
+        cache_hits: int = 0,      # 프로세스 누적 캐시 적중 수
+        cache_misses: int = 0,    # 프로세스 누적 캐시 미적중 수
+        timings: dict | None = None,
+        data: bytes = b"",        # convert_bytes_async — .docx 바이트 (output_path 없음)
     ):
         self.success       = success
         self.output_path   = output_path
@@ -91,13 +114,19 @@ class ConvertResult:
         self.image_count   = image_count
         self.template_id   = template_id
         self.input_type    = input_type
+        self.cache_hit     = cache_hit
+        self.cache_hits    = cache_hits
+        self.cache_misses  = cache_misses
+        # 단계별 {"wall_ms", "cpu_ms", "peak_rss_kb"} — bridge/timings.py 참고
+        self.timings       = timings or {}
+        self.data          = data
 
     def __repr__(self) -> str:
         if self.success:
             return (
                 f"ConvertResult(success=True, output='{self.output_path}', "
                 f"elements={self.element_count}, images={self.image_count}, "
-                f"type={self.input_type})"
+                f"type={self.input_type}, cache={'hit' if self.cache_hit else 'miss'})"
             )
         return f"ConvertResult(success=False, error='{self.error}')"
 
@@ -114,6 +143,9 @@ def convert(
     custom_settings: dict = None,
     keep_temp: bool = False,
     progress_callback=None,
+    engine: str = "subprocess",
+    use_cache: bool = True,
+    stream: bool = False,
 ) -> ConvertResult:
     """
     .md 또는 .docx → 서식 적용 .docx 전체 파이프라인.
@@ -125,110 +157,1177 @@ def convert(
     template_id      : "01" ~ "10"
     chapter_override : 챕터명 직접 지정 (비어있으면 자동 추출)
     custom_settings  : 사용자 설정 (폰트, 크기, 간격 등) dict
-    keep_temp        : True 면 임시 파일 삭제하지 않음 (디버그용)
+                       "image_optimize" 가 있으면 직렬화 전에 이미지를 표시 폭·DPI 에
+                       맞게 줄인다 (bridge/image_optimizer.py — True 또는 {"dpi", "quality", "min_kb"})
+    keep_temp        : True 면 입력 JSON 을 temp/ 에 파일로 남김 (디버그용)
+                       False 면 임시 파일 없이 엔진 stdin(또는 워커 요청)으로 직접 전달
     progress_callback: GUI 진행 상황 콜백 fn(pct: int, msg: str)
+    engine           : "subprocess" — 변환마다 node generate.js 실행
+                       "pool"       — 상주 워커 풀(bridge/engine_pool.py) 사용
+    use_cache        : True 면 같은 입력·템플릿·설정의 이전 결과(bridge/convert_cache.py)와
+                       같은 파일의 파싱 결과(parser/parse_cache.py)를 재사용
+    stream           : True 면 .md 를 줄 단위로 읽으며 요소를 바로 엔진 stdin 으로 흘려보낸다
+                       (parser.md_parser.stream_md — 원고 크기와 관계없이 일정한 메모리).
+                       engine="subprocess" · keep_temp=False · .md 입력일 때만 적용되며,
+                       파싱 결과 캐시는 쓰지 않고 파싱 시간은 serialize 에 포함된다.
+
+    결과의 timings 에 단계별 wall / CPU 시간과 최대 RSS 가 담긴다.
     """
 
     def _progress(pct: int, msg: str = ""):
         if progress_callback:
             progress_callback(pct, msg)
 
+    timer = StageTimer()
+
+    def _done(result: ConvertResult) -> ConvertResult:
+        result.timings = timer.as_dict()
+        log_timings(
+            result.timings, input=str(input_path), template=template_id, engine=engine,
+            success=result.success, cache_hit=result.cache_hit,
+        )
+        return result
+
     temp_json_path = ""
-    image_base_dir = ""
+    image_base_dir = ""       # 변환이 끝나면 지울 추출 이미지 디렉터리 (docx)
     suffix         = Path(input_path).suffix.lower()
     input_type     = "md" if suffix == ".md" else "docx"
 
+    # ── 캐시 조회 — 적중하면 파싱·엔진을 모두 건너뜀
+    cache = get_cache() if use_cache else None
+    cache_key = ""
+    if cache is not None:
+        with timer.stage("cache_lookup"):
+            cache_key, meta = _lookup_cache(
+                cache, input_path, input_type, output_path,
+                template_id, custom_settings, chapter_override,
+            )
+        if meta is not None:
+            _progress(100, "변환 완료 (캐시)")
+            return _done(ConvertResult(
+                success=True,
+                output_path=str(Path(output_path).resolve()),
+                element_count=meta.get("element_count", 0),
+                image_count=meta.get("image_count", 0),
+                template_id=template_id,
+                input_type=input_type,
+                cache_hit=True,
+                cache_hits=cache.hits,
+                cache_misses=cache.misses,
+            ))
+
     # ── Step 0: node_modules 자동 설치
     try:
         _progress(5, "Node.js 모듈 확인 중...")
         _ensure_node_modules()
     except RuntimeError as e:
-        return ConvertResult(success=False, error=str(e), template_id=template_id)
+        return _done(ConvertResult(success=False, error=str(e), template_id=template_id))
 
     try:
         session_id = uuid.uuid4().hex[:8]
         _TEMP_ROOT.mkdir(parents=True, exist_ok=True)
 
-        # ── Step 1: 파싱
-        if input_type == "md":
-            _progress(10, "마크다운 파싱 중...")
-            parsed = parse_md(
-                md_path=input_path,
-                image_dir=str(Path(input_path).parent),
-            )
+        # ── Step 1: 파싱 (같은 파일이면 캐시된 결과 재사용)
+        _progress(10, "마크다운 파싱 중..." if input_type == "md" else "Word 문서 파싱 중...")
+        streaming = stream and input_type == "md" and engine == "subprocess" and not keep_temp
+        with timer.stage("parse"):
+            if streaming:
+                parsed, element_count = _stream_input(input_path)
+                parse_cached = False
+            else:
+                parsed, parse_cached = _parse_input(
+                    input_path, input_type, chapter_override, use_cache, stage=timer.stage
+                )
+        if input_type == "docx" and not parse_cached:
             image_base_dir = parsed.image_base_dir
+        if not streaming:
+            parsed = _optimize_images(parsed, custom_settings, timer)
+        if streaming:
+            _progress(40, "스트리밍 파싱 — 요소를 읽는 대로 엔진에 전달")
+        elif input_type == "md":
             _progress(40, f"파싱 완료 — 요소 {len(parsed.elements)}개")
-
         else:
-            _progress(10, "Word 문서 파싱 중...")
-            temp_img_dir = str(_TEMP_ROOT / "images")
-            parsed = parse_docx(
-                docx_path=input_path,
-                temp_root=temp_img_dir,
-                chapter_override=chapter_override,
-            )
-            image_base_dir = parsed.image_base_dir
             _progress(40, f"파싱 완료 — 요소 {len(parsed.elements)}개 / 이미지 {len(parsed.image_map)}개")
 
-        # ── Step 2: JSON 직렬화
+        # ── Step 2: JSON 직렬화 (keep_temp 일 때만 파일로 — 아니면 엔진에 직접 전달)
         _progress(50, "JSON 변환 중...")
-        temp_json_path = str(_TEMP_ROOT / f"input_{session_id}.json")
-        build_json(parsed, template_id=template_id, custom_settings=custom_settings, output_path=temp_json_path)
+        if keep_temp:
+            temp_json_path = str(_TEMP_ROOT / f"input_{session_id}.json")
+            with timer.stage("serialize"):
+                build_json(parsed, template_id=template_id, custom_settings=custom_settings, output_path=temp_json_path)
 
         # ── Step 3: Node.js 엔진 호출
         _progress(60, "레이아웃 적용 중...")
+        _run_engine(
+            output_path, template_id, engine,
+            json_path=temp_json_path, parsed=parsed, custom_settings=custom_settings,
+            timer=timer,
+        )
+
+        _progress(90, "임시 파일 생성 완료...")
+
+        # ── Step 5: 임시 파일 정리
+        if not keep_temp:
+            with timer.stage("cleanup"):
+                _cleanup_temp(temp_json_path, image_base_dir)
+
+        n_elements = element_count[0] if streaming else len(parsed.elements)
+        if cache_key:
+            cache.put(cache_key, output_path, {
+                "element_count": n_elements,
+                "image_count": len(parsed.image_map),
+            })
+
+        _progress(100, "변환 완료")
+
+        return _done(ConvertResult(
+            success=True,
+            output_path=str(Path(output_path).resolve()),
+            element_count=n_elements,
+            image_count=len(parsed.image_map),
+            template_id=template_id,
+            input_type=input_type,
+            cache_hits=cache.hits if cache else 0,
+            cache_misses=cache.misses if cache else 0,
+        ))
+
+    except Exception as e:
+        if not keep_temp:
+            with timer.stage("cleanup"):
+                _cleanup_temp(temp_json_path, image_base_dir)
+        return _done(ConvertResult(
+            success=False,
+            error=str(e),
+            template_id=template_id,
+            input_type=input_type,
+        ))
+
+
+def convert_many(
+    input_path: str,
+    template_ids: list[str],
+    output_dir: str,
+    chapter_override: str = "",
+    custom_settings: dict = None,
+    keep_temp: bool = False,
+    progress_callback=None,
+    engine: str = "subprocess",
+    use_cache: bool = True,
+) -> list[ConvertResult]:
+    """
+    원고 하나를 여러 템플릿으로 한 번에 변환한다. (후보 템플릿 비교용)
+
+    파싱·JSON 직렬화는 한 번만 하고, 캐시에 없는 템플릿만 모아
+    엔진 한 번(generate.js --templates)으로 빌드한다.
+    결과 파일은 {output_dir}/{입력파일명}_t{id}.docx
+
+    Returns
+    -------
+    template_ids 순서대로 ConvertResult 목록
+    (timings 는 한 번의 실행 전체 기준이라 모든 결과가 같은 값을 공유)
+    """
+
+    def _progress(pct: int, msg: str = ""):
+        if progress_callback:
+            progress_callback(pct, msg)
+
+    timer = StageTimer()
+
+    def _done() -> list[ConvertResult]:
+        timings = timer.as_dict()
+        for r in results.values():
+            r.timings = timings
+        log_timings(
+            timings, input=str(input_path), templates=list(template_ids), engine=engine,
+            success=all(r.success for r in results.values()),
+        )
+        return [results[tid] for tid in template_ids]
+
+    suffix     = Path(input_path).suffix.lower()
+    input_type = "md" if suffix == ".md" else "docx"
+    prefix     = Path(input_path).stem
+    out_dir    = Path(output_dir).resolve()
+    targets    = {tid: out_dir / f"{prefix}_t{tid}.docx" for tid in template_ids}
+
+    def _fail(tid: str, error: str) -> ConvertResult:
+        return ConvertResult(success=False, error=error, template_id=tid, input_type=input_type)
+
+    results: dict[str, ConvertResult] = {}
+    cache = get_cache() if use_cache else None
+    cache_keys: dict[str, str] = {}
+
+    # ── 캐시 조회
+    if cache is not None:
+        with timer.stage("cache_lookup"):
+            try:
+                image_refs = list_image_refs(input_path) if input_type == "md" else []
+                for tid in template_ids:
+                    key = cache.make_key(input_path, tid, custom_settings, chapter_override, image_refs)
+                    meta = cache.get(key, str(targets[tid]))
+                    if meta is None:
+                        cache_keys[tid] = key
+                        continue
+                    results[tid] = ConvertResult(
+                        success=True,
+                        output_path=str(targets[tid]),
+                        element_count=meta.get("element_count", 0),
+                        image_count=meta.get("image_count", 0),
+                        template_id=tid,
+                        input_type=input_type,
+                        cache_hit=True,
+                        cache_hits=cache.hits,
+                        cache_misses=cache.misses,
+                    )
+            except (OSError, UnicodeDecodeError):
+                cache_keys = {}
+
+    pending = [tid for tid in template_ids if tid not in results]
+    if not pending:
+        _progress(100, "변환 완료 (캐시)")
+        return _done()
+
+    try:
+        _progress(5, "Node.js 모듈 확인 중...")
+        _ensure_node_modules()
+    except RuntimeError as e:
+        for tid in pending:
+            results[tid] = _fail(tid, str(e))
+        return _done()
+
+    temp_json_path = ""
+    image_base_dir = ""
+    try:
+        session_id = uuid.uuid4().hex[:8]
+        _TEMP_ROOT.mkdir(parents=True, exist_ok=True)
+
+        # ── Step 1: 파싱 (한 번)
+        _progress(10, "마크다운 파싱 중..." if input_type == "md" else "Word 문서 파싱 중...")
+        with timer.stage("parse"):
+            parsed, parse_cached = _parse_input(
+                input_path, input_type, chapter_override, use_cache, stage=timer.stage
+            )
+        if input_type == "docx" and not parse_cached:
+            image_base_dir = parsed.image_base_dir
+        parsed = _optimize_images(parsed, custom_settings, timer)
+        _progress(40, f"파싱 완료 — 요소 {len(parsed.elements)}개")
+
+        # ── Step 2: JSON 직렬화 (한 번 — keep_temp 일 때만 파일로)
+        _progress(50, "JSON 변환 중...")
+        if keep_temp:
+            temp_json_path = str(_TEMP_ROOT / f"input_{session_id}.json")
+            with timer.stage("serialize"):
+                build_json(parsed, template_id=pending[0], custom_settings=custom_settings, output_path=temp_json_path)
+
+        # ── Step 3: 엔진 한 번 호출로 모든 템플릿 빌드
+        _progress(60, f"레이아웃 적용 중... ({len(pending)}개 템플릿)")
+        for tid in pending:
+            targets[tid].unlink(missing_ok=True)
+        errors = _run_engine_many(
+            str(out_dir), pending, prefix, engine,
+            json_path=temp_json_path, parsed=parsed, custom_settings=custom_settings,
+            timer=timer,
+        )
+
+        for tid in pending:
+            if errors.get(tid) or not targets[tid].exists():
+                results[tid] = _fail(tid, errors.get(tid) or "Node.js 엔진 오류: 출력 파일이 없습니다")
+                continue
+            if tid in cache_keys:
+                cache.put(cache_keys[tid], str(targets[tid]), {
+                    "element_count": len(parsed.elements),
+                    "image_count": len(parsed.image_map),
+                })
+            results[tid] = ConvertResult(
+                success=True,
+                output_path=str(targets[tid]),
+                element_count=len(parsed.elements),
+                image_count=len(parsed.image_map),
+                template_id=tid,
+                input_type=input_type,
+                cache_hits=cache.hits if cache else 0,
+                cache_misses=cache.misses if cache else 0,
+            )
+
+        _progress(100, "변환 완료")
+
+    except Exception as e:
+        for tid in pending:
+            results.setdefault(tid, _fail(tid, str(e)))
+
+    finally:
+        if not keep_temp:
+            with timer.stage("cleanup"):
+                _cleanup_temp(temp_json_path, image_base_dir)
+
+    return _done()
+
+
+# ─────────────────────────────────────────────
+# 책 변환 (챕터별 .md 여러 개)
+# ─────────────────────────────────────────────
+
+def convert_book(
+    manifest: BookManifest,
+    output_path: str,
+    template_id: str = "01",
+    custom_settings: dict = None,
+    progress_callback=None,
+    engine: str = "subprocess",
+    workers: int | None = None,
+) -> ConvertResult:
+    """
+    챕터별 .md 를 한 권의 .docx 로 변환한다.
+
+    파싱은 parser.book.parse_book — 바뀐 챕터만 다시 (병렬) 파싱하고 나머지는
+    챕터 캐시를 쓴다. 결과 .docx 는 변환 캐시(convert_cache)를 거치지 않는다.
+
+    Parameters
+    ----------
+    manifest : 챕터 경로 목록 / 매니페스트 dict · 파일 / 디렉터리
+    workers  : 챕터 병렬 파싱 프로세스 수 (기본 CPU 수)
+    """
+
+    def _progress(pct: int, msg: str = ""):
+        if progress_callback:
+            progress_callback(pct, msg)
+
+    timer = StageTimer()
+
+    def _done(result: ConvertResult) -> ConvertResult:
+        result.timings = timer.as_dict()
+        log_timings(
+            result.timings, input=str(manifest), template=template_id, engine=engine,
+            success=result.success, cache_hit=False,
+        )
+        return result
+
+    try:
+        _progress(5, "Node.js 모듈 확인 중...")
+        _ensure_node_modules()
+
+        _progress(10, "챕터 파싱 중...")
+        with timer.stage("parse"):
+            parsed = parse_book(manifest, workers=workers)
+        parsed = _optimize_images(parsed, custom_settings, timer)
+        _progress(40, f"파싱 완료 — 챕터 {len(parsed.chapters)}개 / 요소 {len(parsed.elements)}개")
+
+        _progress(60, "레이아웃 적용 중...")
+        _run_engine(
+            output_path, template_id, engine,
+            parsed=parsed, custom_settings=custom_settings, timer=timer,
+        )
+        _progress(100, "변환 완료")
 
-        node_cmd = _find_node()
-        if not node_cmd:
-            raise RuntimeError(
-                "Node.js 를 찾을 수 없습니다.\n"
-                "Node.js 18 이상을 설치한 후 다시 시도하세요."
+        return _done(ConvertResult(
+            success=True,
+            output_path=str(Path(output_path).resolve()),
+            element_count=len(parsed.elements),
+            image_count=_count_images(parsed),
+            template_id=template_id,
+            input_type="book",
+        ))
+
+    except Exception as e:
+        return _done(ConvertResult(
+            success=False, error=str(e), template_id=template_id, input_type="book",
+        ))
+
+
+# ─────────────────────────────────────────────
+# 비동기 변환 (웹 API 용)
+# ─────────────────────────────────────────────
+
+_ASYNC_EXECUTOR: ThreadPoolExecutor | None = None
+_ASYNC_EXECUTOR_LOCK = threading.Lock()
+
+
+def _async_executor() -> ThreadPoolExecutor:
+    """
+    convert_async 의 파싱 · 직렬화 · 캐시 조회용 스레드 풀.
+    크기는 DOCSTYLE_PARSE_WORKERS (기본 min(4, CPU 수)) — 동시에 파싱하는
+    요청 수를 제한해 이벤트 루프와 다른 요청이 굶지 않게 한다.
+    """
+    global _ASYNC_EXECUTOR
+    with _ASYNC_EXECUTOR_LOCK:
+        if _ASYNC_EXECUTOR is None:
+            try:
+                workers = int(os.getenv("DOCSTYLE_PARSE_WORKERS", "0"))
+            except ValueError:
+                workers = 0
+            _ASYNC_EXECUTOR = ThreadPoolExecutor(
+                max_workers=workers if workers > 0 else min(4, os.cpu_count() or 1),
+                thread_name_prefix="docstyle-parse",
             )
+        return _ASYNC_EXECUTOR
+
+
+async def convert_async(
+    input_path: str,
+    output_path: str,
+    template_id: str = "01",
+    chapter_override: str = "",
+    custom_settings: dict = None,
+    keep_temp: bool = False,
+    progress_callback=None,
+    use_cache: bool = True,
+    executor: ThreadPoolExecutor | None = None,
+) -> ConvertResult:
+    """
+    convert() 의 asyncio 버전. (FastAPI 등 이벤트 루프 안에서 사용)
+
+    - 캐시 조회 · 파싱 · JSON 직렬화는 executor(기본 _async_executor())에서 실행
+    - 엔진은 asyncio.create_subprocess_exec 로 node generate.js 를 띄워
+      stdin 으로 입력을 넘긴다 (engine="subprocess" 와 같은 경로)
+    - 작업이 취소되면 Node 자식 프로세스를 kill 하고 임시 파일을 정리한 뒤
+      CancelledError 를 다시 던진다. 이미 시작된 파싱 스레드는 끝까지 돌지만
+      결과는 버리고 추출 이미지도 지운다.
+
+    나머지 인자 · 반환값은 convert() 와 같다.
+    """
+    loop = asyncio.get_running_loop()
+    pool = executor or _async_executor()
+
+    def _progress(pct: int, msg: str = ""):
+        if progress_callback:
+            progress_callback(pct, msg)
+
+    timer = StageTimer()
 
-        proc = subprocess.run(
-            [node_cmd, str(_ENGINE_PATH), temp_json_path,
-             str(Path(output_path).resolve()), "--template", template_id],
-            capture_output=True,
-            text=True,
-            cwd=str(_ENGINE_PATH.parent),
-            timeout=120,
+    def _done(result: ConvertResult) -> ConvertResult:
+        result.timings = timer.as_dict()
+        log_timings(
+            result.timings, input=str(input_path), template=template_id, engine="async",
+            success=result.success, cache_hit=result.cache_hit,
         )
+        return result
+
+    temp_json_path = ""
+    image_base_dir = ""
+    suffix         = Path(input_path).suffix.lower()
+    input_type     = "md" if suffix == ".md" else "docx"
+
+    # ── 캐시 조회
+    cache = get_cache() if use_cache else None
+    cache_key = ""
+    if cache is not None:
+        with timer.stage("cache_lookup"):
+            cache_key, meta = await loop.run_in_executor(
+                pool, _lookup_cache, cache, input_path, input_type, output_path,
+                template_id, custom_settings, chapter_override,
+            )
+        if meta is not None:
+            _progress(100, "변환 완료 (캐시)")
+            return _done(ConvertResult(
+                success=True,
+                output_path=str(Path(output_path).resolve()),
+                element_count=meta.get("element_count", 0),
+                image_count=meta.get("image_count", 0),
+                template_id=template_id,
+                input_type=input_type,
+                cache_hit=True,
+                cache_hits=cache.hits,
+                cache_misses=cache.misses,
+            ))
+
+    try:
+        _progress(5, "Node.js 모듈 확인 중...")
+        await loop.run_in_executor(pool, _ensure_node_modules)
+    except RuntimeError as e:
+        return _done(ConvertResult(success=False, error=str(e), template_id=template_id))
+
+    try:
+        session_id = uuid.uuid4().hex[:8]
+        _TEMP_ROOT.mkdir(parents=True, exist_ok=True)
+
+        # ── Step 1: 파싱 — 취소돼도 스레드는 멈출 수 없으므로 끝난 뒤 이미지를 지운다
+        _progress(10, "마크다운 파싱 중..." if input_type == "md" else "Word 문서 파싱 중...")
+        with timer.stage("parse"):
+            parse_future = pool.submit(
+                _parse_input, input_path, input_type, chapter_override, use_cache, timer.stage,
+            )
+            try:
+                parsed, parse_cached = await asyncio.wrap_future(parse_future)
+            except asyncio.CancelledError:
+                parse_future.add_done_callback(_discard_parsed)
+                raise
+        if input_type == "docx" and not parse_cached:
+            image_base_dir = parsed.image_base_dir
+        parsed = await loop.run_in_executor(pool, _optimize_images, parsed, custom_settings, timer)
+        _progress(40, f"파싱 완료 — 요소 {len(parsed.elements)}개")
 
-        if proc.returncode != 0:
-            raise RuntimeError(f"Node.js 엔진 오류:\n{proc.stderr.strip() or proc.stdout.strip()}")
+        # ── Step 2: JSON 직렬화 — 이벤트 루프를 막지 않도록 executor 에서
+        _progress(50, "JSON 변환 중...")
+        with timer.stage("serialize"):
+            if keep_temp:
+                temp_json_path = str(_TEMP_ROOT / f"input_{session_id}.json")
+                await loop.run_in_executor(
+                    pool, build_json, parsed, template_id, custom_settings, temp_json_path,
+                )
+                payload = None
+            else:
+                payload = await loop.run_in_executor(
+                    pool, lambda: b"".join(iter_json_chunks(
+                        parsed, template_id, custom_settings, format=_ENGINE_FORMAT)),
+                )
+
+        # ── Step 3: Node.js 엔진 호출
+        _progress(60, "레이아웃 적용 중...")
+        returncode, stdout, stderr = await _node_run_async(
+            [temp_json_path or "-", str(Path(output_path).resolve()),
+             "--template", template_id, "--timings"],
+            payload, timeout=120,
+        )
+        node_timings, stderr = _split_timings(stderr)
+        _record_engine(timer, node_timings)
+        if returncode != 0:
+            raise RuntimeError(f"Node.js 엔진 오류:\n{stderr.strip() or stdout.strip()}")
 
         _progress(90, "임시 파일 생성 완료...")
 
-        # ── Step 5: 임시 파일 정리
         if not keep_temp:
-            _cleanup_temp(temp_json_path, image_base_dir if input_type == "docx" else "")
+            with timer.stage("cleanup"):
+                await loop.run_in_executor(pool, _cleanup_temp, temp_json_path, image_base_dir)
+
+        if cache_key:
+            cache.put(cache_key, output_path, {
+                "element_count": len(parsed.elements),
+                "image_count": len(parsed.image_map),
+            })
 
         _progress(100, "변환 완료")
 
-        return ConvertResult(
+        return _done(ConvertResult(
             success=True,
             output_path=str(Path(output_path).resolve()),
             element_count=len(parsed.elements),
             image_count=len(parsed.image_map),
             template_id=template_id,
             input_type=input_type,
-        )
+            cache_hits=cache.hits if cache else 0,
+            cache_misses=cache.misses if cache else 0,
+        ))
+
+    except asyncio.CancelledError:
+        if not keep_temp:
+            _cleanup_temp(temp_json_path, image_base_dir)
+        raise
 
     except Exception as e:
         if not keep_temp:
-            _cleanup_temp(temp_json_path, image_base_dir if input_type == "docx" else "")
-        return ConvertResult(
+            with timer.stage("cleanup"):
+                _cleanup_temp(temp_json_path, image_base_dir)
+        return _done(ConvertResult(
             success=False,
             error=str(e),
             template_id=template_id,
             input_type=input_type,
+        ))
+
+
+def _discard_parsed(future) -> None:
+    """취소된 요청의 파싱 결과 정리 — 캐시가 소유하지 않은 docx 추출 이미지만 지운다"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    parsed, parse_cached = future.result()
+    if not parse_cached and parsed.image_base_dir:
+        _cleanup_temp("", parsed.image_base_dir)
+
+
+# ─────────────────────────────────────────────
+# 메모리 변환 (임시 파일 없음)
+# ─────────────────────────────────────────────
+
+def convert_bytes(
+    data: bytes,
+    input_type: str,
+    template_id: str = "01",
+    chapter_override: str = "",
+    custom_settings: dict = None,
+    image_resolver: ImageResolver | None = None,
+    timeout: float = 120,
+) -> bytes:
+    """
+    메모리의 원고 → .docx 바이트.
+
+    파싱은 parse_md_text / docx_parser.parse_bytes 로 메모리에서 하고, 엔진과는
+    stdin(입력 JSON) / stdout(.docx) 파이프로만 주고받는다. 임시 파일 · 이미지
+    추출 디렉터리 · 변환 캐시를 쓰지 않는다.
+
+    Parameters
+    ----------
+    data           : .md (UTF-8) 또는 .docx 바이트
+    input_type     : "md" | "docx"
+    image_resolver : md 의 [image] 파일명 → 경로 / 바이트 / None
+                     (없으면 이미지는 모두 placeholder — docx 는 문서 안 이미지 사용)
+
+    Raises
+    ------
+    ValueError   : 알 수 없는 input_type 이나 docx 가 아닌 바이트
+    RuntimeError : Node.js 가 없거나 엔진 오류 · 시간 초과
+    """
+    _ensure_node_modules()
+    timer = StageTimer()
+    with timer.stage("parse"):
+        parsed = _parse_bytes(data, input_type, chapter_override, image_resolver)
+    parsed = _optimize_images(parsed, custom_settings, timer)
+    try:
+        proc = _node_run(
+            ["-", "-", "--template", template_id, "--timings"],
+            parsed, template_id, custom_settings, timeout=timeout, stage=timer.stage,
+            binary_stdout=True,
         )
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError(f"Node.js 엔진 시간 초과 ({timeout:.0f}초)") from e
+    node_timings, stderr = _split_timings(proc.stderr)
+    _record_engine(timer, node_timings)
+    success = proc.returncode == 0 and bool(proc.stdout)
+    log_timings(
+        timer.as_dict(), input=f"<{input_type} {len(data)} bytes>", template=template_id,
+        engine="bytes", success=success, cache_hit=False,
+    )
+    if not success:
+        raise RuntimeError(f"Node.js 엔진 오류:\n{stderr.strip() or 'empty output'}")
+    return proc.stdout
+
+
+async def convert_bytes_async(
+    data: bytes,
+    input_type: str,
+    template_id: str = "01",
+    chapter_override: str = "",
+    custom_settings: dict = None,
+    image_resolver: ImageResolver | None = None,
+    executor: ThreadPoolExecutor | None = None,
+    timeout: float = 120,
+    engine: str = "subprocess",
+) -> ConvertResult:
+    """
+    convert_bytes 의 asyncio 버전 (웹 API 용).
+
+    .docx 바이트는 ConvertResult.data 로 돌려준다 (output_path 는 "").
+    오류는 convert_async 처럼 success=False 로 보고하고, 취소되면 엔진을
+    멈춘 뒤 CancelledError 를 다시 던진다.
+
+    engine : "subprocess" — 요청마다 node generate.js (stdin → stdout)
+             "pool"       — 상주 워커 풀(engine_pool.py). 렌더는 루프 기본
+                            executor 스레드에서 임시 .docx 로 하고 바이트를 읽어
+                            온다. 취소되면 렌더 중인 워커를 kill 한다.
+    """
+    if engine not in ("subprocess", "pool"):
+        raise ValueError(f"알 수 없는 engine 값: {engine!r} (subprocess | pool)")
+    loop = asyncio.get_running_loop()
+    pool = executor or _async_executor()
+    timer = StageTimer()
+
+    def _done(result: ConvertResult) -> ConvertResult:
+        result.timings = timer.as_dict()
+        log_timings(
+            result.timings, input=f"<{input_type} {len(data)} bytes>", template=template_id,
+            engine="async-bytes", success=result.success, cache_hit=False,
+        )
+        return result
+
+    try:
+        await loop.run_in_executor(pool, _ensure_node_modules)
+
+        with timer.stage("parse"):
+            parsed = await loop.run_in_executor(
+                pool, _parse_bytes, data, input_type, chapter_override, image_resolver,
+            )
+        parsed = await loop.run_in_executor(pool, _optimize_images, parsed, custom_settings, timer)
+
+        if engine == "pool":
+            with timer.stage("serialize"):
+                payload = await loop.run_in_executor(
+                    pool, build_payload, parsed, template_id, custom_settings,
+                )
+            cancel = threading.Event()
+            try:
+                stdout = await loop.run_in_executor(
+                    None, _render_pool_bytes, payload, template_id, timeout, cancel, timer,
+                )
+            except asyncio.CancelledError:
+                cancel.set()   # 렌더 스레드가 워커를 kill 하고 임시 파일을 지운다
+                raise
+            return _done(ConvertResult(
+                success=True,
+                element_count=len(parsed.elements),
+                image_count=len(parsed.image_map) if input_type == "docx" else _count_images(parsed),
+                template_id=template_id,
+                input_type=input_type,
+                data=stdout,
+            ))
+
+        with timer.stage("serialize"):
+            payload = await loop.run_in_executor(
+                pool, lambda: b"".join(iter_json_chunks(
+                    parsed, template_id, custom_settings, format=_ENGINE_FORMAT)),
+            )
+
+        returncode, stdout, stderr = await _node_run_async(
+            ["-", "-", "--template", template_id, "--timings"],
+            payload, timeout=timeout, binary_stdout=True,
+        )
+        node_timings, stderr = _split_timings(stderr)
+        _record_engine(timer, node_timings)
+        if returncode != 0 or not stdout:
+            raise RuntimeError(f"Node.js 엔진 오류:\n{stderr.strip() or 'empty output'}")
+
+        return _done(ConvertResult(
+            success=True,
+            element_count=len(parsed.elements),
+            image_count=len(parsed.image_map) if input_type == "docx" else _count_images(parsed),
+            template_id=template_id,
+            input_type=input_type,
+            data=stdout,
+        ))
+
+    except Exception as e:
+        return _done(ConvertResult(
+            success=False, error=str(e), template_id=template_id, input_type=input_type,
+        ))
+
+
+def _render_pool_bytes(
+    payload: dict,
+    template_id: str,
+    timeout: float,
+    cancel: threading.Event,
+    timer: StageTimer,
+) -> bytes:
+    """워커 풀로 임시 .docx 에 렌더하고 바이트를 돌려준다 (convert_bytes_async 공용)"""
+    from .engine_pool import EngineError, get_pool
+
+    _TEMP_ROOT.mkdir(parents=True, exist_ok=True)
+    out = _TEMP_ROOT / f"bytes_{uuid.uuid4().hex[:8]}.docx"
+    t0 = time.perf_counter()
+    try:
+        try:
+            result = get_pool().render(
+                output_path=str(out), template_id=template_id, data=payload,
+                timeout=timeout, cancel=cancel,
+            )
+        except EngineError as e:
+            raise RuntimeError(f"Node.js 엔진 오류:\n{e}") from e
+        _record_engine(timer, result.get("timings"), time.perf_counter() - t0)
+        data = out.read_bytes()
+    finally:
+        out.unlink(missing_ok=True)
+    if not data:
+        raise RuntimeError("Node.js 엔진 오류:\nempty output")
+    return data
+
+
+def _parse_bytes(
+    data: bytes,
+    input_type: str,
+    chapter_override: str = "",
+    image_resolver: ImageResolver | None = None,
+) -> ParsedDocument:
+    """메모리 입력 파싱 (convert_bytes 공용)"""
+    if input_type == "md":
+        return parse_md_text(data.decode("utf-8"), image_resolver=image_resolver)
+    if input_type == "docx":
+        return parse_docx_bytes(data, chapter_override=chapter_override)
+    raise ValueError(f"알 수 없는 input_type 값: {input_type!r} (md | docx)")
+
+
+def _optimize_images(
+    parsed: ParsedDocument,
+    custom_settings: dict | None,
+    timer: StageTimer | None = None,
+) -> ParsedDocument:
+    """
+    custom_settings["image_optimize"] 가 켜져 있으면 이미지를 줄인 복사본
+    (bridge/image_optimizer.py). 꺼져 있으면 parsed 그대로.
+    """
+    options = ImageOptions.from_settings((custom_settings or {}).get("image_optimize"))
+    if options is None:
+        return parsed
+    with (timer.stage("optimize_images") if timer else nullcontext()):
+        return optimize_images(parsed, options)
+
+
+def _count_images(parsed: ParsedDocument) -> int:
+    return sum(isinstance(el, ImageElement) for el in parsed.elements)
 
 
 # ─────────────────────────────────────────────
 # 유틸리티
 # ─────────────────────────────────────────────
 
+def _parse_input(
+    input_path: str,
+    input_type: str,
+    chapter_override: str,
+    use_cache: bool,
+    stage=None,
+) -> tuple[ParsedDocument, bool]:
+    """
+    입력 파일 파싱.
+
+    use_cache 면 parser/parse_cache.py 를 거치며, 이때 docx 추출 이미지는
+    캐시가 소유하므로 호출자가 지우면 안 된다.
+
+    Returns
+    -------
+    (ParsedDocument, 캐시 관리 여부)
+    """
+    if input_type == "md":
+        def loader():
+            return parse_md(md_path=input_path, image_dir=str(Path(input_path).parent))
+        options: tuple = ()
+    else:
+        def loader():
+            return parse_docx(
+                docx_path=input_path,
+                temp_root=str(_TEMP_ROOT / "images"),
+                chapter_override=chapter_override,
+                stage=stage,
+            )
+        options = (chapter_override,)
+
+    if not use_cache:
+        return loader(), False
+    if not Path(input_path).exists():
+        return loader(), False   # 파서가 FileNotFoundError 를 그대로 보고
+    if input_type == "md":
+        # 참조 이미지가 생기거나 바뀌면 placeholder 결과를 다시 쓰지 않도록 키에 넣는다
+        try:
+            options = file_states(list_image_refs(input_path))
+        except (OSError, UnicodeDecodeError):
+            return loader(), False
+
+    parsed, _ = get_parse_cache().parse(input_path, input_type, loader, options)
+    return parsed, True
+
+
+def _stream_input(input_path: str) -> tuple[ParsedDocument, list[int]]:
+    """
+    .md 를 지연 파싱한다 — elements 는 생성기.
+
+    Returns
+    -------
+    (ParsedDocument, [내보낸 요소 수]) — 개수는 엔진에 다 보낸 뒤 채워진다
+    """
+    parsed = stream_md(input_path, image_dir=str(Path(input_path).parent))
+    count = [0]
+
+    def _counting(elements):
+        for el in elements:
+            count[0] += 1
+            yield el
+
+    parsed.elements = _counting(parsed.elements)
+    return parsed, count
+
+
+def _lookup_cache(
+    cache,
+    input_path: str,
+    input_type: str,
+    output_path: str,
+    template_id: str,
+    custom_settings: dict | None,
+    chapter_override: str,
+) -> tuple[str, dict | None]:
+    """
+    변환 캐시 조회.
+
+    Returns
+    -------
+    (캐시 키, 적중 시 메타 dict / 아니면 None) — 입력을 읽을 수 없으면 키는 ""
+    """
+    try:
+        image_refs = list_image_refs(input_path) if input_type == "md" else []
+        cache_key = cache.make_key(
+            input_path, template_id, custom_settings, chapter_override, image_refs
+        )
+    except (OSError, UnicodeDecodeError):
+        return "", None   # 입력을 읽을 수 없으면 파싱 단계가 오류를 보고
+    return cache_key, cache.get(cache_key, output_path)
+
+
+def _run_engine(
+    output_path: str,
+    template_id: str,
+    engine: str,
+    json_path: str = "",
+    parsed: ParsedDocument | None = None,
+    custom_settings: dict | None = None,
+    timer: StageTimer | None = None,
+) -> None:
+    """
+    입력 → .docx. engine 에 따라 단발 프로세스 또는 워커 풀 사용.
+
+    json_path 가 있으면 그 파일을, 없으면 parsed 를 직접 전달한다.
+    (subprocess — stdin 파이프 / pool — 요청에 data 인라인)
+    timer 가 있으면 serialize · engine_spawn · engine_build · pack 을 기록한다.
+    """
+    out_abs = str(Path(output_path).resolve())
+    stage = timer.stage if timer else None
+
+    if engine == "pool":
+        from .engine_pool import EngineError, get_pool
+        data = None
+        if not json_path:
+            with (stage("serialize") if stage else nullcontext()):
+                data = build_payload(parsed, template_id, custom_settings)
+        t0 = time.perf_counter()
+        try:
+            result = get_pool().render(
+                output_path=out_abs, template_id=template_id, input_path=json_path, data=data,
+            )
+        except EngineError as e:
+            raise RuntimeError(f"Node.js 엔진 오류:\n{e}") from e
+        _record_engine(timer, result.get("timings"), time.perf_counter() - t0)
+        return
+
+    if engine != "subprocess":
+        raise ValueError(f"알 수 없는 engine 값: {engine!r} (subprocess | pool)")
+
+    proc = _node_run(
+        [json_path or "-", out_abs, "--template", template_id, "--timings"],
+        None if json_path else parsed, template_id, custom_settings,
+        timeout=120, stage=stage,
+    )
+    node_timings, stderr = _split_timings(proc.stderr)
+    _record_engine(timer, node_timings)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Node.js 엔진 오류:\n{stderr.strip() or proc.stdout.strip()}")
+
+
+def _run_engine_many(
+    output_dir: str,
+    template_ids: list[str],
+    prefix: str,
+    engine: str,
+    json_path: str = "",
+    parsed: ParsedDocument | None = None,
+    custom_settings: dict | None = None,
+    timer: StageTimer | None = None,
+) -> dict[str, str]:
+    """
+    입력 → 템플릿별 .docx ({output_dir}/{prefix}_t{id}.docx)
+
+    Returns
+    -------
+    {template_id: 오류 메시지} — 실패한 템플릿만 포함
+    """
+    stage = timer.stage if timer else None
+
+    if engine == "pool":
+        from .engine_pool import EngineError, get_pool
+        data = None
+        if not json_path:
+            with (stage("serialize") if stage else nullcontext()):
+                data = build_payload(parsed, template_ids[0], custom_settings)
+        t0 = time.perf_counter()
+        try:
+            reply = get_pool().render_many(
+                output_dir=output_dir, template_ids=template_ids, prefix=prefix,
+                input_path=json_path, data=data,
+            )
+        except EngineError as e:
+            raise RuntimeError(f"Node.js 엔진 오류:\n{e}") from e
+        _record_engine(timer, reply.get("timings"), time.perf_counter() - t0)
+        return {
+            r["template"]: f"Node.js 엔진 오류:\n{r.get('error', '')}"
+            for r in reply.get("results", []) if not r.get("ok")
+        }
+
+    if engine != "subprocess":
+        raise ValueError(f"알 수 없는 engine 값: {engine!r} (subprocess | pool)")
+
+    proc = _node_run(
+        [json_path or "-", output_dir, "--templates", ",".join(template_ids), "--prefix", prefix,
+         "--timings"],
+        None if json_path else parsed, template_ids[0], custom_settings,
+        timeout=120 + 30 * len(template_ids), stage=stage,
+    )
+    node_timings, stderr = _split_timings(proc.stderr)
+    _record_engine(timer, node_timings)
+    if proc.returncode == 0:
+        return {}
+    # 일부 템플릿만 실패했을 수 있으므로 결과 파일이 없는 것만 오류로 보고
+    message = f"Node.js 엔진 오류:\n{stderr.strip() or proc.stdout.strip()}"
+    return {
+        tid: message for tid in template_ids
+        if not (Path(output_dir) / f"{prefix}_t{tid}.docx").exists()
+    }
+
+
+def _node_run(
+    args: list[str],
+    parsed: ParsedDocument | None,
+    template_id: str,
+    custom_settings: dict | None,
+    timeout: float,
+    stage=None,
+    binary_stdout: bool = False,
+) -> subprocess.CompletedProcess:
+    """
+    node generate.js 실행.
+    parsed 가 있으면 입력 JSON 을 조각 단위로 stdin 에 흘려보낸다. (입력 경로 "-")
+    binary_stdout 이면 stdout 을 bytes 그대로 돌려준다. (출력 경로 "-" — .docx 바이트)
+
+    stage 가 있으면 stdin 쓰기를 "serialize" 로 잰다 — 엔진이 읽는 속도에 맞춰
+    쓰므로 wall 에는 Node 기동 대기 시간이 겹쳐 들어간다.
+    """
+    node_cmd = _find_node()
+    if not node_cmd:
+        raise RuntimeError(
+            "Node.js 를 찾을 수 없습니다.\n"
+            "Node.js 18 이상을 설치한 후 다시 시도하세요."
+        )
+    cmd = [node_cmd, str(_ENGINE_PATH), *args]
+
+    if parsed is None:
+        proc = subprocess.run(cmd, capture_output=True, cwd=str(_ENGINE_PATH.parent), timeout=timeout)
+        captured = {"returncode": proc.returncode, "stdout": proc.stdout, "stderr": proc.stderr}
+    else:
+        captured = _node_pipe(cmd, parsed, template_id, custom_settings, timeout, stage)
+
+    stdout = captured.get("stdout", b"")
+    return subprocess.CompletedProcess(
+        cmd,
+        captured["returncode"],
+        stdout if binary_stdout else stdout.decode("utf-8", errors="replace"),
+        captured.get("stderr", b"").decode("utf-8", errors="replace"),
+    )
+
+
+def _node_pipe(
+    cmd: list[str],
+    parsed: ParsedDocument,
+    template_id: str,
+    custom_settings: dict | None,
+    timeout: float,
+    stage=None,
+) -> dict:
+    """입력 JSON 을 stdin 으로 보내며 실행 — {"returncode", "stdout", "stderr"} (bytes)"""
+
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(_ENGINE_PATH.parent),
+    )
+    captured: dict[str, bytes] = {}
+
+    def _drain(name: str, f) -> None:
+        captured[name] = f.read()
+
+    readers = [
+        threading.Thread(target=_drain, args=("stdout", proc.stdout), daemon=True),
+        threading.Thread(target=_drain, args=("stderr", proc.stderr), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+
+    try:
+        with (stage("serialize") if stage else nullcontext()):
+            write_json(parsed, proc.stdin, template_id, custom_settings, format=_ENGINE_FORMAT)
+    except (BrokenPipeError, OSError):
+        pass   # 엔진이 먼저 종료됨 — 아래 returncode / stderr 로 보고
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    for t in readers:
+        t.join()
+    return {"returncode": proc.returncode, **captured}
+
+
+async def _node_run_async(
+    args: list[str],
+    payload: bytes | None,
+    timeout: float,
+    binary_stdout: bool = False,
+) -> tuple[int, str | bytes, str]:
+    """
+    _node_run 의 asyncio 버전. payload 가 있으면 stdin 으로 보낸다.
+    binary_stdout 이면 stdout 을 bytes 그대로 돌려준다.
+
+    시간 초과 · 취소 시 Node 프로세스를 kill 하고 종료를 기다린 뒤 예외를 다시 던진다.
+
+    Returns
+    -------
+    (returncode, stdout, stderr)
+    """
+    node_cmd = _find_node()
+    if not node_cmd:
+        raise RuntimeError(
+            "Node.js 를 찾을 수 없습니다.\n"
+            "Node.js 18 이상을 설치한 후 다시 시도하세요."
+        )
+    proc = await asyncio.create_subprocess_exec(
+        node_cmd, str(_ENGINE_PATH), *args,
+        stdin=asyncio.subprocess.PIPE if payload is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(_ENGINE_PATH.parent),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(payload), timeout)
+    except BaseException as e:
+        if proc.returncode is None:
+            proc.kill()
+            await asyncio.shield(proc.wait())
+        if isinstance(e, asyncio.TimeoutError):
+            raise RuntimeError(f"Node.js 엔진 시간 초과 ({timeout:.0f}초)") from e
+        raise
+    return (
+        proc.returncode,
+        stdout if binary_stdout else stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+_TIMINGS_PREFIX = "DOCSTYLE_TIMINGS "
+
+
+def _split_timings(stderr: str) -> tuple[dict, str]:
+    """generate.js --timings 가 stderr 에 남긴 측정값 줄을 분리한다"""
+    timings: dict = {}
+    rest: list[str] = []
+    for line in stderr.splitlines():
+        if line.startswith(_TIMINGS_PREFIX):
+            try:
+                timings = json.loads(line[len(_TIMINGS_PREFIX):])
+            except ValueError:
+                pass
+            continue
+        rest.append(line)
+    return timings, "\n".join(rest)
+
+
+def _record_engine(timer: StageTimer | None, node_timings: dict | None, wall_s: float | None = None) -> None:
+    """
+    Node 측정값을 timer 에 기록한다.
+    워커 풀은 프로세스 기동이 없으므로 요청 왕복(wall_s)에서 build·pack 을 뺀
+    나머지(IPC · 요청 파싱 · 대기)를 engine_spawn 으로 본다.
+    """
+    if timer is None:
+        return
+    node_timings = dict(node_timings or {})
+    if wall_s is not None and "engine_spawn" not in node_timings:
+        busy = sum(t.get("wall_ms", 0) for t in node_timings.values() if isinstance(t, dict))
+        node_timings["engine_spawn"] = {
+            "wall_ms": max(0.0, wall_s * 1000 - busy), "cpu_ms": None, "peak_rss_kb": None,
+        }
+    timer.record_engine(node_timings)
+
+
 def _find_node() -> str | None:
     import shutil
     for c in ["node", "node.exe", "nodejs"]:
@@ -239,7 +1338,6 @@ def _find_node() -> str | None:
 
 
 def _cleanup_temp(json_path: str, image_dir: str) -> None:
-    import os
     if json_path and Path(json_path).exists():
         try:
             os.remove(json_path)
@@ -0,0 +1,389 @@
+"""
+engine_pool.py — 상주 Node.js 렌더 엔진 워커 풀
+
+convert(engine="subprocess") 는 변환마다 `node generate.js` 를 새로 띄우므로
+Node 기동 + docx 패키지 / builder.js / 템플릿 로드 비용을 매번 치른다.
+이 모듈은 engine/worker.js 프로세스를 여러 개 띄워두고
+stdin/stdout 줄 단위 JSON-RPC 로 렌더 요청을 보낸다.
+
+    pool = get_pool()
+    pool.render(output_path="out.docx", template_id="07", input_path="in.json")
+
+- 워커는 한 번에 요청 하나만 처리한다 (풀에서 빌려 쓰고 반납)
+- 죽은 워커는 다음 대여 시 자동 재기동, 렌더 도중 죽으면 새 워커로 1회 재시도
+- health_check() 로 유휴 워커에 ping 을 보내 상태를 확인한다
+- render(cancel=Event) — 이벤트가 켜지면 렌더 중인 워커를 kill 하고
+  EngineCancelled 를 던진다 (다음 대여 때 재기동)
+"""
+
+from __future__ import annotations
+
+import atexit
+import collections
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from .json_builder import dumps_compact
+
+
+# ─────────────────────────────────────────────
+# 경로 / 기본값
+# ─────────────────────────────────────────────
+
+_THIS_DIR    = Path(__file__).resolve().parent
+_WORKER_PATH = _THIS_DIR.parent / "engine" / "worker.js"
+
+_DEFAULT_TIMEOUT    = 120
+_CANCEL_POLL        = 0.1      # 취소 이벤트 확인 간격(초)
+_MAX_JOBS_PER_WORKER = 500     # 메모리 누수 대비 — 이 횟수마다 워커 재기동
+
+
+class EngineError(RuntimeError):
+    """워커가 오류 응답을 보냈거나 응답하지 않을 때"""
+
+
+class EngineCrashed(EngineError):
+    """워커 프로세스가 요청 처리 중 종료됨"""
+
+
+class EngineCancelled(EngineError):
+    """cancel 이벤트로 렌더를 중단함 (워커는 kill 됨)"""
+
+
+def _default_pool_size() -> int:
+    try:
+        size = int(os.getenv("DOCSTYLE_ENGINE_POOL_SIZE", "2"))
+    except ValueError:
+        size = 2
+    return size if size > 0 else 2
+
+
+# ─────────────────────────────────────────────
+# 단일 워커
+# ─────────────────────────────────────────────
+
+class _EngineWorker:
+    """node worker.js 프로세스 하나와 그 입출력 채널"""
+
+    def __init__(self, node_cmd: str):
+        self._node_cmd = node_cmd
+        self._proc: subprocess.Popen | None = None
+        self._responses: queue.Queue = queue.Queue()
+        self._stderr_tail: collections.deque = collections.deque(maxlen=50)
+        self._next_id = 0
+        self.jobs = 0
+        self.start()
+
+    # ── 프로세스 수명 ─────────────────────────
+
+    def start(self) -> None:
+        self._responses = queue.Queue()
+        self._stderr_tail.clear()
+        self.jobs = 0
+        self._proc = subprocess.Popen(
+            [self._node_cmd, str(_WORKER_PATH)],
+            cwd=str(_WORKER_PATH.parent),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        threading.Thread(
+            target=self._read_stdout, args=(self._proc, self._responses), daemon=True
+        ).start()
+        threading.Thread(
+            target=self._read_stderr, args=(self._proc,), daemon=True
+        ).start()
+
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def restart(self) -> None:
+        self.kill()
+        self.start()
+
+    def kill(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            self._proc.kill()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                pass
+        self._proc = None
+
+    def close(self, timeout: float = 2.0) -> None:
+        """shutdown 요청 후 종료를 기다리고, 응답이 없으면 강제 종료"""
+        if self.alive():
+            try:
+                self.call("shutdown", {}, timeout=timeout)
+                self._proc.wait(timeout=timeout)
+            except Exception:
+                pass
+        self.kill()
+
+    @property
+    def pid(self) -> int | None:
+        return self._proc.pid if self._proc else None
+
+    # ── 입출력 ───────────────────────────────
+
+    @staticmethod
+    def _read_stdout(proc: subprocess.Popen, responses: queue.Queue) -> None:
+        for raw in proc.stdout:
+            try:
+                responses.put(json.loads(raw.decode("utf-8")))
+            except ValueError:
+                continue
+        responses.put(None)   # EOF — 프로세스 종료
+
+    def _read_stderr(self, proc: subprocess.Popen) -> None:
+        for raw in proc.stderr:
+            self._stderr_tail.append(raw.decode("utf-8", errors="replace").rstrip())
+
+    def stderr_tail(self) -> str:
+        return "\n".join(self._stderr_tail)
+
+    def call(
+        self,
+        method: str,
+        params: dict,
+        timeout: float = _DEFAULT_TIMEOUT,
+        cancel: threading.Event | None = None,
+    ) -> dict:
+        """요청 하나를 보내고 같은 id 의 응답을 기다린다 (cancel 이 켜지면 워커를 kill)"""
+        if not self.alive():
+            raise EngineCrashed("엔진 워커가 실행 중이 아닙니다")
+
+        self._next_id += 1
+        req_id = self._next_id
+        line = dumps_compact({"id": req_id, "method": method, "params": params}) + b"\n"
+        try:
+            self._proc.stdin.write(line)
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise EngineCrashed(f"엔진 워커에 쓸 수 없습니다: {e}") from e
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.kill()
+                raise EngineError(f"엔진 워커 응답 시간 초과 ({timeout:.0f}s)")
+            try:
+                msg = self._responses.get(timeout=min(remaining, _CANCEL_POLL) if cancel else remaining)
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    self.kill()
+                    raise EngineCancelled("렌더가 취소되었습니다")
+                continue
+            if msg is None:
+                raise EngineCrashed(
+                    f"엔진 워커가 종료되었습니다:\n{self.stderr_tail()}".rstrip()
+                )
+            if msg.get("id") != req_id:
+                continue   # 시간 초과로 버려진 이전 요청의 늦은 응답
+            if "error" in msg:
+                raise EngineError(msg["error"].get("message", "알 수 없는 엔진 오류"))
+            return msg.get("result", {})
+
+
+# ─────────────────────────────────────────────
+# 워커 풀
+# ─────────────────────────────────────────────
+
+class EnginePool:
+    """
+    engine/worker.js 프로세스 풀.
+
+    Parameters
+    ----------
+    size     : 워커 수 (기본 DOCSTYLE_ENGINE_POOL_SIZE 또는 2)
+    node_cmd : node 실행 파일 경로 (비어있으면 PATH 에서 탐색)
+    """
+
+    def __init__(self, size: int | None = None, node_cmd: str | None = None):
+        from .converter import _find_node
+
+        self.size = max(1, size or _default_pool_size())
+        self._node_cmd = node_cmd or _find_node()
+        if not self._node_cmd:
+            raise RuntimeError(
+                "Node.js 를 찾을 수 없습니다.\n"
+                "Node.js 18 이상을 설치한 후 다시 시도하세요."
+            )
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._workers: list[_EngineWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.restarts = 0
+
+    # ── 대여 / 반납 ──────────────────────────
+
+    def _acquire(self, timeout: float) -> _EngineWorker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("엔진 풀이 이미 종료되었습니다")
+            if self._idle.empty() and len(self._workers) < self.size:
+                worker = _EngineWorker(self._node_cmd)
+                self._workers.append(worker)
+                return worker
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise EngineError(f"사용 가능한 엔진 워커가 없습니다 ({timeout:.0f}s 대기)")
+        if not worker.alive() or worker.jobs >= _MAX_JOBS_PER_WORKER:
+            worker.restart()
+            self.restarts += 1
+        return worker
+
+    def _release(self, worker: _EngineWorker) -> None:
+        if self._closed:
+            worker.close()
+            return
+        self._idle.put(worker)
+
+    # ── 공개 API ─────────────────────────────
+
+    def render(
+        self,
+        output_path: str,
+        template_id: str = "01",
+        input_path: str = "",
+        data: dict | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+        cancel: threading.Event | None = None,
+    ) -> dict:
+        """
+        JSON 파일(input_path) 또는 dict(data) 를 .docx 로 렌더한다.
+
+        렌더 도중 워커가 죽으면 새 워커로 한 번 재시도한다.
+        cancel 이 켜지면 워커를 kill 하고 EngineCancelled 를 던진다.
+        """
+        params: dict = {"output_path": output_path, "template": template_id}
+        if data is not None:
+            params["data"] = data
+        else:
+            params["input_path"] = input_path
+        return self._call("render", params, timeout, cancel)
+
+    def render_many(
+        self,
+        output_dir: str,
+        template_ids: list[str],
+        prefix: str = "docstyle",
+        input_path: str = "",
+        data: dict | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+    ) -> dict:
+        """
+        같은 입력을 여러 템플릿으로 렌더한다. (generate.js --templates 와 동일)
+        파일명은 {output_dir}/{prefix}_t{id}.docx
+
+        Returns
+        -------
+        {"results": [{"template", "output_path", "ok", "error"?}, ...],
+         "timings": {"engine_build": {...}, "pack": {...}}}
+        """
+        params: dict = {"output_dir": output_dir, "templates": list(template_ids), "prefix": prefix}
+        if data is not None:
+            params["data"] = data
+        else:
+            params["input_path"] = input_path
+        return self._call("render_many", params, timeout)
+
+    def _call(
+        self, method: str, params: dict, timeout: float, cancel: threading.Event | None = None,
+    ) -> dict:
+        worker = self._acquire(timeout)
+        try:
+            for attempt in range(2):
+                try:
+                    result = worker.call(method, params, timeout=timeout, cancel=cancel)
+                    worker.jobs += 1
+                    return result
+                except EngineCrashed:
+                    if attempt:
+                        raise
+                    worker.restart()
+                    self.restarts += 1
+        finally:
+            self._release(worker)
+
+    def warm(self) -> None:
+        """워커를 size 개까지 미리 띄워 첫 변환의 Node 기동 비용을 없앤다"""
+        with self._lock:
+            while len(self._workers) < self.size:
+                worker = _EngineWorker(self._node_cmd)
+                self._workers.append(worker)
+                self._idle.put(worker)
+
+    def health_check(self, timeout: float = 5.0) -> list[dict]:
+        """
+        유휴 워커에 ping 을 보내고 응답 없는 워커는 재기동한다.
+        사용 중인 워커는 {"busy": True} 로 보고한다.
+        """
+        report: list[dict] = []
+        idle: list[_EngineWorker] = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        for worker in self._workers:
+            if worker not in idle:
+                report.append({"pid": worker.pid, "busy": True})
+                continue
+            try:
+                info = worker.call("ping", {}, timeout=timeout)
+                report.append({**info, "ok": True})
+            except EngineError as e:
+                worker.restart()
+                self.restarts += 1
+                report.append({"pid": worker.pid, "ok": False, "error": str(e)})
+
+        for worker in idle:
+            self._idle.put(worker)
+        return report
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+
+
+# ─────────────────────────────────────────────
+# 프로세스 전역 풀
+# ─────────────────────────────────────────────
+
+_pool: EnginePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(size: int | None = None) -> EnginePool:
+    """프로세스 전역 엔진 풀 (처음 호출 시 생성 — size 는 이때만 적용)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EnginePool(size=size)
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_pool)
@@ -0,0 +1,276 @@
+"""
+image_optimizer.py — 렌더링 전 이미지 축소 · 재압축 (선택 단계)
+
+원고에 8–20 MB 폰 사진이 들어가면 엔진이 파일을 통째로 읽고 Packer 가
+다시 압축하느라 느리고, 결과 문서도 커진다. 이 단계는 파싱과 JSON 직렬화
+사이에서 이미지를 최대 표시 폭(engine/core/elements.js 의 MAX_IMG_EMU_W)과
+목표 DPI 에 맞는 픽셀 수로 줄이고, 지정한 품질로 다시 압축한다.
+
+    parsed = optimize_images(parsed, ImageOptions(dpi=200, quality=85))
+
+변환에서는 custom_settings["image_optimize"] 로 켠다 — True 또는
+{"dpi": 200, "quality": 85, "min_kb": 1024}. custom_settings 는 변환 캐시
+키에 들어가므로 설정별 결과도 따로 캐시된다.
+
+- JPEG / PNG 만 다룬다. 엔진이 확장자로 이미지 형식을 정하므로 형식은 바꾸지 않는다.
+- 표시 폭보다 픽셀이 많은 이미지, min_kb 보다 큰 JPEG 만 다시 쓰고,
+  결과가 원본보다 작지 않으면 원본을 그대로 쓴다.
+- EXIF · ICC 프로파일은 그대로 옮긴다 (EXIF 회전이 90°/270° 면 높이를 폭으로 본다).
+- 결과는 (원본 SHA-256, 옵션, 목표 폭) 키로 temp/cache/images/ 에 남긴다.
+  줄일 필요가 없던 이미지는 .skip 표시만 남겨 다시 열지 않는다.
+- 처리할 이미지가 둘 이상이면 ProcessPoolExecutor 로 병렬 처리한다.
+- 입력 ParsedDocument 는 고치지 않는다 (파싱 캐시와 공유) — 바뀐 이미지
+  요소만 새로 만든 얕은 복사본을 돌려준다.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import io
+import math
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from parser.disk_lru import env_mb, evict_lru
+from parser.models import ImageElement, ParsedDocument
+
+
+# ─────────────────────────────────────────────
+# 경로 / 기본값
+# ─────────────────────────────────────────────
+
+_ROOT        = Path(__file__).resolve().parent.parent
+_CACHE_DIR   = _ROOT / "temp" / "cache" / "images"
+_ELEMENTS_JS = _ROOT / "engine" / "core" / "elements.js"
+
+_DEFAULT_MAX_BYTES = env_mb("DOCSTYLE_IMAGE_CACHE_MB", 512)
+
+# 결과 형식이 바뀌면 올린다 — 이전 캐시 항목은 자연스럽게 무효화
+_KEY_SCHEMA = "1"
+
+_EMU_PER_INCH = 914400
+_FALLBACK_MAX_IMG_EMU_W = 6096000
+_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+_ORIENTATION = 0x0112
+
+
+@functools.cache
+def max_display_emu() -> int:
+    """엔진의 최대 이미지 표시 폭 (elements.js 의 MAX_IMG_EMU_W)"""
+    try:
+        m = re.search(r"const\s+MAX_IMG_EMU_W\s*=\s*(\d+)", _ELEMENTS_JS.read_text(encoding="utf-8"))
+    except OSError:
+        m = None
+    return int(m.group(1)) if m else _FALLBACK_MAX_IMG_EMU_W
+
+
+@dataclass(frozen=True)
+class ImageOptions:
+    dpi:     int = 200            # 표시 폭 1 인치당 픽셀 수
+    quality: int = 85             # JPEG 품질 (1–95)
+    min_kb:  int = 1024           # 이보다 큰 JPEG 는 축소가 필요 없어도 다시 압축
+
+    @classmethod
+    def from_settings(cls, value) -> ImageOptions | None:
+        """custom_settings["image_optimize"] → 옵션 (꺼져 있으면 None)"""
+        if not value:
+            return None
+        if value is True:
+            return cls()
+        if isinstance(value, dict):
+            names = {f.name for f in dataclasses.fields(cls)}
+            return cls(**{k: int(v) for k, v in value.items() if k in names})
+        raise ValueError(f"image_optimize 는 true 또는 dict 여야 합니다: {value!r}")
+
+    def target_px(self, width_emu: int) -> int:
+        """표시 폭(EMU) → 필요한 가로 픽셀 수"""
+        limit = max_display_emu()
+        shown = min(width_emu or limit, limit)
+        return max(1, math.ceil(shown / _EMU_PER_INCH * self.dpi))
+
+
+# ─────────────────────────────────────────────
+# 이미지 하나 (워커 프로세스에서 실행 — 모듈 최상위 함수여야 함)
+# ─────────────────────────────────────────────
+
+def _recompress(src: str | bytes, target_px: int, quality: int, min_bytes: int) -> bytes | None:
+    """줄인 바이트 — 다시 쓸 필요가 없거나 더 작아지지 않으면 None"""
+    from PIL import Image
+
+    raw = src if isinstance(src, bytes) else Path(src).read_bytes()
+    with Image.open(io.BytesIO(raw)) as im:
+        fmt = "JPEG" if im.format in ("JPEG", "MPO") else im.format
+        if fmt not in ("JPEG", "PNG") or getattr(im, "n_frames", 1) != 1:
+            return None
+        exif = im.getexif()
+        width = im.height if exif.get(_ORIENTATION, 1) in (5, 6, 7, 8) else im.width
+        shrink = width > target_px
+        if not (shrink or (fmt == "JPEG" and len(raw) > min_bytes)):
+            return None
+        info = im.info
+        if shrink:
+            scale = target_px / width
+            im = im.resize(
+                (max(1, round(im.width * scale)), max(1, round(im.height * scale))),
+                Image.Resampling.LANCZOS,
+            )
+        kwargs = {"optimize": True}
+        if info.get("icc_profile"):
+            kwargs["icc_profile"] = info["icc_profile"]
+        if len(exif):
+            kwargs["exif"] = exif
+        if fmt == "JPEG":
+            kwargs["quality"] = quality
+        buf = io.BytesIO()
+        im.save(buf, fmt, **kwargs)
+        return buf.getvalue() if buf.tell() < len(raw) else None
+
+
+def _optimize_one(src: str | bytes, target_px: int, quality: int, min_bytes: int, out_path: str) -> bool:
+    """
+    src(경로 또는 바이트)를 줄여 out_path 에 쓴다.
+    다시 쓸 필요가 없거나, 더 작아지지 않거나, 이미지를 읽을 수 없으면
+    out_path + ".skip" 만 남기고 False (직렬 · 프로세스 풀 모두 같은 결과).
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        out = _recompress(src, target_px, quality, min_bytes)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+        out = None    # 읽을 수 없는 이미지 (잘림 · 형식 불일치 · 과대) — 원본을 그대로 쓴다
+
+    target = Path(out_path if out is not None else out_path + ".skip")
+    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+    tmp.write_bytes(out or b"")
+    os.replace(tmp, target)
+    return out is not None
+
+
+# ─────────────────────────────────────────────
+# 결과 캐시
+# ─────────────────────────────────────────────
+
+_digest_lock  = threading.Lock()
+_digest_cache: dict[tuple, str] = {}
+
+
+def _content_digest(el: ImageElement) -> str | None:
+    """이미지 내용 SHA-256. 파일은 (경로, mtime, 크기) 가 같으면 다시 읽지 않는다"""
+    if el.data is not None:
+        return hashlib.sha256(el.data).hexdigest()
+    try:
+        st = os.stat(el.local_path)
+    except OSError:
+        return None
+    stamp = (el.local_path, st.st_mtime_ns, st.st_size)
+    with _digest_lock:
+        digest = _digest_cache.get(stamp)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(el.local_path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with _digest_lock:
+            _digest_cache[stamp] = digest
+    return digest
+
+
+# ─────────────────────────────────────────────
+# 문서 단위
+# ─────────────────────────────────────────────
+
+def optimize_images(
+    parsed: ParsedDocument,
+    options: ImageOptions | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    cache_dir: str | Path = _CACHE_DIR,
+) -> ParsedDocument:
+    """
+    이미지 요소를 줄인 결과로 바꾼 ParsedDocument 를 반환한다.
+
+    Parameters
+    ----------
+    parsed    : 파싱 결과 (수정하지 않는다)
+    options   : 목표 DPI · 품질 (기본 ImageOptions())
+    workers   : 병렬 프로세스 수 (기본 CPU 수). 1 이면 현재 프로세스에서만
+    executor  : 재사용할 Executor (주면 workers 는 무시하고 종료도 호출자가 한다)
+    cache_dir : 결과 캐시 디렉터리
+
+    Returns
+    -------
+    바뀐 이미지가 없으면 parsed 그대로, 있으면 elements 만 새 리스트인 복사본.
+    파일 이미지는 local_path 가 캐시 파일을, 메모리 이미지는 data 가 줄인 바이트를 가리킨다.
+    """
+    options = options or ImageOptions()
+    root = Path(cache_dir)
+
+    # 요소 → 캐시 경로 (같은 내용 · 같은 폭이면 한 번만 처리)
+    planned: dict[int, Path] = {}
+    jobs: dict[Path, tuple] = {}
+    for i, el in enumerate(parsed.elements):
+        if not isinstance(el, ImageElement):
+            continue
+        ext = Path(el.local_path or el.filename).suffix.lower()
+        if ext not in _EXTENSIONS or (el.data is None and not el.local_path):
+            continue
+        digest = _content_digest(el)
+        if digest is None:
+            continue
+        target_px = options.target_px(el.width_emu)
+        key = hashlib.sha256(
+            f"{_KEY_SCHEMA}\0{digest}\0{target_px}\0{options.quality}\0{options.min_kb}".encode()
+        ).hexdigest()
+        out = root / f"{key}{ext}"
+        planned[i] = out
+        if out not in jobs and not out.exists() and not Path(f"{out}.skip").exists():
+            src = el.data if el.data is not None else el.local_path
+            jobs[out] = (src, target_px, options.quality, options.min_kb * 1024, str(out))
+
+    if jobs:
+        root.mkdir(parents=True, exist_ok=True)
+        args = list(zip(*jobs.values()))
+        workers = max(1, workers or os.cpu_count() or 1)
+        if len(jobs) > 1 and (executor is not None or workers > 1):
+            ex = executor or ProcessPoolExecutor(max_workers=min(workers, len(jobs)))
+            try:
+                list(ex.map(_optimize_one, *args))
+            finally:
+                if executor is None:
+                    ex.shutdown()
+        else:
+            for job in jobs.values():
+                _optimize_one(*job)
+        evict_lru(root.glob("*"), _DEFAULT_MAX_BYTES)
+
+    elements = list(parsed.elements)
+    changed = False
+    for i, out in planned.items():
+        el = elements[i]
+        try:
+            if el.data is not None:
+                new = dataclasses.replace(el, data=out.read_bytes())
+            else:
+                out.stat()
+                new = dataclasses.replace(el, local_path=str(out))
+            os.utime(out)   # LRU 갱신
+        except OSError:
+            try:
+                os.utime(f"{out}.skip")
+            except OSError:
+                pass
+            continue        # 다시 쓸 필요가 없었거나 그 사이 축출됨 — 원본 사용
+        elements[i] = new
+        changed = True
+
+    if not changed:
+        return parsed
+    return dataclasses.replace(parsed, elements=elements)
@@ -3,13 +3,24 @@ json_builder.py — ParsedDocument → JSON 직렬화
 
 generate.js 가 기대하는 JSON 형식으로 변환한다.
 각 dataclass 타입별로 직렬화 규칙을 명확히 분리한다.
+
+- 요소는 클래스(TextElement 는 ElementType)로 찾는 디스패치 표로 직렬화한다.
+- 엔진 전달(write_json / iter_json_chunks)과 build_json(compact=True) 는 압축 형식이며,
+  orjson 이나 msgspec 이 설치돼 있으면 그쪽으로 인코딩한다 (JSON_BACKEND).
+- format="msgpack" 이면 JSON 대신 MessagePack 바이너리 (bridge/msgpack_codec.py).
+  엔진은 첫 바이트로 형식을 구분한다.
 """
 
 from __future__ import annotations
 
+import base64
 import json
+import os
+from operator import attrgetter
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
 
+from bridge.msgpack_codec import MAGIC as MSGPACK_MAGIC, packb
 from parser.models import (
     BulletsElement,
     ConclusionElement,
@@ -27,150 +38,193 @@ from parser.models import (
 
 
 # ─────────────────────────────────────────────
-# 요소별 직렬화
+# JSON 인코더 백엔드
 # ─────────────────────────────────────────────
+#
+# 압축 형식(들여쓰기 없음, 구분자 "," ":") 바이트 인코더.
+# orjson → msgspec → 표준 json 순서로 설치된 것을 쓴다.
+# DOCSTYLE_JSON_BACKEND=json|orjson|msgspec 로 고정할 수 있다.
+
+_STDLIB_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _stdlib_dumps(obj) -> bytes:
+    return _STDLIB_ENCODER.encode(obj).encode("utf-8")
+
+
+def _select_backend() -> tuple[str, Callable[[object], bytes]]:
+    name = os.getenv("DOCSTYLE_JSON_BACKEND", "auto").lower()
+    if name in ("auto", "orjson"):
+        try:
+            import orjson
+            return "orjson", orjson.dumps
+        except ImportError:
+            if name == "orjson":
+                raise
+    if name in ("auto", "msgspec"):
+        try:
+            import msgspec
+            return "msgspec", msgspec.json.Encoder().encode
+        except ImportError:
+            if name == "msgspec":
+                raise
+    return "json", _stdlib_dumps
+
 
+JSON_BACKEND, _fast_dumps = _select_backend()
 
-def _serialize_element(el: DocumentElement) -> dict | None:
+
+def dumps_compact(obj) -> bytes:
     """
-    dataclass 하나를 JSON-직렬화 가능한 dict 로 변환.
-    None 을 반환하면 해당 요소는 건너뜀.
+    obj → 압축 JSON (UTF-8 바이트).
+    json.dumps(obj, ensure_ascii=False, separators=(",", ":")) 와 같은 결과.
+    빠른 백엔드가 처리하지 못하는 값(64비트를 넘는 정수 등)은 표준 json 으로.
     """
+    try:
+        return _fast_dumps(obj)
+    except TypeError:
+        return _stdlib_dumps(obj)
 
-    if isinstance(el, TextElement):
-        t = el.type.value
 
-        if t == ElementType.CHAPTER_TITLE.value:
-            return {
-                "type": "chapter_title",
-                "phase": el.phase,
-                "text": el.text,
-                "sub": el.sub,
-            }
+# ─────────────────────────────────────────────
+# 요소별 직렬화 — 타입별 디스패치 표
+# ─────────────────────────────────────────────
+#
+# 필드를 그대로 옮기는 요소는 (JSON 타입, (JSON 키, 속성), ...) 만 적는다.
+# 값을 바꾸거나 생략하는 요소만 함수를 따로 둔다.
 
-        if t == ElementType.H1.value:
-            return {"type": "h1", "num": el.num or "•", "text": el.text}
+Serializer = Callable[[DocumentElement, str], "dict | None"]
 
-        if t == ElementType.H2.value:
-            return {"type": "h2", "text": el.text}
 
-        if t == ElementType.H3.value:
-            return {"type": "h3", "text": el.text}
+def _fields(tag: str, *pairs: tuple[str, str]) -> Serializer:
+    keys = tuple(k for k, _ in pairs)
+    get = attrgetter(*(a for _, a in pairs))
+    if len(pairs) == 1:
+        key = keys[0]
 
-        if t == ElementType.BODY.value:
-            d: dict = {"type": "body", "text": el.text}
-            if el.indent:
-                d["indent"] = el.indent
+        def serialize(el, image_base_dir=""):
+            return {"type": tag, key: get(el)}
+    else:
+        def serialize(el, image_base_dir=""):
+            d = {"type": tag}
+            d.update(zip(keys, get(el)))
             return d
+    return serialize
+
+
+def _h1(el: TextElement, image_base_dir: str = "") -> dict:
+    return {"type": "h1", "num": el.num or "•", "text": el.text}
 
-        if t == ElementType.QUOTE.value:
-            return {"type": "quote", "text": el.text}
-
-        if t == ElementType.INSIGHT.value:
-            return {"type": "insight", "text": el.text}
-
-        if t == ElementType.TIP.value:
-            return {"type": "tip", "text": el.text}
-
-        if t == ElementType.WARNING.value:
-            return {"type": "warning", "text": el.text}
-
-        if t == ElementType.CAPTION.value:
-            # 캡션은 _absorb_captions 에서 이미지에 흡수됐어야 함
-            # 혹시 남아있으면 body 로 처리
-            return {"type": "body", "text": el.text}
-
-        if t == ElementType.IMAGE_PLACEHOLDER.value:
-            return {"type": "image_placeholder", "caption": el.text}
-
-        # 기타 (BULLETS 단일 항목이 남아있는 경우)
-        return {"type": "body", "text": el.text}
-
-    if isinstance(el, QAElement):
-        return {
-            "type": "qa",
-            "question": el.question,
-            "answers": el.answers,
-        }
-
-    if isinstance(el, PromptElement):
-        return {
-            "type": "prompt",
-            "label": el.label,
-            "text": el.text,
-        }
-
-    if isinstance(el, ConclusionElement):
-        return {"type": "conclusion", "lines": el.lines}
-
-    if isinstance(el, BulletsElement):
-        return {"type": "bullets", "items": el.items}
-
-    if isinstance(el, ImageElement):
-        return {
-            "type": "image",
-            "filename": el.filename,
-            "width_emu": el.width_emu,
-            "height_emu": el.height_emu,
-            "caption": el.caption,
-        }
-
-    if isinstance(el, TableElement):
-        if el.type == ElementType.TABLE2:
-            return {
-                "type": "table2",
-                "col1": el.col1,
-                "col2": el.col2,
-                "rows": el.rows,
-            }
-        return {
-            "type": "table3",
-            "headers": el.headers,
-            "rows": el.rows,
-        }
-
-    if isinstance(el, HRElement):
-        return {"type": "hr", "size": el.size}
-
-    if isinstance(el, EmptyElement):
-        return {"type": "empty", "height": el.height}
 
+def _body(el: TextElement, image_base_dir: str = "") -> dict:
+    d: dict = {"type": "body", "text": el.text}
+    if el.indent:
+        d["indent"] = el.indent
+    return d
+
+
+_text_as_body = _fields("body", ("text", "text"))
+
+_TEXT_SERIALIZERS: dict[ElementType, Serializer] = {
+    ElementType.CHAPTER_TITLE:     _fields("chapter_title", ("phase", "phase"), ("text", "text"), ("sub", "sub")),
+    ElementType.H1:                _h1,
+    ElementType.H2:                _fields("h2", ("text", "text")),
+    ElementType.H3:                _fields("h3", ("text", "text")),
+    ElementType.BODY:              _body,
+    ElementType.QUOTE:             _fields("quote", ("text", "text")),
+    ElementType.INSIGHT:           _fields("insight", ("text", "text")),
+    ElementType.TIP:               _fields("tip", ("text", "text")),
+    ElementType.WARNING:           _fields("warning", ("text", "text")),
+    # 캡션은 absorb_captions 에서 이미지에 흡수됐어야 함 — 남아있으면 body 로
+    ElementType.CAPTION:           _text_as_body,
+    ElementType.IMAGE_PLACEHOLDER: _fields("image_placeholder", ("caption", "text")),
+}
+
+
+def _text(el: TextElement, image_base_dir: str = "") -> dict:
+    # 표에 없는 타입 (BULLETS 단일 항목이 남아있는 경우 등) 은 body
+    return _TEXT_SERIALIZERS.get(el.type, _text_as_body)(el, image_base_dir)
+
+
+def _image(el: ImageElement, image_base_dir: str = "", binary: bool = False) -> dict:
+    d = {
+        "type": "image",
+        "filename": el.filename,
+        "width_emu": el.width_emu,
+        "height_emu": el.height_emu,
+        "caption": el.caption,
+    }
+    # 엔진은 image_base_dir + filename 을 읽는다 — 메모리 이미지는 본문을
+    # 싣고(MessagePack 은 bin 그대로), 다른 위치의 파일은 경로를 따로 준다
+    if el.data is not None:
+        if binary:
+            d["data"] = el.data
+        else:
+            d["data_b64"] = base64.b64encode(el.data).decode("ascii")
+    elif el.local_path and os.path.normpath(el.local_path) != os.path.normpath(
+        os.path.join(image_base_dir, el.filename)
+    ):
+        d["path"] = el.local_path
+    return d
+
+
+_table2 = _fields("table2", ("col1", "col1"), ("col2", "col2"), ("rows", "rows"))
+_table3 = _fields("table3", ("headers", "headers"), ("rows", "rows"))
+
+
+def _table(el: TableElement, image_base_dir: str = "") -> dict:
+    return _table2(el) if el.type == ElementType.TABLE2 else _table3(el)
+
+
+_SERIALIZERS: dict[type, Serializer] = {
+    TextElement:       _text,
+    QAElement:         _fields("qa", ("question", "question"), ("answers", "answers")),
+    PromptElement:     _fields("prompt", ("label", "label"), ("text", "text")),
+    ConclusionElement: _fields("conclusion", ("lines", "lines")),
+    BulletsElement:    _fields("bullets", ("items", "items")),
+    ImageElement:      _image,
+    TableElement:      _table,
+    HRElement:         _fields("hr", ("size", "size")),
+    EmptyElement:      _fields("empty", ("height", "height")),
+}
+
+
+def _skip(el, image_base_dir: str = "") -> None:
     return None
 
 
-# ─────────────────────────────────────────────
-# 메인 직렬화 함수
-# ─────────────────────────────────────────────
+def _serializer_for(cls: type) -> Serializer:
+    """클래스 → 직렬화 함수. 하위 클래스는 가장 가까운 등록 클래스를 따른다 (결과 캐시)"""
+    for base in cls.__mro__:
+        fn = _SERIALIZERS.get(base)
+        if fn is not None:
+            break
+    else:
+        fn = _skip
+    _SERIALIZERS[cls] = fn
+    return fn
 
 
-def build_json(
-    parsed: ParsedDocument,
-    template_id: str = "01",
-    custom_settings: dict | None = None,
-    output_path: str | None = None,
-) -> str:
+def _serialize_element(el: DocumentElement, image_base_dir: str = "") -> dict | None:
     """
-    ParsedDocument 를 generate.js 입력 JSON 문자열로 변환.
+    dataclass 하나를 JSON-직렬화 가능한 dict 로 변환.
+    None 을 반환하면 해당 요소는 건너뜀.
+    """
+    fn = _SERIALIZERS.get(type(el)) or _serializer_for(type(el))
+    return fn(el, image_base_dir)
 
-    Parameters
-    ----------
-    parsed       : parse() 가 반환한 ParsedDocument
-    template_id  : "01" ~ "10"
-    custom_settings : 사용자 설정 (폰트, 여백 등) dict
-    output_path  : 지정하면 파일로 저장
 
-    Returns
-    -------
-    JSON 문자열
-    """
-    custom_settings = custom_settings or {}
+# ─────────────────────────────────────────────
+# 메인 직렬화 함수
+# ─────────────────────────────────────────────
 
-    serialized_elements = []
-    for el in parsed.elements:
-        d = _serialize_element(el)
-        if d is not None:
-            serialized_elements.append(d)
 
+def _payload_header(
+    parsed: ParsedDocument,
+    custom_settings: dict,
+    template_id: str,
+) -> dict:
+    """elements 를 뺀 입력 객체 (elements 는 항상 마지막 키)"""
     # Allow GUI settings to override parsed metadata for the cover
     title = custom_settings.get("cover_title") or parsed.meta.title
     author = custom_settings.get("cover_author") or parsed.meta.author
@@ -179,7 +233,7 @@ def build_json(
     header_text = custom_settings.get("header_text", "")
     page_numbers = custom_settings.get("page_numbers", True)
 
-    payload = {
+    return {
         "template": template_id,
         "custom_settings": custom_settings or {},
         "meta": {
@@ -192,9 +246,72 @@ def build_json(
             "page_numbers": page_numbers,
         },
         "image_base_dir": parsed.image_base_dir,
-        "elements": serialized_elements,
     }
 
+
+def build_payload(
+    parsed: ParsedDocument,
+    template_id: str = "01",
+    custom_settings: dict | None = None,
+) -> dict:
+    """
+    ParsedDocument 를 generate.js 입력 객체(dict)로 변환.
+    build_json 과 엔진 워커 풀(data 인라인 전달)이 공유한다.
+    """
+    custom_settings = custom_settings or {}
+
+    serialized_elements = []
+    for el in parsed.elements:
+        d = _serialize_element(el, parsed.image_base_dir)
+        if d is not None:
+            serialized_elements.append(d)
+
+    payload = _payload_header(parsed, custom_settings, template_id)
+    payload["elements"] = serialized_elements
+    return payload
+
+
+def build_json(
+    parsed: ParsedDocument,
+    template_id: str = "01",
+    custom_settings: dict | None = None,
+    output_path: str | None = None,
+    compact: bool = False,
+    format: str = "json",
+) -> str | bytes:
+    """
+    ParsedDocument 를 generate.js 입력 JSON 문자열로 변환.
+
+    Parameters
+    ----------
+    parsed       : parse() 가 반환한 ParsedDocument
+    template_id  : "01" ~ "10"
+    custom_settings : 사용자 설정 (폰트, 여백 등) dict
+    output_path  : 지정하면 파일로 저장
+    compact      : True 면 들여쓰기 없는 압축 형식 (dumps_compact — 더 작고 빠르다).
+                   False 면 사람이 읽기 좋은 indent=2
+    format       : "json" 또는 "msgpack" (compact 무시)
+
+    Returns
+    -------
+    JSON 문자열. format="msgpack" 이면 바이트
+    """
+    if format == "msgpack":
+        data = b"".join(iter_json_chunks(parsed, template_id, custom_settings, format=format))
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(output_path).write_bytes(data)
+        return data
+    _check_format(format)
+
+    if compact:
+        data = b"".join(iter_json_chunks(parsed, template_id, custom_settings))
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(output_path).write_bytes(data)
+        return data.decode("utf-8")
+
+    payload = build_payload(parsed, template_id, custom_settings)
     json_str = json.dumps(payload, ensure_ascii=False, indent=2)
 
     if output_path:
@@ -202,3 +319,124 @@ def build_json(
         Path(output_path).write_text(json_str, encoding="utf-8")
 
     return json_str
+
+
+_STREAM_CHUNK = 64 * 1024
+
+FORMATS = ("json", "msgpack")
+
+
+def _check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ValueError(f"지원하지 않는 엔진 입력 형식: {format!r} (json | msgpack)")
+
+
+def iter_json_chunks(
+    parsed: ParsedDocument,
+    template_id: str = "01",
+    custom_settings: dict | None = None,
+    indent: int | None = None,
+    format: str = "json",
+) -> Iterator[bytes]:
+    """
+    입력 JSON 을 약 64KB 단위 UTF-8 조각으로 만든다 (write_json / 비동기 전송 공용)
+
+    indent 가 None 이면 압축 형식으로 요소를 하나씩 직렬화하므로
+    parsed.elements 가 생성기(parser.md_parser.stream_md)여도 전체 목록을
+    만들지 않는다. 결과 바이트는 dumps_compact(build_payload(...)) 와 같다.
+    format="msgpack" 이면 같은 방식으로 MessagePack 조각을 만든다 (indent 무시).
+    """
+    if format == "msgpack":
+        yield from _iter_msgpack_chunks(parsed, template_id, custom_settings or {})
+        return
+    _check_format(format)
+    if indent is None:
+        yield from _iter_compact_chunks(parsed, template_id, custom_settings or {})
+        return
+
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+    buf: list[str] = []
+    size = 0
+    for piece in encoder.iterencode(build_payload(parsed, template_id, custom_settings)):
+        buf.append(piece)
+        size += len(piece)
+        if size >= _STREAM_CHUNK:
+            yield "".join(buf).encode("utf-8")
+            buf, size = [], 0
+    if buf:
+        yield "".join(buf).encode("utf-8")
+
+
+def _iter_compact_chunks(
+    parsed: ParsedDocument,
+    template_id: str,
+    custom_settings: dict,
+) -> Iterator[bytes]:
+    head = dumps_compact(_payload_header(parsed, custom_settings, template_id))
+    buf = [head[:-1] + b',"elements":[']
+    size = len(buf[0])
+    image_base_dir = parsed.image_base_dir
+    sep = b""
+    for el in parsed.elements:
+        fn = _SERIALIZERS.get(type(el)) or _serializer_for(type(el))
+        d = fn(el, image_base_dir)
+        if d is None:
+            continue
+        piece = dumps_compact(d)
+        buf.append(sep)
+        buf.append(piece)
+        sep = b","
+        size += len(piece) + 1
+        if size >= _STREAM_CHUNK:
+            yield b"".join(buf)
+            buf, size = [], 0
+    buf.append(b"]}")
+    yield b"".join(buf)
+
+
+def _iter_msgpack_chunks(
+    parsed: ParsedDocument,
+    template_id: str,
+    custom_settings: dict,
+) -> Iterator[bytes]:
+    # MAGIC + 헤더 map + 요소 map 을 이어 붙인다 (형식은 msgpack_codec 참고)
+    buf = [MSGPACK_MAGIC, packb(_payload_header(parsed, custom_settings, template_id))]
+    size = len(buf[1])
+    image_base_dir = parsed.image_base_dir
+    for el in parsed.elements:
+        fn = _SERIALIZERS.get(type(el)) or _serializer_for(type(el))
+        d = _image(el, image_base_dir, binary=True) if fn is _image else fn(el, image_base_dir)
+        if d is None:
+            continue
+        piece = packb(d)
+        buf.append(piece)
+        size += len(piece)
+        if size >= _STREAM_CHUNK:
+            yield b"".join(buf)
+            buf, size = [], 0
+    if buf:
+        yield b"".join(buf)
+
+
+def write_json(
+    parsed: ParsedDocument,
+    stream: BinaryIO,
+    template_id: str = "01",
+    custom_settings: dict | None = None,
+    indent: int | None = None,
+    format: str = "json",
+) -> int:
+    """
+    입력 JSON 을 문자열 전체를 만들지 않고 바이너리 스트림에 조각 단위로 쓴다.
+    (엔진 stdin 파이프 전송용 — 기본은 들여쓰기 없는 압축 형식,
+    format="msgpack" 이면 MessagePack)
+
+    Returns
+    -------
+    쓴 바이트 수
+    """
+    written = 0
+    for chunk in iter_json_chunks(parsed, template_id, custom_settings, indent, format):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
@@ -0,0 +1,205 @@
+"""
+msgpack_codec.py — 엔진 입력용 MessagePack 인코딩
+
+build_json(format="msgpack") / write_json(format="msgpack") 가 쓰는 바이너리 형식.
+엔진(engine/core/payload.js)은 첫 바이트로 JSON 과 구분한다.
+
+    MAGIC(2바이트 c1 01) + 헤더 map + 요소 map × N (끝까지)
+
+- 0xC1 은 MessagePack 에서 쓰지 않는 코드이고 UTF-8 JSON 의 첫 바이트가 될 수 없다.
+  뒤의 01 은 형식 버전.
+- 요소를 배열로 묶지 않고 이어 붙이므로 개수를 몰라도(생성기 입력) 흘려보낼 수 있다.
+  헤더 map 에는 elements 키가 없다 — 엔진이 요소들로 채운다.
+- 메모리 이미지는 base64 문자열(data_b64) 대신 bin(data) 으로 싣는다.
+
+msgpack 패키지가 있으면 그 packb 를, 없으면 아래 순수 파이썬 인코더를 쓴다.
+(둘의 출력은 같다 — str 는 str 계열, bytes 는 bin 계열, 정수 · 실수는 가장 짧은 형식)
+"""
+
+from __future__ import annotations
+
+import struct
+
+
+MAGIC = b"\xc1\x01"
+
+_pack_uint8  = struct.Struct(">B").pack
+_pack_uint16 = struct.Struct(">H").pack
+_pack_uint32 = struct.Struct(">I").pack
+_pack_f64    = struct.Struct(">Bd").pack
+
+# 자주 나오는 짧은 문자열(키 · 요소 타입) 인코딩 캐시
+_str_cache: dict[str, bytes] = {}
+_STR_CACHE_MAX = 4096
+
+
+def _str(s: str) -> bytes:
+    b = s.encode("utf-8")
+    n = len(b)
+    if n < 32:
+        return bytes((0xA0 | n,)) + b
+    if n < 0x100:
+        return b"\xd9" + _pack_uint8(n) + b
+    if n < 0x10000:
+        return b"\xda" + _pack_uint16(n) + b
+    return b"\xdb" + _pack_uint32(n) + b
+
+
+def _int(v: int) -> bytes:
+    if 0 <= v < 0x80:
+        return bytes((v,))
+    if -32 <= v < 0:
+        return bytes((v & 0xFF,))
+    if v >= 0:
+        for code, fmt, limit in ((0xCC, ">B", 0x100), (0xCD, ">H", 0x10000),
+                                 (0xCE, ">I", 0x100000000), (0xCF, ">Q", 1 << 64)):
+            if v < limit:
+                return struct.pack(">B" + fmt[1:], code, v)
+    else:
+        for code, fmt, limit in ((0xD0, ">b", 0x80), (0xD1, ">h", 0x8000),
+                                 (0xD2, ">i", 0x80000000), (0xD3, ">q", 1 << 63)):
+            if v >= -limit:
+                return struct.pack(">B" + fmt[1:], code, v)
+    raise OverflowError(f"MessagePack 정수 범위를 벗어남: {v}")
+
+
+def _pack(obj, out: list[bytes]) -> None:
+    t = type(obj)
+    if t is str:
+        b = _str_cache.get(obj)
+        if b is None:
+            b = _str(obj)
+            if len(obj) <= 16 and len(_str_cache) < _STR_CACHE_MAX:
+                _str_cache[obj] = b
+        out.append(b)
+    elif t is dict:
+        n = len(obj)
+        out.append(bytes((0x80 | n,)) if n < 16 else
+                   b"\xde" + _pack_uint16(n) if n < 0x10000 else b"\xdf" + _pack_uint32(n))
+        for k, v in obj.items():
+            _pack(k, out)
+            _pack(v, out)
+    elif t is list or t is tuple:
+        n = len(obj)
+        out.append(bytes((0x90 | n,)) if n < 16 else
+                   b"\xdc" + _pack_uint16(n) if n < 0x10000 else b"\xdd" + _pack_uint32(n))
+        for v in obj:
+            _pack(v, out)
+    elif obj is None:
+        out.append(b"\xc0")
+    elif t is bool:
+        out.append(b"\xc3" if obj else b"\xc2")
+    elif t is int:
+        out.append(_int(obj))
+    elif t is float:
+        out.append(_pack_f64(0xCB, obj))
+    elif t is bytes or t is bytearray or t is memoryview:
+        b = bytes(obj)
+        n = len(b)
+        out.append((b"\xc4" + _pack_uint8(n) if n < 0x100 else
+                    b"\xc5" + _pack_uint16(n) if n < 0x10000 else b"\xc6" + _pack_uint32(n)) + b)
+    elif isinstance(obj, str):
+        _pack(str(obj), out)
+    elif isinstance(obj, int):
+        _pack(int(obj), out)
+    elif isinstance(obj, dict):
+        _pack(dict(obj), out)
+    else:
+        raise TypeError(f"MessagePack 으로 직렬화할 수 없는 값: {type(obj).__name__}")
+
+
+def _packb_py(obj) -> bytes:
+    """obj → MessagePack 바이트 (순수 파이썬)"""
+    out: list[bytes] = []
+    _pack(obj, out)
+    return b"".join(out)
+
+
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
+if _msgpack is not None:
+    def packb(obj) -> bytes:
+        """obj → MessagePack 바이트 (Packer 는 스레드 안전하지 않아 호출마다 새로 만든다)"""
+        return _msgpack.packb(obj, use_bin_type=True, use_single_float=False)
+
+    MSGPACK_BACKEND = "msgpack"
+else:
+    packb = _packb_py
+    MSGPACK_BACKEND = "python"
+
+
+# ─────────────────────────────────────────────
+# 디코딩 (벤치마크 · 점검용 — 엔진은 payload.js)
+# ─────────────────────────────────────────────
+
+def _unpack(buf: bytes, i: int):
+    c = buf[i]
+    i += 1
+    if c < 0x80:
+        return c, i
+    if c >= 0xE0:
+        return c - 0x100, i
+    if 0xA0 <= c < 0xC0:
+        n = c & 0x1F
+        return buf[i:i + n].decode("utf-8"), i + n
+    if 0x80 <= c < 0x90:
+        return _unpack_map(buf, i, c & 0x0F)
+    if 0x90 <= c < 0xA0:
+        return _unpack_array(buf, i, c & 0x0F)
+    if c == 0xC0:
+        return None, i
+    if c in (0xC2, 0xC3):
+        return c == 0xC3, i
+    if c in (0xC4, 0xC5, 0xC6, 0xD9, 0xDA, 0xDB):
+        size = {0xC4: 1, 0xC5: 2, 0xC6: 4, 0xD9: 1, 0xDA: 2, 0xDB: 4}[c]
+        n = int.from_bytes(buf[i:i + size], "big")
+        i += size
+        raw = buf[i:i + n]
+        return (bytes(raw) if c < 0xD0 else raw.decode("utf-8")), i + n
+    if c == 0xCA:
+        return struct.unpack_from(">f", buf, i)[0], i + 4
+    if c == 0xCB:
+        return struct.unpack_from(">d", buf, i)[0], i + 8
+    if 0xCC <= c <= 0xD3:
+        fmt, size = {0xCC: (">B", 1), 0xCD: (">H", 2), 0xCE: (">I", 4), 0xCF: (">Q", 8),
+                     0xD0: (">b", 1), 0xD1: (">h", 2), 0xD2: (">i", 4), 0xD3: (">q", 8)}[c]
+        return struct.unpack_from(fmt, buf, i)[0], i + size
+    if c in (0xDC, 0xDD):
+        size = 2 if c == 0xDC else 4
+        return _unpack_array(buf, i + size, int.from_bytes(buf[i:i + size], "big"))
+    if c in (0xDE, 0xDF):
+        size = 2 if c == 0xDE else 4
+        return _unpack_map(buf, i + size, int.from_bytes(buf[i:i + size], "big"))
+    raise ValueError(f"지원하지 않는 MessagePack 코드: 0x{c:02x}")
+
+
+def _unpack_map(buf: bytes, i: int, n: int):
+    d = {}
+    for _ in range(n):
+        k, i = _unpack(buf, i)
+        d[k], i = _unpack(buf, i)
+    return d, i
+
+
+def _unpack_array(buf: bytes, i: int, n: int):
+    items = []
+    for _ in range(n):
+        v, i = _unpack(buf, i)
+        items.append(v)
+    return items, i
+
+
+def unpack_payload(buf: bytes) -> dict:
+    """MAGIC + 헤더 + 요소들 → generate.js 입력 객체 (elements 포함)"""
+    if not buf.startswith(MAGIC):
+        raise ValueError("MessagePack 엔진 입력이 아닙니다 (헤더 바이트 불일치)")
+    header, i = _unpack(buf, len(MAGIC))
+    elements = []
+    while i < len(buf):
+        el, i = _unpack(buf, i)
+        elements.append(el)
+    header["elements"] = elements
+    return header
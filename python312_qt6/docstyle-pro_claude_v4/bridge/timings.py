@@ -0,0 +1,148 @@
+"""
+timings.py — 변환 단계별 시간 / 메모리 측정
+
+    timer = StageTimer()
+    with timer.stage("parse"):
+        ...
+    timer.record("engine_build", wall_ms=..., cpu_ms=..., peak_rss_kb=...)   # Node 측정값
+    result.timings = timer.as_dict()
+
+단계마다 {"wall_ms", "cpu_ms", "peak_rss_kb"} 를 남긴다.
+    - 중첩된 단계는 바깥 단계에서 빼서 각 단계가 자기 시간만 갖는다
+      (예: parse 는 extract_images 를 제외한 시간)
+    - peak_rss_kb 는 그 단계가 끝난 시점까지의 프로세스 최대 RSS
+      (Python 단계는 이 프로세스, engine_* / pack 은 Node 프로세스 기준)
+    - Windows 등 resource 모듈이 없으면 Python 단계의 peak_rss_kb 는 None
+
+DOCSTYLE_TIMINGS_LOG=1 이면 변환마다 "docstyle.timings" 로거로
+JSON 한 줄을 남긴다. (핸들러가 없으면 stderr)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+
+# 표시 순서 — 여기 없는 단계는 뒤에 붙는다
+STAGES = (
+    "cache_lookup",
+    "parse",
+    "extract_images",
+    "optimize_images",
+    "serialize",
+    "engine_spawn",
+    "engine_build",
+    "pack",
+    "cleanup",
+)
+
+logger = logging.getLogger("docstyle.timings")
+
+
+def peak_rss_kb() -> int | None:
+    """현재 프로세스의 최대 RSS (KB)"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss   # macOS 는 바이트 단위
+
+
+class StageTimer:
+    """단계별 wall / CPU / 최대 RSS 기록기"""
+
+    def __init__(self):
+        self._t0 = time.perf_counter()
+        self._stages: dict[str, dict] = {}
+        self._stack: list[list[float]] = []   # 진행 중 단계의 [자식 wall, 자식 cpu]
+
+    @contextmanager
+    def stage(self, name: str):
+        wall0 = time.perf_counter()
+        cpu0  = time.process_time()
+        self._stack.append([0.0, 0.0])
+        try:
+            yield
+        finally:
+            child_wall, child_cpu = self._stack.pop()
+            wall = time.perf_counter() - wall0
+            cpu  = time.process_time() - cpu0
+            if self._stack:
+                self._stack[-1][0] += wall
+                self._stack[-1][1] += cpu
+            self.record(
+                name,
+                wall_ms=(wall - child_wall) * 1000,
+                cpu_ms=(cpu - child_cpu) * 1000,
+                peak_rss_kb=peak_rss_kb(),
+            )
+
+    def record(
+        self,
+        name: str,
+        wall_ms: float,
+        cpu_ms: float | None = None,
+        peak_rss_kb: int | None = None,
+    ) -> None:
+        """외부(Node 엔진)에서 잰 값을 그대로 넣는다. 같은 단계가 여러 번이면 합산."""
+        prev = self._stages.get(name)
+        if prev:
+            wall_ms += prev["wall_ms"]
+            if cpu_ms is not None and prev["cpu_ms"] is not None:
+                cpu_ms += prev["cpu_ms"]
+            if prev["peak_rss_kb"] is not None:
+                peak_rss_kb = max(peak_rss_kb or 0, prev["peak_rss_kb"])
+        self._stages[name] = {
+            "wall_ms": round(wall_ms, 2),
+            "cpu_ms": round(cpu_ms, 2) if cpu_ms is not None else None,
+            "peak_rss_kb": peak_rss_kb,
+        }
+
+    def record_engine(self, report: dict | None) -> None:
+        """generate.js / worker.js 가 보낸 timings 를 기록 (spawn · build · pack)"""
+        for name, t in (report or {}).items():
+            if isinstance(t, dict) and "wall_ms" in t:
+                self.record(name, t["wall_ms"], t.get("cpu_ms"), t.get("peak_rss_kb"))
+
+    def as_dict(self) -> dict:
+        order = {name: i for i, name in enumerate(STAGES)}
+        out = dict(sorted(self._stages.items(), key=lambda kv: order.get(kv[0], len(order))))
+        out["total"] = {
+            "wall_ms": round((time.perf_counter() - self._t0) * 1000, 2),
+            "cpu_ms": None,
+            "peak_rss_kb": peak_rss_kb(),
+        }
+        return out
+
+
+def log_timings(timings: dict, **fields) -> None:
+    """DOCSTYLE_TIMINGS_LOG 가 켜져 있으면 구조화 JSON 로그 한 줄"""
+    if os.getenv("DOCSTYLE_TIMINGS_LOG", "0") in ("", "0"):
+        return
+    if not logger.handlers and not logging.getLogger().handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
+    logger.info(json.dumps({"event": "convert_timings", **fields, "timings": timings}, ensure_ascii=False))
+
+
+def format_timings(timings: dict) -> str:
+    """GUI / 콘솔 표시용 한 줄 요약 — 'parse 12ms · engine_build 340ms · ...'"""
+    parts = []
+    for name, t in timings.items():
+        if name == "total" or not t:
+            continue
+        parts.append(f"{name} {t['wall_ms']:.0f}ms")
+    return " · ".join(parts)
@@ -8,11 +8,20 @@ image_injector.py — Node.js 가 생성한 raw .docx 에 원본 이미지 재
 4. [Content_Types].xml 에 이미지 확장자 등록
 5. word/document.xml 에서 [IMG:image1] 마커를 실제 <w:drawing> 으로 교체
 6. 새 .docx 로 저장
+
+ZIP 은 스트리밍으로 다시 쓴다 — 문서 크기와 관계없이 메모리가 일정하다.
+- 고치지 않는 항목은 압축을 풀지 않고 원래 압축 데이터를 그대로 복사
+- 이미지는 이미 압축된 형식이므로 ZIP_STORED 로 저장
+- document.xml 은 조각 단위로 읽으며 마커를 교체 (조각 경계의 마커도 처리)
+- 출력 경로 옆 임시 파일에 쓰고 os.replace 로 원자적으로 교체
 """
 
 from __future__ import annotations
+import copy
 import os
 import re
+import struct
+import uuid
 import zipfile
 import shutil
 from pathlib import Path
@@ -67,6 +76,11 @@ CONTENT_TYPES = {
 DEFAULT_WIDTH_EMU  = 5_400_000   # ≈ 6cm
 DEFAULT_HEIGHT_EMU = 3_600_000   # ≈ 4cm
 
+# 스트리밍 단위 / 조각 경계에 걸친 마커를 다음 조각으로 넘길 최대 길이
+CHUNK_SIZE  = 256 * 1024
+_MARKER_MAX = 64
+_MARKER_RE  = re.compile(rb"\[IMG:(image\d+)\]")
+
 
 def _drawing_xml(rel_id: str, width_emu: int, height_emu: int, img_id: int) -> str:
     """<w:drawing> XML 문자열 생성"""
@@ -116,73 +130,76 @@ def inject_images(
     Returns:
         output_path
     """
-    if not images:
-        shutil.copy2(raw_docx, output_path)
-        return output_path
-
-    # image_id → image dict 매핑
-    id_map: dict[str, dict] = {img["id"]: img for img in images}
-
-    # 임시 작업 경로
-    tmp_dir  = Path(raw_docx).parent / "_inject_tmp"
-    tmp_dir.mkdir(exist_ok=True)
-    tmp_out  = tmp_dir / "output.docx"
+    out = Path(output_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp_out = out.with_name(f".{out.name}.{uuid.uuid4().hex[:8]}.tmp")
 
     try:
-        with zipfile.ZipFile(raw_docx, "r") as zin, \
-             zipfile.ZipFile(str(tmp_out), "w", zipfile.ZIP_DEFLATED) as zout:
-
-            existing = set(zin.namelist())
-            added_rels:   dict[str, str] = {}   # image_id → rel_id
-            added_exts:   set[str]       = set()
-            img_counter   = 1000  # 기존 rId 와 충돌 방지
-
-            # ── 1. 기존 파일 복사 ───────────────────────────────
-            for item in zin.namelist():
-                data = zin.read(item)
-
-                if item == "word/document.xml":
-                    # 나중에 교체
-                    continue
-                if item == "word/_rels/document.xml.rels":
-                    # 관계 추가 후 저장
-                    rels_xml = _add_relationships(data, images, id_map, added_rels, img_counter)
-                    zout.writestr(item, rels_xml)
-                    continue
-                if item == "[Content_Types].xml":
-                    # 확장자 등록 후 저장
-                    ct_xml = _add_content_types(data, images, added_exts)
-                    zout.writestr(item, ct_xml)
-                    continue
-
-                zout.writestr(item, data)
-
-            # ── 2. 이미지 파일 삽입 ─────────────────────────────
-            for img in images:
-                media_path = f"word/media/{img['filename']}"
-                if media_path not in existing and os.path.exists(img["path"]):
-                    zout.write(img["path"], media_path)
-
-            # ── 3. document.xml 마커 교체 ───────────────────────
-            doc_xml = zin.read("word/document.xml").decode("utf-8")
-            doc_xml = _replace_markers(doc_xml, id_map, added_rels)
-            zout.writestr("word/document.xml", doc_xml.encode("utf-8"))
-
-            # ── 4. _rels 없으면 생성 ────────────────────────────
-            if "word/_rels/document.xml.rels" not in existing:
-                rels_xml = _create_rels(images, added_rels)
-                zout.writestr("word/_rels/document.xml.rels", rels_xml)
-
-        # 최종 출력 경로로 이동
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(str(tmp_out), output_path)
-
+        if not images:
+            shutil.copy2(raw_docx, tmp_out)
+        else:
+            _rewrite(raw_docx, images, tmp_out)
+        os.replace(tmp_out, out)
     finally:
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_out.unlink(missing_ok=True)
 
     return output_path
 
 
+def _rewrite(raw_docx: str, images: list[dict], tmp_out: Path) -> None:
+    """raw_docx 를 이미지 삽입본으로 tmp_out 에 스트리밍 기록"""
+    # image_id → image dict 매핑
+    id_map: dict[str, dict] = {img["id"]: img for img in images}
+
+    with zipfile.ZipFile(raw_docx, "r") as zin, \
+         open(raw_docx, "rb") as raw, \
+         zipfile.ZipFile(str(tmp_out), "w", zipfile.ZIP_DEFLATED) as zout:
+
+        existing = set(zin.namelist())
+        added_rels:   dict[str, str] = {}   # image_id → rel_id
+        added_exts:   set[str]       = set()
+        img_counter   = 1000  # 기존 rId 와 충돌 방지
+
+        # 마커 교체에 rel_id 가 필요하므로 관계 파일을 먼저 만든다
+        rels_xml = None
+        if "word/_rels/document.xml.rels" in existing:
+            rels_xml = _add_relationships(
+                zin.read("word/_rels/document.xml.rels"), images, id_map, added_rels, img_counter,
+            )
+
+        # ── 1. 기존 파일 복사 ───────────────────────────────
+        for info in zin.infolist():
+            item = info.filename
+
+            if item == "word/document.xml":
+                # ── 마커 교체 (조각 단위) ──
+                with zin.open(info) as src, zout.open(item, "w") as dst:
+                    _replace_markers_stream(src, dst, id_map, added_rels)
+                continue
+            if item == "word/_rels/document.xml.rels":
+                zout.writestr(item, rels_xml)
+                continue
+            if item == "[Content_Types].xml":
+                # 확장자 등록 후 저장
+                ct_xml = _add_content_types(zin.read(item), images, added_exts)
+                zout.writestr(item, ct_xml)
+                continue
+
+            _copy_raw(raw, info, zout)
+
+        # ── 2. 이미지 파일 삽입 (무압축) ────────────────────
+        for img in images:
+            media_path = f"word/media/{img['filename']}"
+            if media_path not in existing and os.path.exists(img["path"]):
+                zout.write(img["path"], media_path, compress_type=zipfile.ZIP_STORED)
+                existing.add(media_path)
+
+        # ── 3. _rels 없으면 생성 ────────────────────────────
+        if rels_xml is None:
+            rels_xml = _create_rels(images, added_rels)
+            zout.writestr("word/_rels/document.xml.rels", rels_xml)
+
+
 # ── 내부 헬퍼 ─────────────────────────────────────────────
 
 def _add_relationships(
@@ -241,21 +258,79 @@ def _add_content_types(data: bytes, images: list[dict], added_exts: set) -> byte
     return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
 
 
+def _copy_raw(raw, info: zipfile.ZipInfo, zout: zipfile.ZipFile) -> None:
+    """
+    항목의 압축 데이터를 풀지 않고 그대로 zout 에 옮긴다 (raw deflate 복사).
+    zipfile 에 공개 API 가 없어 ZipFile.write 와 같은 방식으로 로컬 헤더를
+    직접 쓰고 filelist 에 등록한다 — 중앙 디렉터리는 close() 가 기록한다.
+    """
+    raw.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, raw.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"로컬 헤더가 올바르지 않습니다: {info.filename}")
+    raw.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+    zinfo = copy.copy(info)
+    zinfo.flag_bits &= ~0x08   # 크기를 로컬 헤더에 쓰므로 데이터 디스크립터 없음
+    zinfo.extra = b""
+    with zout._lock:
+        zinfo.header_offset = zout.fp.tell()
+        zout.fp.write(zinfo.FileHeader())
+        remaining = info.compress_size
+        while remaining:
+            chunk = raw.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"압축 데이터가 잘렸습니다: {info.filename}")
+            zout.fp.write(chunk)
+            remaining -= len(chunk)
+        zout.filelist.append(zinfo)
+        zout.NameToInfo[zinfo.filename] = zinfo
+        zout.start_dir = zout.fp.tell()
+        zout._didModify = True
+
+
+def _replace_markers_stream(src, dst, id_map: dict, added_rels: dict) -> None:
+    """
+    src 를 CHUNK_SIZE 단위로 읽으며 [IMG:imageN] 마커를 교체해 dst 에 쓴다.
+    조각 끝의 닫히지 않은 "[" 이후는 마커일 수 있으므로 다음 조각 앞에 붙인다.
+    """
+    def replacer(m):
+        drawing = _drawing_for(m.group(1).decode("ascii"), id_map, added_rels)
+        return m.group(0) if drawing is None else drawing.encode("utf-8")
+
+    pending = b""
+    while chunk := src.read(CHUNK_SIZE):
+        buf = pending + chunk
+        cut = buf.rfind(b"[")
+        if cut != -1 and len(buf) - cut < _MARKER_MAX and b"]" not in buf[cut:]:
+            buf, pending = buf[:cut], buf[cut:]
+        else:
+            pending = b""
+        dst.write(_MARKER_RE.sub(replacer, buf))
+    if pending:
+        dst.write(_MARKER_RE.sub(replacer, pending))
+
+
+def _drawing_for(img_id: str, id_map: dict, added_rels: dict) -> str | None:
+    """마커 하나의 <w:drawing> (매핑 없으면 None)"""
+    img    = id_map.get(img_id)
+    rel_id = added_rels.get(img_id, "")
+    if not img or not rel_id:
+        return None
+
+    w   = img.get("width_emu",  0) or DEFAULT_WIDTH_EMU
+    h   = img.get("height_emu", 0) or DEFAULT_HEIGHT_EMU
+    num = int(img_id.replace("image", ""))
+    return _drawing_xml(rel_id, w, h, num)
+
+
 def _replace_markers(doc_xml: str, id_map: dict, added_rels: dict) -> str:
     """[IMG:imageN] 마커를 <w:drawing> XML 로 교체"""
     pattern = re.compile(r'\[IMG:(image\d+)\]')
 
     def replacer(m):
-        img_id   = m.group(1)
-        img      = id_map.get(img_id)
-        rel_id   = added_rels.get(img_id, "")
-        if not img or not rel_id:
-            return m.group(0)   # 매핑 없으면 그대로
-
-        w   = img.get("width_emu",  0) or DEFAULT_WIDTH_EMU
-        h   = img.get("height_emu", 0) or DEFAULT_HEIGHT_EMU
-        num = int(img_id.replace("image", ""))
-        return _drawing_xml(rel_id, w, h, num)
+        drawing = _drawing_for(m.group(1), id_map, added_rels)
+        return m.group(0) if drawing is None else drawing   # 매핑 없으면 그대로
 
     return pattern.sub(replacer, doc_xml)
 
@@ -391,9 +391,12 @@ const convertElement = (el, C, imgBaseDir) => {
       return [...E.bulletList(el.items || [], C), E.empty(40)];
 
     case "image": {
-      const imgPath = path.join(imgBaseDir, el.filename || "");
+      // path: image_base_dir 밖의 파일, data_b64 / data(MessagePack bin): 메모리 이미지
+      // (bridge/json_builder.py)
+      const imgPath = el.path || path.join(imgBaseDir, el.filename || "");
+      const data = el.data || (el.data_b64 ? Buffer.from(el.data_b64, "base64") : null);
       return [
-        ...E.imgReal(imgPath, el.width_emu || 0, el.height_emu || 0, el.caption || ""),
+        ...E.imgReal(imgPath, el.width_emu || 0, el.height_emu || 0, el.caption || "", data),
         E.empty(20),
       ];
     }
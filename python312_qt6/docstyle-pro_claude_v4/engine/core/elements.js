@@ -28,6 +28,19 @@ const noBdr = { style: BorderStyle.NONE, size: 0, color: "FFFFFF" };
 const solidBdr = (color, size = 2) => ({ style: BorderStyle.SINGLE, size, color });
 const thickBdr = (color, size = 20) => ({ style: BorderStyle.THICK, size, color });
 
+// 이미지 바이트 캐시 — 한 번의 렌더(여러 템플릿 포함) 동안 같은 파일은 한 번만 읽는다.
+// 렌더가 끝나면 generate.js 가 clearImageCache() 로 비운다.
+const _imageCache = new Map();
+const readImage = (imgPath) => {
+  let data = _imageCache.get(imgPath);
+  if (!data) {
+    data = fs.readFileSync(imgPath);
+    _imageCache.set(imgPath, data);
+  }
+  return data;
+};
+const clearImageCache = () => _imageCache.clear();
+
 // ─────────────────────────────────────────────
 // 기본 빌딩 블록
 // ─────────────────────────────────────────────
@@ -453,8 +466,12 @@ const imgPlaceholder = (captionText) => [
   }),
 ];
 
-const imgReal = (imgPath, widthEmu, heightEmu, captionText) => {
-  if (!fs.existsSync(imgPath)) return imgPlaceholder(captionText);
+/**
+ * @param {string} imgPath 이미지 경로 (data 가 있으면 확장자 판별에만 사용)
+ * @param {Buffer|null} data 메모리 이미지 (JSON data_b64) — 있으면 파일을 읽지 않는다
+ */
+const imgReal = (imgPath, widthEmu, heightEmu, captionText, data = null) => {
+  if (!data && !fs.existsSync(imgPath)) return imgPlaceholder(captionText);
 
   let w = widthEmu || MAX_IMG_EMU_W;
   let h = heightEmu || Math.round(MAX_IMG_EMU_W * 0.5);
@@ -467,7 +484,7 @@ const imgReal = (imgPath, widthEmu, heightEmu, captionText) => {
   const ext = path.extname(imgPath).slice(1).toLowerCase();
   const typeMap = { png: "png", jpg: "jpg", jpeg: "jpg", gif: "gif", bmp: "bmp" };
   const imgType = typeMap[ext] || "png";
-  const imgData = fs.readFileSync(imgPath);
+  const imgData = data || readImage(imgPath);
 
   // EMU → pixel (96dpi 기준: 1px = 9144 EMU)
   return [
@@ -552,6 +569,7 @@ const table3col = (headers, rows, C) => {
 module.exports = {
   PAGE_CONTENT_WIDTH, MAX_IMG_EMU_W,
   noBdr, solidBdr, thickBdr,
+  readImage, clearImageCache,
   run, para, empty, hrPara,
   bodyText, leadParagraph, sectionDivider, caption,
   chapterTitle, h1, h2, h3, coverPage,
@@ -0,0 +1,130 @@
+/**
+ * payload.js — generate.js 입력 디코딩 (JSON / MessagePack)
+ *
+ * 첫 바이트로 형식을 구분한다.
+ *   0xC1 0x01 ... — MessagePack (bridge/msgpack_codec.py)
+ *                   헤더 map 다음에 요소 map 이 끝까지 이어진다
+ *   그 외         — UTF-8 JSON
+ *
+ * 0xC1 은 MessagePack 에서 쓰지 않는 코드이고 JSON 의 첫 바이트가 될 수 없다.
+ * MessagePack 입력의 이미지 본문은 bin(el.data, Buffer) 으로 들어온다.
+ * 외부 패키지 없이 브리지가 쓰는 형식(nil · bool · int · float · str · bin ·
+ * array · map)만 읽는다.
+ */
+
+"use strict";
+
+const MAGIC_0 = 0xc1;
+const FORMAT_VERSION = 0x01;
+
+const textDecoder = new TextDecoder("utf-8");
+
+class Reader {
+  constructor(buf, pos) {
+    this.buf = buf;
+    this.view = new DataView(buf.buffer, buf.byteOffset, buf.byteLength);
+    this.pos = pos;
+  }
+
+  str(n) {
+    const start = this.pos;
+    this.pos += n;
+    return textDecoder.decode(this.buf.subarray(start, this.pos));
+  }
+
+  bin(n) {
+    const start = this.pos;
+    this.pos += n;
+    // 입력 버퍼를 공유하지 않는 복사본 (입력을 놓아도 이미지는 남는다)
+    return Buffer.from(this.buf.subarray(start, this.pos));
+  }
+
+  array(n) {
+    const out = new Array(n);
+    for (let i = 0; i < n; i++) out[i] = this.value();
+    return out;
+  }
+
+  map(n) {
+    const out = {};
+    for (let i = 0; i < n; i++) {
+      const key = this.value();
+      out[key] = this.value();
+    }
+    return out;
+  }
+
+  value() {
+    const { view } = this;
+    const c = this.buf[this.pos++];
+    if (c < 0x80) return c;
+    if (c >= 0xe0) return c - 0x100;
+    if (c >= 0xa0 && c < 0xc0) return this.str(c & 0x1f);
+    if (c >= 0x90 && c < 0xa0) return this.array(c & 0x0f);
+    if (c >= 0x80 && c < 0x90) return this.map(c & 0x0f);
+
+    let v;
+    const p = this.pos;
+    switch (c) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: this.pos += 1; return this.bin(view.getUint8(p));
+      case 0xc5: this.pos += 2; return this.bin(view.getUint16(p));
+      case 0xc6: this.pos += 4; return this.bin(view.getUint32(p));
+      case 0xca: this.pos += 4; return view.getFloat32(p);
+      case 0xcb: this.pos += 8; return view.getFloat64(p);
+      case 0xcc: this.pos += 1; return view.getUint8(p);
+      case 0xcd: this.pos += 2; return view.getUint16(p);
+      case 0xce: this.pos += 4; return view.getUint32(p);
+      case 0xcf: this.pos += 8; v = view.getBigUint64(p); return Number(v);
+      case 0xd0: this.pos += 1; return view.getInt8(p);
+      case 0xd1: this.pos += 2; return view.getInt16(p);
+      case 0xd2: this.pos += 4; return view.getInt32(p);
+      case 0xd3: this.pos += 8; v = view.getBigInt64(p); return Number(v);
+      case 0xd9: this.pos += 1; return this.str(view.getUint8(p));
+      case 0xda: this.pos += 2; return this.str(view.getUint16(p));
+      case 0xdb: this.pos += 4; return this.str(view.getUint32(p));
+      case 0xdc: this.pos += 2; return this.array(view.getUint16(p));
+      case 0xdd: this.pos += 4; return this.array(view.getUint32(p));
+      case 0xde: this.pos += 2; return this.map(view.getUint16(p));
+      case 0xdf: this.pos += 4; return this.map(view.getUint32(p));
+      default:
+        throw new Error(`지원하지 않는 MessagePack 코드 0x${c.toString(16)} (위치 ${p - 1})`);
+    }
+  }
+}
+
+/**
+ * MessagePack 입력인지 (첫 바이트)
+ * @param {Buffer} buf
+ */
+const isMsgpack = (buf) => buf.length > 0 && buf[0] === MAGIC_0;
+
+/**
+ * MessagePack 입력 → generate.js 입력 객체 ({...헤더, elements})
+ * @param {Buffer} buf
+ */
+function decodeMsgpack(buf) {
+  if (buf.length < 2 || buf[0] !== MAGIC_0 || buf[1] !== FORMAT_VERSION) {
+    throw new Error(`알 수 없는 MessagePack 입력 버전 → ${buf.length > 1 ? buf[1] : "없음"}`);
+  }
+  const reader = new Reader(buf, 2);
+  const data = reader.value();
+  const elements = [];
+  while (reader.pos < buf.length) elements.push(reader.value());
+  if (reader.pos !== buf.length) throw new Error("MessagePack 입력이 중간에 끊겼습니다");
+  data.elements = elements;
+  return data;
+}
+
+/**
+ * 입력 바이트 → generate.js 입력 객체 (JSON 또는 MessagePack)
+ * @param {Buffer} buf
+ */
+function decodeInput(buf) {
+  if (isMsgpack(buf)) return decodeMsgpack(buf);
+  return JSON.parse(buf.toString("utf-8"));
+}
+
+module.exports = { decodeInput, decodeMsgpack, isMsgpack };
@@ -3,13 +3,34 @@
  *
  * 사용법
  *   node generate.js <input.json> <output.docx> --template <id>
+ *   node generate.js <input.json> <output_dir> --templates <id,id,...> [--prefix <name>]
+ *   (공통 옵션 --timings)
+ *
+ * 입력 경로가 "-" 이면 stdin 에서 JSON 을 읽는다. (임시 파일 없는 파이프 전송)
+ * 입력은 JSON 또는 MessagePack — 첫 바이트로 구분한다 (core/payload.js).
+ * 단일 템플릿 모드에서 출력 경로가 "-" 이면 .docx 바이트를 stdout 으로 보내고
+ * 로그는 모두 stderr 로 보낸다.
  *
  * 예시
  *   node generate.js ../temp/input.json ../temp/output.docx --template 01
+ *   node generate.js ../temp/input.json ../output --templates 01,05,23 --prefix essay
+ *     → ../output/essay_t01.docx, essay_t05.docx, essay_t23.docx
+ *   python build.py | node generate.js - ../temp/output.docx --template 01
+ *   node generate.js - - --template 01 < input.json > output.docx
+ *
+ * --templates 모드는 입력을 한 번만 읽고 한 프로세스에서 모든 문서를 빌드한 뒤
+ * 패킹·저장을 동시에 진행한다.
+ *
+ * --timings 를 주면 끝에 stderr 로 단계별 측정값 한 줄을 남긴다.
+ *   DOCSTYLE_TIMINGS {"engine_spawn": {...}, "engine_build": {...}, "pack": {...}}
+ *   각 항목은 {wall_ms, cpu_ms, peak_rss_kb} (bridge/timings.py 와 같은 형식)
  *
  * 종료 코드
  *   0 — 성공
  *   1 — 인자 오류 또는 실행 오류
+ *
+ * 모듈로 require 하면 CLI 는 실행되지 않고 렌더 함수만 내보낸다.
+ * (상주 워커 worker.js 가 사용)
  */
 
 "use strict";
@@ -19,6 +40,8 @@ const path = require("path");
 const { Packer } = require("docx");
 
 const { build } = require("./core/builder");
+const { decodeInput } = require("./core/payload");
+const { clearImageCache } = require("./core/elements");
 
 // ─────────────────────────────────────────────
 // 템플릿 레지스트리
@@ -80,16 +103,175 @@ const TEMPLATE_REGISTRY = {
   "50": "./templates/template_50_ngo_report",
 };
 
+// ─────────────────────────────────────────────
+// 단계 측정
+// ─────────────────────────────────────────────
+
+/** 측정 시작 → 끝낼 때 호출하는 함수를 돌려준다. 같은 이름이면 합산. */
+function startStage(timings, name) {
+  const wall0 = process.hrtime.bigint();
+  const cpu0 = process.cpuUsage();
+  return () => {
+    if (!timings) return;
+    const cpu = process.cpuUsage(cpu0);
+    const prev = timings[name] || { wall_ms: 0, cpu_ms: 0 };
+    timings[name] = {
+      wall_ms: prev.wall_ms + Number(process.hrtime.bigint() - wall0) / 1e6,
+      cpu_ms: prev.cpu_ms + (cpu.user + cpu.system) / 1000,
+      peak_rss_kb: process.resourceUsage().maxRSS,
+    };
+  };
+}
+
+// ─────────────────────────────────────────────
+// 템플릿 로드 / 렌더
+// ─────────────────────────────────────────────
+
+/** "1" · "01" · "001" → "01" */
+function normalizeTemplateId(raw) {
+  return String(raw).replace(/^0*/, "").padStart(2, "0");
+}
+
+/**
+ * 템플릿 색상 객체 C 를 반환한다.
+ * require 캐시 덕분에 모듈은 프로세스당 한 번만 로드되고,
+ * build() 가 C 를 덮어쓰므로 호출마다 얕은 복사본을 돌려준다.
+ */
+function loadTemplate(templateId) {
+  const rel = TEMPLATE_REGISTRY[templateId];
+  if (!rel) throw new Error(`존재하지 않는 템플릿 ID → ${templateId}`);
+  const { C } = require(path.resolve(__dirname, rel));
+  return { ...C };
+}
+
+/**
+ * 입력 데이터 → .docx 바이트
+ *
+ * @param {Object} data        generate.js 입력 JSON 객체
+ * @param {string} templateId  "01" ~ "50"
+ * @param {Object} [timings]   주면 engine_build / pack 측정값을 채운다
+ * @returns {Promise<Buffer>}
+ */
+async function renderBuffer(data, templateId, timings) {
+  try {
+    const C = loadTemplate(templateId);
+    let done = startStage(timings, "engine_build");
+    const doc = build(data, C);
+    done();
+
+    done = startStage(timings, "pack");
+    const buffer = await Packer.toBuffer(doc);
+    done();
+    return buffer;
+  } finally {
+    clearImageCache();
+  }
+}
+
+/**
+ * 입력 데이터 → .docx 파일 저장
+ *
+ * @param {Object} data        generate.js 입력 JSON 객체
+ * @param {string} templateId  "01" ~ "50"
+ * @param {string} outputPath  결과 .docx 경로
+ * @returns {Promise<{output_path: string, element_count: number, timings: Object}>}
+ */
+async function renderDocument(data, templateId, outputPath) {
+  const timings = {};
+  const buffer = await renderBuffer(data, templateId, timings);
+
+  const done = startStage(timings, "pack");   // 파일 저장은 pack 에 포함
+  const outDir = path.dirname(outputPath);
+  if (!fs.existsSync(outDir)) fs.mkdirSync(outDir, { recursive: true });
+  fs.writeFileSync(outputPath, buffer);
+  done();
+
+  return { output_path: outputPath, element_count: (data.elements || []).length, timings };
+}
+
+/** 다중 템플릿 모드의 출력 파일 경로 */
+function multiOutputPath(outputDir, prefix, templateId) {
+  return path.join(outputDir, `${prefix}_t${templateId}.docx`);
+}
+
+/**
+ * 같은 입력 데이터를 여러 템플릿으로 렌더한다.
+ * 빌드를 모두 순서대로 끝낸 뒤(이미지 바이트는 공유 캐시) 패킹·저장을 동시에 진행.
+ * 한 템플릿이 실패해도 나머지는 계속 만든다.
+ *
+ * timings 를 주면 engine_build(합계)와 pack(동시 진행 전체 구간)을 채운다.
+ *
+ * @returns {Promise<Array<{template, output_path, ok, error?}>>}
+ */
+async function renderMany(data, templateIds, outputDir, prefix = "docstyle", timings = null) {
+  fs.mkdirSync(outputDir, { recursive: true });
+
+  try {
+    // 1) 빌드 — 순서대로
+    const buildDone = startStage(timings, "engine_build");
+    const built = templateIds.map((templateId) => {
+      const outputPath = multiOutputPath(outputDir, prefix, templateId);
+      try {
+        return { templateId, outputPath, doc: build(data, loadTemplate(templateId)) };
+      } catch (err) {
+        return { templateId, outputPath, error: err.message };
+      }
+    });
+    buildDone();
+
+    // 2) 패킹·저장 — 동시에
+    const packDone = startStage(timings, "pack");
+    const results = await Promise.all(built.map(({ templateId, outputPath, doc, error }) => {
+      if (error) {
+        return Promise.resolve({ template: templateId, output_path: outputPath, ok: false, error });
+      }
+      return Packer.toBuffer(doc)
+        .then((buffer) => fs.promises.writeFile(outputPath, buffer))
+        .then(() => ({ template: templateId, output_path: outputPath, ok: true }))
+        .catch((err) => ({ template: templateId, output_path: outputPath, ok: false, error: err.message }));
+    }));
+    packDone();
+    return results;
+  } finally {
+    clearImageCache();
+  }
+}
+
+// ─────────────────────────────────────────────
+// stdin / stdout
+// ─────────────────────────────────────────────
+const STDIO = "-";
+
+async function readStdin() {
+  const chunks = [];
+  for await (const chunk of process.stdin) chunks.push(chunk);
+  return Buffer.concat(chunks);
+}
+
+function writeStdout(buffer) {
+  return new Promise((resolve, reject) => {
+    process.stdout.write(buffer, (err) => (err ? reject(err) : resolve()));
+  });
+}
+
 // ─────────────────────────────────────────────
 // CLI 인자 파싱
 // ─────────────────────────────────────────────
 function parseArgs(argv) {
   const args = argv.slice(2);
-  const result = { inputPath: null, outputPath: null, templateId: "01" };
+  const result = {
+    inputPath: null, outputPath: null, templateId: "01", templateIds: null, prefix: "docstyle", timings: false,
+  };
 
   for (let i = 0; i < args.length; i++) {
     if (args[i] === "--template" && args[i + 1]) {
-      result.templateId = args[++i].replace(/^0*/, "").padStart(2, "0");
+      result.templateId = normalizeTemplateId(args[++i]);
+    } else if (args[i] === "--templates" && args[i + 1]) {
+      result.templateIds = args[++i].split(",").filter(Boolean).map(normalizeTemplateId);
+    } else if (args[i] === "--prefix" && args[i + 1]) {
+      result.prefix = args[++i];
+    } else if (args[i] === "--timings") {
+      result.timings = true;
     } else if (!result.inputPath) {
       result.inputPath = args[i];
     } else if (!result.outputPath) {
@@ -104,7 +286,10 @@ function parseArgs(argv) {
 // 메인
 // ─────────────────────────────────────────────
 async function main() {
-  const { inputPath, outputPath, templateId } = parseArgs(process.argv);
+  const { inputPath, outputPath, templateId, templateIds, prefix, timings: wantTimings } = parseArgs(process.argv);
+  const reportTimings = (timings) => {
+    if (wantTimings) console.error(`DOCSTYLE_TIMINGS ${JSON.stringify(timings)}`);
+  };
 
   // 인자 검증
   if (!inputPath || !outputPath) {
@@ -112,61 +297,98 @@ async function main() {
     process.exit(1);
   }
 
-  if (!fs.existsSync(inputPath)) {
+  if (inputPath !== STDIO && !fs.existsSync(inputPath)) {
     console.error(`오류: 입력 파일을 찾을 수 없습니다 → ${inputPath}`);
     process.exit(1);
   }
 
-  if (!TEMPLATE_REGISTRY[templateId]) {
+  if (outputPath === STDIO && templateIds) {
+    console.error("오류: --templates 모드는 출력 디렉터리가 필요합니다 (\"-\" 불가)");
+    process.exit(1);
+  }
+
+  // stdout 으로 문서를 보낼 때는 로그가 바이트에 섞이지 않도록
+  if (outputPath === STDIO) console.log = (...args) => console.error(...args);
+
+  // 다중 템플릿 모드는 잘못된 ID 만 실패로 보고하고 나머지는 계속 만든다
+  if (!templateIds && !TEMPLATE_REGISTRY[templateId]) {
     console.error(`오류: 존재하지 않는 템플릿 ID → ${templateId}`);
     console.error(`사용 가능한 템플릿: ${Object.keys(TEMPLATE_REGISTRY).join(", ")} (01~20)`);
     process.exit(1);
   }
 
-  // 입력 JSON 파싱
+  // 입력 파싱 (JSON / MessagePack)
   let data;
   try {
-    const raw = fs.readFileSync(inputPath, "utf-8");
-    data = JSON.parse(raw);
+    const raw = inputPath === STDIO ? await readStdin() : fs.readFileSync(inputPath);
+    data = decodeInput(raw);
   } catch (err) {
-    console.error(`오류: JSON 파싱 실패 → ${err.message}`);
+    console.error(`오류: 입력 파싱 실패 → ${err.message}`);
     process.exit(1);
   }
 
-  // 템플릿 로드
-  const templatePath = path.resolve(__dirname, TEMPLATE_REGISTRY[templateId]);
-  const { C } = require(templatePath);
+  // 프로세스 시작 → 모듈 로드 → 입력 수신까지를 engine_spawn 으로 본다
+  const cpu = process.cpuUsage();
+  const timings = {
+    engine_spawn: {
+      wall_ms: process.uptime() * 1000,
+      cpu_ms: (cpu.user + cpu.system) / 1000,
+      peak_rss_kb: process.resourceUsage().maxRSS,
+    },
+  };
+
+  // 다중 템플릿 모드
+  if (templateIds) {
+    console.log(`[DocStyle Pro] 템플릿: ${templateIds.join(", ")}`);
+    console.log(`[DocStyle Pro] 입력:   ${inputPath}`);
+    console.log(`[DocStyle Pro] 출력:   ${outputPath}`);
+    const results = await renderMany(data, templateIds, outputPath, prefix, timings);
+    reportTimings(timings);
+    let failed = 0;
+    for (const r of results) {
+      if (r.ok) {
+        console.log(`[DocStyle Pro] ✅ 완료 → ${r.output_path}`);
+      } else {
+        failed += 1;
+        console.error(`오류: 템플릿 ${r.template} 생성 실패 → ${r.error}`);
+      }
+    }
+    if (failed) process.exit(1);
+    return;
+  }
+
+  const C = loadTemplate(templateId);
 
   console.log(`[DocStyle Pro] 템플릿: ${C.NAME} (${templateId})`);
   console.log(`[DocStyle Pro] 입력:   ${inputPath}`);
   console.log(`[DocStyle Pro] 출력:   ${outputPath}`);
   console.log(`[DocStyle Pro] 요소 수: ${(data.elements || []).length}개`);
 
-  // 문서 빌드
-  let doc;
+  // 문서 빌드 + 파일 저장 (또는 stdout)
   try {
-    doc = build(data, C);
+    if (outputPath === STDIO) {
+      await writeStdout(await renderBuffer(data, templateId, timings));
+      console.log("[DocStyle Pro] ✅ 완료 → stdout");
+    } else {
+      const result = await renderDocument(data, templateId, outputPath);
+      Object.assign(timings, result.timings);
+      console.log(`[DocStyle Pro] ✅ 완료 → ${outputPath}`);
+    }
+    reportTimings(timings);
   } catch (err) {
-    console.error(`오류: 문서 빌드 실패 → ${err.stack}`);
+    console.error(`오류: 문서 생성 실패 → ${err.stack}`);
     process.exit(1);
   }
+}
 
-  // 출력 디렉터리 생성
-  const outDir = path.dirname(outputPath);
-  if (!fs.existsSync(outDir)) fs.mkdirSync(outDir, { recursive: true });
+module.exports = {
+  TEMPLATE_REGISTRY, normalizeTemplateId, loadTemplate,
+  renderBuffer, renderDocument, renderMany, multiOutputPath,
+};
 
-  // 파일 저장
-  try {
-    const buffer = await Packer.toBuffer(doc);
-    fs.writeFileSync(outputPath, buffer);
-    console.log(`[DocStyle Pro] ✅ 완료 → ${outputPath}`);
-  } catch (err) {
-    console.error(`오류: 파일 저장 실패 → ${err.message}`);
+if (require.main === module) {
+  main().catch((err) => {
+    console.error(`예기치 않은 오류: ${err.message}`);
     process.exit(1);
-  }
+  });
 }
-
-main().catch((err) => {
-  console.error(`예기치 않은 오류: ${err.message}`);
-  process.exit(1);
-});
@@ -0,0 +1,129 @@
+/**
+ * worker.js — DocStyle Pro 상주 렌더 워커
+ *
+ * generate.js 는 변환마다 새 프로세스를 띄워 docx 패키지와 템플릿을
+ * 다시 로드한다. 이 워커는 한 번 떠서 stdin/stdout 으로 줄 단위
+ * JSON-RPC 요청을 계속 처리한다. (bridge/engine_pool.py 가 관리)
+ *
+ * 프로토콜 (한 줄 = JSON 하나)
+ *   요청  {"id": 1, "method": "render", "params": {...}}
+ *   응답  {"id": 1, "result": {...}}
+ *         {"id": 1, "error": {"message": "..."}}
+ *
+ * 메서드
+ *   ping      → {pid, uptime_ms, rendered, templates}
+ *   render    params {input_path | data, output_path, template}
+ *             → {output_path, element_count, timings}
+ *   render_many  params {input_path | data, output_dir, templates, prefix}
+ *             → {results: [{template, output_path, ok, error?}], timings}
+ *
+ * timings 는 {engine_build, pack} 단계별 {wall_ms, cpu_ms, peak_rss_kb}
+ *   shutdown  → {} 응답 후 종료
+ *
+ * stdout 은 응답 전용이므로 로그는 모두 stderr 로 보낸다.
+ */
+
+"use strict";
+
+const fs = require("fs");
+const readline = require("readline");
+
+const {
+  TEMPLATE_REGISTRY, normalizeTemplateId, renderDocument, renderMany,
+} = require("./generate");
+const { decodeInput } = require("./core/payload");
+
+// 빌더/템플릿 코드의 console.log 가 프로토콜을 깨뜨리지 않도록
+console.log = (...args) => console.error(...args);
+
+let rendered = 0;
+const loadedTemplates = new Set();
+
+// ─────────────────────────────────────────────
+// 메서드 구현
+// ─────────────────────────────────────────────
+const readInput = (params) => {
+  if (params.data) return params.data;
+  if (!params.input_path || !fs.existsSync(params.input_path)) {
+    throw new Error(`입력 파일을 찾을 수 없습니다 → ${params.input_path}`);
+  }
+  return decodeInput(fs.readFileSync(params.input_path));
+};
+
+const METHODS = {
+  ping: async () => ({
+    pid: process.pid,
+    uptime_ms: Math.round(process.uptime() * 1000),
+    rendered,
+    templates: loadedTemplates.size,
+  }),
+
+  render: async (params) => {
+    const templateId = normalizeTemplateId(params.template || "01");
+    if (!TEMPLATE_REGISTRY[templateId]) {
+      throw new Error(`존재하지 않는 템플릿 ID → ${templateId}`);
+    }
+    if (!params.output_path) throw new Error("output_path 가 없습니다");
+
+    const data = readInput(params);
+    const result = await renderDocument(data, templateId, params.output_path);
+    loadedTemplates.add(templateId);
+    rendered += 1;
+    return result;
+  },
+
+  render_many: async (params) => {
+    const templateIds = (params.templates || []).map(normalizeTemplateId);
+    if (!params.output_dir) throw new Error("output_dir 가 없습니다");
+
+    const data = readInput(params);
+    const timings = {};
+    const results = await renderMany(data, templateIds, params.output_dir, params.prefix || "docstyle", timings);
+    for (const r of results) {
+      if (r.ok) {
+        loadedTemplates.add(r.template);
+        rendered += 1;
+      }
+    }
+    return { results, timings };
+  },
+
+  shutdown: async () => {
+    setImmediate(() => process.exit(0));
+    return {};
+  },
+};
+
+// ─────────────────────────────────────────────
+// 요청 루프 — 한 번에 하나씩 순서대로 처리
+// ─────────────────────────────────────────────
+const send = (msg) => process.stdout.write(JSON.stringify(msg) + "\n");
+
+const handle = async (line) => {
+  if (!line.trim()) return;
+
+  let req;
+  try {
+    req = JSON.parse(line);
+  } catch (err) {
+    send({ id: null, error: { message: `요청 JSON 파싱 실패 → ${err.message}` } });
+    return;
+  }
+
+  const method = METHODS[req.method];
+  if (!method) {
+    send({ id: req.id, error: { message: `알 수 없는 메서드 → ${req.method}` } });
+    return;
+  }
+
+  try {
+    send({ id: req.id, result: await method(req.params || {}) });
+  } catch (err) {
+    send({ id: req.id, error: { message: err.message, stack: err.stack } });
+  }
+};
+
+let queue = Promise.resolve();
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+rl.on("line", (line) => { queue = queue.then(() => handle(line)); });
+rl.on("close", () => { queue.then(() => process.exit(0)); });
@@ -1255,6 +1255,7 @@ class MainWindow(QMainWindow):
                         element_count=result.element_count,
                         image_count=result.image_count,
                         template_id=result.template_id,
+                        timings=result.timings,
                     )
                     self._left.drop_zone.set_loaded(
                         self._loaded_path, result.image_count
@@ -3,6 +3,7 @@ preview_panel.py — DocStyle Pro 결과 미리보기 패널
 
 기능
     - 변환 완료 후 결과 정보 표시 (요소 수 · 이미지 수 · 파일 크기)
+    - 단계별 소요 시간 (ConvertResult.timings)
     - 선택된 템플릿의 색상 팔레트를 시각적으로 표시
     - 파일 저장 (다른 이름으로 저장) 버튼
     - 파일 탐색기에서 열기 버튼
@@ -32,6 +33,7 @@ from PyQt6.QtWidgets import (
     QListWidgetItem,
 )
 
+from bridge.timings import STAGES
 from .template_selector import TEMPLATES
 
 
@@ -115,6 +117,74 @@ def _stat_card(label: str, value: str, accent: str) -> QWidget:
     return card
 
 
+# ─────────────────────────────────────────────
+# 단계별 시간 카드
+# ─────────────────────────────────────────────
+
+_STAGE_LABELS = {
+    "cache_lookup":   "캐시 조회",
+    "parse":          "파싱",
+    "extract_images": "이미지 추출",
+    "optimize_images": "이미지 축소",
+    "serialize":      "JSON 직렬화",
+    "engine_spawn":   "엔진 기동",
+    "engine_build":   "문서 빌드",
+    "pack":           "패킹 · 저장",
+    "cleanup":        "정리",
+}
+
+
+def _timings_card(timings: dict, accent: str) -> QWidget:
+    """단계별 wall 시간 막대 + 최대 RSS"""
+    card = QFrame()
+    card.setStyleSheet(
+        "QFrame { border: 1px solid #E2E8F0; border-radius: 12px; background: #F8FAFC; }"
+    )
+    lay = QVBoxLayout(card)
+    lay.setContentsMargins(12, 10, 12, 10)
+    lay.setSpacing(4)
+
+    total = timings.get("total", {})
+    title = QLabel(f"단계별 시간  ·  총 {total.get('wall_ms', 0):.0f}ms")
+    title.setFont(QFont("Arial", 8, QFont.Weight.Bold))
+    title.setStyleSheet("color: #94A3B8; border: none; background: transparent;")
+    lay.addWidget(title)
+
+    stages = [(k, v) for k, v in timings.items() if k != "total" and v]
+    longest = max((v["wall_ms"] for _, v in stages), default=0) or 1
+    for name, t in sorted(stages, key=lambda kv: STAGES.index(kv[0]) if kv[0] in STAGES else len(STAGES)):
+        row = QHBoxLayout()
+        row.setSpacing(6)
+
+        key_lbl = QLabel(_STAGE_LABELS.get(name, name))
+        key_lbl.setFont(QFont("Arial", 8))
+        key_lbl.setFixedWidth(70)
+        key_lbl.setStyleSheet("color: #475569; border: none; background: transparent;")
+
+        bar = QFrame()
+        bar.setFixedHeight(6)
+        bar.setFixedWidth(max(2, int(90 * t["wall_ms"] / longest)))
+        bar.setStyleSheet(f"background: {accent}; border: none; border-radius: 3px;")
+
+        val_lbl = QLabel(f"{t['wall_ms']:.0f}ms")
+        val_lbl.setFont(QFont("Arial", 8))
+        val_lbl.setStyleSheet("color: #64748B; border: none; background: transparent;")
+        tip = f"wall {t['wall_ms']:.1f}ms"
+        if t.get("cpu_ms") is not None:
+            tip += f" · CPU {t['cpu_ms']:.1f}ms"
+        if t.get("peak_rss_kb"):
+            tip += f" · 최대 RSS {t['peak_rss_kb'] // 1024}MB"
+        for w in (key_lbl, bar, val_lbl):
+            w.setToolTip(tip)
+
+        row.addWidget(key_lbl)
+        row.addWidget(bar)
+        row.addStretch()
+        row.addWidget(val_lbl)
+        lay.addLayout(row)
+    return card
+
+
 # ─────────────────────────────────────────────
 # 미리보기 패널
 # ─────────────────────────────────────────────
@@ -219,6 +289,7 @@ class PreviewPanel(QWidget):
         element_count: int,
         image_count: int,
         template_id: str,
+        timings: dict | None = None,
     ):
         """변환 완료 화면"""
         self._clear_layout()
@@ -270,6 +341,10 @@ class PreviewPanel(QWidget):
         fname_lbl.setWordWrap(True)
         self._layout.addWidget(fname_lbl)
 
+        # ── 단계별 시간 ───────────────────────
+        if timings:
+            self._layout.addWidget(_timings_card(timings, accent))
+
         # ── 버튼 ─────────────────────────────
         self._open_btn = self._make_btn("📂  파일 위치 열기", "#64748B", primary=False)
 
@@ -332,8 +407,9 @@ class PreviewPanel(QWidget):
         element_count: int,
         image_count: int,
         template_id: str,
+        timings: dict | None = None,
     ):
-        self._show_result(output_path, element_count, image_count, template_id)
+        self._show_result(output_path, element_count, image_count, template_id, timings)
 
     def reset(self):
         self._output_path = ""
@@ -83,6 +83,7 @@ class ConvertWorker(QThread):
             chapter_override=self._chapter_override,
             custom_settings=self._custom_settings,
             progress_callback=_cb,
+            engine="pool",
         )
 
         if self._stop_flag:
@@ -0,0 +1,187 @@
+"""
+book.py — 챕터별 .md 원고를 한 권의 ParsedDocument 로 조립
+
+    book = parse_book("book.json")
+    book = parse_book(["ch01.md", "ch02.md", ...], workers=4)
+    book.chapters[2].meta.title, book.elements[book.chapters[2].start]
+
+매니페스트
+    - 챕터 경로 목록 (list / tuple)
+    - dict  {"title", "author", "chapter", "sub", "chapters": [경로, ...]}
+    - 파일  .json (위 dict 또는 경로 배열) / 그 밖에는 한 줄에 경로 하나 (# 주석)
+    - 디렉터리  안의 *.md 를 파일명 순서로
+    파일 매니페스트의 상대 경로는 매니페스트 위치 기준, 그 밖에는 현재 디렉터리 기준.
+
+- 챕터마다 parse_md 결과를 (경로, mtime, 크기, 참조 이미지 상태) 키로 캐시한다
+  (parse_cache.ParseCache — 기본 256개, DOCSTYLE_PARSE_CACHE_DIR 면 디스크 계층도).
+  40개 챕터 중 하나만 고치면 그 챕터만 다시 파싱한다.
+- 캐시에 없는 챕터가 둘 이상이면 ProcessPoolExecutor 로 병렬 파싱한다.
+- 챕터의 [image] 는 각 챕터 파일의 디렉터리에서 찾는다. 합친 문서의
+  image_base_dir 는 첫 챕터 기준이고, 다른 디렉터리의 이미지는
+  json_builder 가 경로(path)를 따로 넘긴다.
+- 합친 문서의 요소 리스트는 새로 만들지만 요소 객체는 캐시와 공유한다
+  (수정하지 말 것).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Union
+
+from .md_parser import list_image_refs, parse_md
+from .models import ChapterInfo, DocMeta, ParsedDocument
+from .parse_cache import ParseCache, file_states
+
+
+_DEFAULT_CACHE_ENTRIES = 256
+
+BookManifest = Union[str, os.PathLike, dict, Iterable]
+
+
+# ─────────────────────────────────────────────
+# 매니페스트
+# ─────────────────────────────────────────────
+
+def read_book_manifest(manifest: BookManifest) -> tuple[list[Path], dict]:
+    """
+    매니페스트 → (챕터 절대 경로 목록, 책 메타 dict)
+
+    책 메타 dict 는 title / author / chapter / sub 중 매니페스트에 있는 것만 담는다.
+    """
+    base = Path.cwd()
+    if isinstance(manifest, (str, os.PathLike)):
+        path = Path(manifest)
+        if path.is_dir():
+            chapters = [
+                p for p in sorted(path.glob("*.md"))
+                if p.is_file() and not p.name.startswith(("~$", "."))
+            ]
+            return [p.resolve() for p in chapters], {}
+        if not path.exists():
+            raise FileNotFoundError(f"매니페스트를 찾을 수 없습니다: {path}")
+        base = path.resolve().parent
+        text = path.read_text(encoding="utf-8")
+        if path.suffix.lower() == ".json":
+            manifest = json.loads(text)
+        else:
+            manifest = [
+                line.strip() for line in text.splitlines()
+                if line.strip() and not line.strip().startswith("#")
+            ]
+
+    info: dict = {}
+    if isinstance(manifest, dict):
+        info = {k: str(manifest[k]) for k in ("title", "author", "chapter", "sub") if manifest.get(k)}
+        entries = manifest.get("chapters", [])
+    else:
+        entries = manifest
+    chapters = [(base / Path(e)).resolve() for e in entries]
+    if not chapters:
+        raise ValueError("매니페스트에 챕터가 없습니다")
+    return chapters, info
+
+
+# ─────────────────────────────────────────────
+# 챕터 캐시
+# ─────────────────────────────────────────────
+
+_cache: ParseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_chapter_cache() -> ParseCache:
+    """parse_book 챕터 캐시 (프로세스 전역)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ParseCache(
+                max_entries=_DEFAULT_CACHE_ENTRIES,
+                disk_dir=os.getenv("DOCSTYLE_PARSE_CACHE_DIR") or None,
+            )
+        return _cache
+
+
+def _parse_chapter(path: str) -> ParsedDocument:
+    """챕터 하나 파싱 (워커 프로세스에서 실행 — 모듈 최상위 함수여야 함)"""
+    return parse_md(path, image_dir=str(Path(path).parent))
+
+
+# ─────────────────────────────────────────────
+# 조립
+# ─────────────────────────────────────────────
+
+def parse_book(
+    manifest: BookManifest,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    cache: ParseCache | None = None,
+) -> ParsedDocument:
+    """
+    챕터 .md 들을 파싱해 한 권으로 합친다.
+
+    Parameters
+    ----------
+    manifest : 챕터 목록 / 매니페스트 dict · 파일 / 디렉터리 (모듈 설명 참고)
+    workers  : 병렬 파싱 프로세스 수 (기본 CPU 수). 1 이면 현재 프로세스에서만
+    executor : 재사용할 Executor (편집기처럼 parse_book 을 자주 부를 때 —
+               주면 workers 는 무시하고 종료도 호출자가 한다)
+    cache    : 챕터 캐시 (기본 get_chapter_cache())
+
+    Returns
+    -------
+    ParsedDocument — chapters 에 챕터별 DocMeta 와 elements 구간
+
+    Raises
+    ------
+    FileNotFoundError : 매니페스트나 챕터 파일이 없을 때
+    ValueError        : 챕터가 하나도 없을 때
+    """
+    paths, info = read_book_manifest(manifest)
+    for p in paths:
+        if not p.is_file():
+            raise FileNotFoundError(f"챕터 파일을 찾을 수 없습니다: {p}")
+
+    cache = cache or get_chapter_cache()
+    keys = [cache.make_key(str(p), "md", file_states(list_image_refs(str(p)))) for p in paths]
+    docs: list[ParsedDocument | None] = [cache.get(k) for k in keys]
+    missing = [i for i, d in enumerate(docs) if d is None]
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    if len(missing) > 1 and (executor is not None or workers > 1):
+        ex = executor or ProcessPoolExecutor(max_workers=min(workers, len(missing)))
+        try:
+            parsed = list(ex.map(_parse_chapter, [str(paths[i]) for i in missing]))
+        finally:
+            if executor is None:
+                ex.shutdown()
+    else:
+        parsed = [_parse_chapter(str(paths[i])) for i in missing]
+    for i, doc in zip(missing, parsed):
+        cache.put(keys[i], doc)
+        docs[i] = doc
+
+    elements: list = []
+    chapters: list[ChapterInfo] = []
+    for p, doc in zip(paths, docs):
+        start = len(elements)
+        elements.extend(doc.elements)
+        chapters.append(ChapterInfo(path=str(p), meta=doc.meta, start=start, end=len(elements)))
+
+    first = docs[0].meta
+    meta = DocMeta(
+        title=info.get("title", first.title),
+        author=info.get("author", first.author),
+        chapter=info.get("chapter", ""),
+        sub=info.get("sub", ""),
+    )
+    return ParsedDocument(
+        meta=meta,
+        elements=elements,
+        image_map={},
+        image_base_dir=docs[0].image_base_dir,
+        chapters=chapters,
+    )
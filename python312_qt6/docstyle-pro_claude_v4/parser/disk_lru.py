@@ -0,0 +1,61 @@
+"""
+disk_lru.py — 디스크 캐시 공용 용량 관리
+
+변환 캐시(bridge/convert_cache.py), 이미지 축소 결과(bridge/image_optimizer.py),
+이미지 저장소(parser/image_store.py)가 같은 방식으로 용량을 지킨다.
+
+    max_bytes = env_mb("DOCSTYLE_CACHE_MAX_MB", 512)
+    evict_lru(root.glob("*.docx"), max_bytes, remove=_remove_entry)
+
+- 파일 총 크기가 max_bytes 를 넘으면 mtime 이 가장 오래된(가장 오래 쓰지 않은)
+  파일부터 지운다. 적중할 때 mtime 을 갱신하는 것은 각 캐시의 몫이다.
+- keep(stat) 이 참인 파일(예: 아직 참조 중인 이미지)은 크기에만 세고 지우지 않는다.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+def env_mb(name: str, default_mb: int) -> int:
+    """환경 변수의 MB 값 → 바이트. 비었거나 숫자가 아니거나 음수면 default_mb (0 은 그대로)"""
+    try:
+        mb = int(os.getenv(name, ""))
+    except ValueError:
+        mb = default_mb
+    if mb < 0:
+        mb = default_mb
+    return mb * 1024 * 1024
+
+
+def _unlink(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+def evict_lru(
+    paths: Iterable[Path],
+    max_bytes: int,
+    keep: Callable[[os.stat_result], bool] | None = None,
+    remove: Callable[[Path], None] = _unlink,
+) -> None:
+    """paths 의 총 크기가 max_bytes 를 넘으면 mtime 이 오래된 파일부터 remove 한다"""
+    entries = []
+    total = 0
+    for f in paths:
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        total += st.st_size
+        if keep is None or not keep(st):
+            entries.append((st.st_mtime_ns, st.st_size, f))
+    if total <= max_bytes:
+        return
+    entries.sort()
+    for _, size, f in entries:
+        if total <= max_bytes:
+            break
+        remove(f)
+        total -= size
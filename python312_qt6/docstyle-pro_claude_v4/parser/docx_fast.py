@@ -0,0 +1,346 @@
+"""
+docx_fast.py — python-docx 객체 없이 lxml 로 .docx 를 직접 읽는 파싱 경로
+
+python-docx 경로는 본문 블록마다 Paragraph / Table 래퍼를 만들고, 분류할 때
+단락마다 스타일을 다시 조회하고 find / findall 을 여러 번 돈다.
+이 경로는
+
+    - 패키지 관계(_rels/.rels, word/_rels/document.xml.rels)로 본문 · 스타일 ·
+      코어 속성 파트와 이미지 관계(rId → 파일명)를 한 번 읽고
+    - styles.xml 로 styleId → 스타일 이름(소문자) 표를 미리 만든 뒤
+    - word/document.xml 을 lxml.etree.iterparse 로 흘려 읽으며 body 의
+      w:p / w:tbl 을 하나씩 처리하고 바로 비운다 (문서 크기와 무관한 메모리)
+
+단락은 자식을 한 번 훑어 ParagraphFeatures 를 만들고, 분류 규칙은
+structure_analyzer.classify_features 를 그대로 쓴다. 값은 python-docx 가
+읽는 방식(스타일 기본값, w:br 종류, 측정 단위 변환 등)을 그대로 따라
+두 경로의 결과가 같아야 한다. 세로 병합(w:vMerge) 이 있는 표만 python-docx
+의 병합 셀 해석을 쓰려고 그 표 조각을 python-docx 객체로 읽는다.
+
+    pkg = DocxPackage(zf)
+    for block in pkg.iter_blocks():   # ParagraphFeatures | 표 행 목록
+        ...
+"""
+
+from __future__ import annotations
+
+import posixpath
+import zipfile
+from typing import Iterator
+
+import docx.table
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.simpletypes import ST_HpsMeasure, ST_OnOff, ST_SignedTwipsMeasure
+from docx.parts.styles import StylesPart
+from lxml import etree
+
+from .models import DocMeta
+from .structure_analyzer import ParagraphFeatures, clean_text, table_rows
+
+
+# ─────────────────────────────────────────────
+# 태그 / 속성 이름
+# ─────────────────────────────────────────────
+
+_W   = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R   = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_WP  = "{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}"
+_A   = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_PR  = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_CTN = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+_DC  = "{http://purl.org/dc/elements/1.1/}"
+
+W_BODY, W_P, W_TBL, W_TR, W_TC = _W + "body", _W + "p", _W + "tbl", _W + "tr", _W + "tc"
+W_R, W_HYPERLINK, W_PPR, W_RPR = _W + "r", _W + "hyperlink", _W + "pPr", _W + "rPr"
+W_PSTYLE, W_IND, W_SZ, W_B     = _W + "pStyle", _W + "ind", _W + "sz", _W + "b"
+W_NUMPR, W_DRAWING             = _W + "numPr", _W + "drawing"
+W_TCPR, W_GRIDSPAN, W_VMERGE   = _W + "tcPr", _W + "gridSpan", _W + "vMerge"
+W_STYLE, W_NAME                = _W + "style", _W + "name"
+W_VAL, W_TYPE, W_LEFT          = _W + "val", _W + "type", _W + "left"
+W_STYLE_ID, W_DEFAULT          = _W + "styleId", _W + "default"
+
+# 런 안의 텍스트 요소 (python-docx CT_R.text 와 같은 대응)
+W_T, W_TAB, W_BR, W_CR = _W + "t", _W + "tab", _W + "br", _W + "cr"
+_RUN_CHARS = {W_TAB: "\t", W_CR: "\n", _W + "noBreakHyphen": "-", _W + "ptab": "\t"}
+
+WP_EXTENT, A_BLIP, R_EMBED = _WP + "extent", _A + "blip", _R + "embed"
+
+# python-docx 와 같은 파서 설정 (빈 텍스트 노드 처리가 같아야 함)
+_XML_OPTIONS = {"remove_blank_text": True, "resolve_entities": False}
+
+
+def _xml(data: bytes):
+    return etree.fromstring(data, etree.XMLParser(**_XML_OPTIONS))
+
+
+# ─────────────────────────────────────────────
+# 패키지 (관계 · 스타일 · 메타)
+# ─────────────────────────────────────────────
+
+def _rels_name(part: str) -> str:
+    folder, name = posixpath.split(part)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _read_rels(zf: zipfile.ZipFile, part: str) -> list[tuple[str, str, str, bool]]:
+    """part 의 관계 → [(rId, reltype, 대상 파트 또는 외부 주소, 외부 여부)]"""
+    try:
+        root = _xml(zf.read(_rels_name(part)))
+    except KeyError:
+        return []
+    base = posixpath.dirname(part)
+    rels = []
+    for rel in root.iterchildren(_PR + "Relationship"):
+        target = rel.get("Target", "")
+        external = rel.get("TargetMode") == "External"
+        if not external:
+            target = posixpath.normpath(posixpath.join("/" + base, target)).lstrip("/")
+        rels.append((rel.get("Id", ""), rel.get("Type", ""), target, external))
+    return rels
+
+
+def _related(rels: list[tuple[str, str, str, bool]], reltype: str) -> str | None:
+    for _, rt, target, external in rels:
+        if rt == reltype and not external:
+            return target
+    return None
+
+
+def _content_type(zf: zipfile.ZipFile, part: str) -> str:
+    root = _xml(zf.read("[Content_Types].xml"))
+    for el in root.iterchildren(_CTN + "Override"):
+        if el.get("PartName", "").lstrip("/").lower() == part.lower():
+            return el.get("ContentType", "")
+    ext = posixpath.splitext(part)[1].lstrip(".").lower()
+    for el in root.iterchildren(_CTN + "Default"):
+        if el.get("Extension", "").lower() == ext:
+            return el.get("ContentType", "")
+    return ""
+
+
+def read_style_names(styles_xml: bytes) -> tuple[dict[str, str | None], str]:
+    """
+    styles.xml → ({styleId: 단락 스타일 이름(소문자) 또는 None}, 기본 단락 스타일 이름)
+
+    python-docx 처럼 styleId 는 처음 나온 w:style 을 쓰고, 단락 스타일이
+    아니면 None (→ 기본 단락 스타일). 기본 스타일은 w:default 가 켜진
+    마지막 단락 스타일, 없으면 "".
+    """
+    names: dict[str, str | None] = {}
+    default = ""
+    for st in _xml(styles_xml).iterchildren(W_STYLE):
+        is_para = st.get(W_TYPE) == "paragraph"
+        name_el = st.find(W_NAME)
+        name = ((name_el.get(W_VAL) if name_el is not None else None) or "").lower().strip()
+        style_id = st.get(W_STYLE_ID)
+        if style_id is not None and style_id not in names:
+            names[style_id] = name if is_para else None
+        flag = st.get(W_DEFAULT)
+        if is_para and flag is not None and ST_OnOff.convert_from_xml(flag):
+            default = name
+    return names, default
+
+
+class DocxPackage:
+    """
+    열린 .docx ZIP 을 읽는 lxml 경로.
+
+    Attributes
+    ----------
+    document_part : 본문 파트 이름 (보통 word/document.xml)
+    rel_map       : {"rId5": "image1.png"} — docx_parser._build_rel_map 과 같음
+    meta          : 코어 속성의 title / author
+    """
+
+    def __init__(self, zf: zipfile.ZipFile):
+        self._zf = zf
+        pkg_rels = _read_rels(zf, "")
+        document_part = _related(pkg_rels, RT.OFFICE_DOCUMENT)
+        if document_part is None:
+            raise ValueError("Word 문서가 아닙니다 (본문 파트 없음)")
+        content_type = _content_type(zf, document_part)
+        if content_type != CT.WML_DOCUMENT_MAIN:
+            raise ValueError(f"Word 문서가 아닙니다 (content type: {content_type})")
+        self.document_part = document_part
+
+        doc_rels = _read_rels(zf, document_part)
+        self.rel_map = {
+            r_id: posixpath.basename(target) for r_id, rt, target, _ in doc_rels if "image" in rt
+        }
+
+        styles_part = _related(doc_rels, RT.STYLES)
+        styles_xml = zf.read(styles_part) if styles_part else StylesPart._default_styles_xml()
+        self._style_names, self._default_style = read_style_names(styles_xml)
+
+        self.meta = self._read_meta(_related(pkg_rels, RT.CORE_PROPERTIES))
+
+    def _read_meta(self, core_part: str | None) -> DocMeta:
+        if core_part is None:
+            # python-docx 는 코어 속성이 없으면 기본값으로 만든다
+            return DocMeta(title="Word Document", author="", chapter="")
+        root = _xml(self._zf.read(core_part))
+
+        def _text(tag: str) -> str:
+            el = root.find(_DC + tag)
+            return (el.text or "") if el is not None else ""
+
+        return DocMeta(title=_text("title"), author=_text("creator"), chapter="")
+
+    # ── 본문 ─────────────────────────────────
+
+    def iter_blocks(self) -> Iterator[ParagraphFeatures | list[list[str]]]:
+        """
+        본문 블록을 문서 순서대로 — 단락은 ParagraphFeatures, 표는 셀 텍스트 행 목록.
+        처리한 블록은 바로 비워 트리가 커지지 않게 한다.
+        """
+        with self._zf.open(self.document_part) as f:
+            for _, el in etree.iterparse(f, events=("end",), tag=(W_P, W_TBL), **_XML_OPTIONS):
+                body = el.getparent()
+                if body is None or body.tag != W_BODY:
+                    continue   # 표 셀 · 콘텐츠 컨트롤 안의 단락 — 바깥 블록에서 처리
+                if el.tag == W_P:
+                    yield self._paragraph(el)
+                else:
+                    yield self._table(el)
+                el.clear()
+                while el.getprevious() is not None:
+                    del body[0]
+
+    def _paragraph(self, p) -> ParagraphFeatures:
+        """단락 자식을 한 번 훑어 특징 추출 (structure_analyzer.paragraph_features 와 같은 값)"""
+        chars: list[str] = []
+        sizes: list[float] = []
+        runs = 0
+        all_bold = True
+        pPr = None
+
+        for child in p:
+            tag = child.tag
+            if tag == W_R:
+                runs += 1
+                _run_text(child, chars)
+                rPr = child.find(W_RPR)
+                bold = None
+                if rPr is not None:
+                    sz = rPr.find(W_SZ)
+                    if sz is not None:
+                        length = ST_HpsMeasure.convert_from_xml(sz.get(W_VAL))
+                        if length:
+                            sizes.append(length.pt)
+                    b = rPr.find(W_B)
+                    if b is not None:
+                        val = b.get(W_VAL)
+                        bold = True if val is None else ST_OnOff.convert_from_xml(val)
+                if not bold:
+                    all_bold = False
+            elif tag == W_HYPERLINK:
+                for r in child.iterchildren(W_R):
+                    _run_text(r, chars)
+            elif tag == W_PPR and pPr is None:
+                pPr = child
+
+        style_id = None
+        indent = 0
+        if pPr is not None:
+            pStyle = pPr.find(W_PSTYLE)
+            if pStyle is not None:
+                style_id = pStyle.get(W_VAL)
+            ind = pPr.find(W_IND)
+            if ind is not None:
+                left = ind.get(W_LEFT)
+                if left is not None:
+                    indent = int(ST_SignedTwipsMeasure.convert_from_xml(left))
+            rPr = pPr.find(W_RPR)
+            if rPr is not None:
+                sz = rPr.find(W_SZ)
+                if sz is not None:
+                    val = sz.get(W_VAL)
+                    if val:
+                        sizes.append(int(val) / 2)
+
+        style = self._style_names.get(style_id) if style_id is not None else None
+        if style is None:
+            style = self._default_style
+
+        drawing = None
+        has_num = False
+        for el in p.iter(W_DRAWING, W_NUMPR):
+            if el.tag == W_NUMPR:
+                has_num = True
+            elif drawing is None:
+                drawing = el
+            if has_num and drawing is not None:
+                break
+
+        image = None
+        if drawing is not None:
+            extent = drawing.find(".//" + WP_EXTENT)
+            blip = drawing.find(".//" + A_BLIP)
+            image = (
+                blip.get(R_EMBED, "") if blip is not None else "",
+                int(extent.get("cx", 0)) if extent is not None else 0,
+                int(extent.get("cy", 0)) if extent is not None else 0,
+            )
+
+        return ParagraphFeatures(
+            style=style,
+            text=clean_text("".join(chars)),
+            size=max(sizes) if sizes else 0.0,
+            indent=indent,
+            all_bold=runs > 0 and all_bold,
+            is_list="list" in style or has_num,
+            image=image,
+        )
+
+    def _table(self, tbl) -> list[list[str]]:
+        if tbl.find(".//" + W_VMERGE) is not None:
+            # 세로 병합 셀은 위 행의 셀을 따라가야 한다 — python-docx 해석을 그대로
+            return table_rows(docx.table.Table(parse_xml(etree.tostring(tbl)), None))
+        rows = []
+        for tr in tbl.iterchildren(W_TR):
+            cells: list[str] = []
+            for tc in tr.iterchildren(W_TC):
+                text = "\n".join(_paragraph_text(p) for p in tc.iterchildren(W_P)).strip()
+                cells.extend([text] * _grid_span(tc))
+            rows.append(cells)
+        return rows
+
+
+# ─────────────────────────────────────────────
+# 텍스트 헬퍼
+# ─────────────────────────────────────────────
+
+def _run_text(r, out: list[str]) -> None:
+    for child in r:
+        tag = child.tag
+        if tag == W_T:
+            out.append(child.text or "")
+        elif tag == W_BR:
+            # 줄바꿈만 "\n" — 페이지 / 단 나누기는 빈 문자열 (python-docx 와 같음)
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                out.append("\n")
+        else:
+            ch = _RUN_CHARS.get(tag)
+            if ch is not None:
+                out.append(ch)
+
+
+def _paragraph_text(p) -> str:
+    chars: list[str] = []
+    for child in p:
+        if child.tag == W_R:
+            _run_text(child, chars)
+        elif child.tag == W_HYPERLINK:
+            for r in child.iterchildren(W_R):
+                _run_text(r, chars)
+    return "".join(chars)
+
+
+def _grid_span(tc) -> int:
+    tcPr = tc.find(W_TCPR)
+    if tcPr is None:
+        return 1
+    span = tcPr.find(W_GRIDSPAN)
+    return int(span.get(W_VAL)) if span is not None else 1
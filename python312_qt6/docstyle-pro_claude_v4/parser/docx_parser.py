@@ -5,11 +5,22 @@ docx_parser.py — DocStyle Pro 파싱 오케스트레이터 v2
     - classify_paragraph 에 prev_element 전달 (QA 답변 실시간 병합)
     - 후처리 파이프라인에 merge_conclusion_runs / absorb_prompt_labels 추가
     - DocMeta.sub 속성 동적 추가 제거 → models.py 에서 직접 선언
+    - 기본 경로를 lxml 직접 파싱(docx_fast.py)으로 — fast=False 또는
+      DOCSTYLE_DOCX_FAST=0 이면 기존 python-docx 경로
+    - 후처리 4단계를 한 번 순회하는 postprocess 파이프라인으로 —
+      분류 결과를 리스트로 모으지 않고 바로 흘려 보낸다
+    - 이미지는 분류가 끝난 뒤 본문이 참조한 것만 추출 (LazyImageMap) —
+      in_memory=True 면 추출 없이 ZIP 에서 바로 ImageElement.data 로
+    - 추출 이미지는 세션 간 공유 저장소(image_store.py)에 한 번만 쓰고 링크
 """
 
 from __future__ import annotations
 
+import io
+import os
 import re
+import zipfile
+from contextlib import nullcontext
 from pathlib import Path
 
 import docx
@@ -17,7 +28,9 @@ import docx.table
 import docx.text.paragraph
 from docx.oxml.ns import qn
 
-from .image_extractor import extract_images
+from .docx_fast import DocxPackage
+from .image_extractor import LazyImageMap, ZipImageMap, validate_docx
+from .image_store import get_image_store
 from .models import (
     DocMeta,
     DocumentElement,
@@ -27,12 +40,12 @@ from .models import (
     TextElement,
 )
 from .structure_analyzer import (
-    absorb_captions,
-    absorb_prompt_labels,
-    classify_paragraph,
-    classify_table,
-    merge_bullet_runs,
-    merge_conclusion_runs,
+    ParagraphFeatures,
+    classify_features,
+    classify_rows,
+    paragraph_features,
+    postprocess,
+    table_rows,
 )
 
 
@@ -108,6 +121,19 @@ def _iter_block_items(doc_obj):
             yield docx.table.Table(child, doc_obj)
 
 
+def _iter_blocks(doc_obj):
+    """python-docx 경로의 블록 — ParagraphFeatures 또는 표 행 목록 (docx_fast 와 같은 형태)"""
+    for block in _iter_block_items(doc_obj):
+        if isinstance(block, docx.text.paragraph.Paragraph):
+            yield paragraph_features(block)
+        else:
+            yield table_rows(block)
+
+
+def _fast_default() -> bool:
+    return os.getenv("DOCSTYLE_DOCX_FAST", "1") != "0"
+
+
 # ─────────────────────────────────────────────
 # 메인 파서
 # ─────────────────────────────────────────────
@@ -116,51 +142,121 @@ def parse(
     docx_path: str,
     temp_root: str = "./temp/images",
     chapter_override: str = "",
+    stage=None,
+    fast: bool | None = None,
+    image_workers: int = 1,
+    in_memory: bool = False,
 ) -> ParsedDocument:
     """
     .docx 파일을 파싱하여 ParsedDocument 반환.
 
     DS-* 커스텀 스타일이 있으면 100% 정확하게 분류한다.
     DS-* 스타일이 없는 일반 Word 파일도 폰트 크기·들여쓰기로 최선 분류한다.
+
+    이미지는 분류가 끝난 뒤 본문이 참조한 것만 temp_root/{uuid}/ 로 추출한다.
+    image_map 에는 추출한 이미지만 담기고, 참조가 없으면 세션 폴더도 만들지 않는다.
+    이미지 본문은 temp_root/store/ 에 내용(SHA-256)별로 한 번만 저장되고
+    세션 폴더에는 링크가 걸린다 (image_store.py).
+
+    stage         : 단계 측정용 컨텍스트 매니저 팩토리 fn(name) (예: StageTimer.stage)
+                    — 이미지 추출을 "extract_images" 로 따로 잰다
+    fast          : True  — lxml 로 document.xml 을 직접 읽는다 (docx_fast.py)
+                    False — python-docx 객체 경로
+                    None  — 환경 변수 DOCSTYLE_DOCX_FAST (기본 1)
+    image_workers : 2 이상이면 참조 이미지를 스레드로 병렬 추출
+    in_memory     : True 면 추출하지 않고 parse_bytes 처럼 ImageElement.data 에
+                    원본 바이트를 담는다 (image_map 은 {파일명: ""}, image_base_dir "")
     """
-    docx_path = str(Path(docx_path).resolve())
+    path = validate_docx(docx_path)
 
-    # 1. 이미지 추출
-    image_map, image_base_dir = extract_images(docx_path, temp_root)
+    with zipfile.ZipFile(path) as zf:
+        if in_memory:
+            images = ZipImageMap(zf)
+            parsed = _parse_zip(zf, str(path), images, "", chapter_override, fast)
+            parsed.image_map = {name: "" for name in images.loaded}
+            return parsed
 
-    # 2. 문서 열기
-    doc_obj = docx.Document(docx_path)
+        images = LazyImageMap(zf, temp_root, store=get_image_store(temp_root))
+        parsed = _parse_zip(zf, str(path), images, images.base_dir, chapter_override, fast)
+        with (stage("extract_images") if stage else nullcontext()):
+            parsed.image_map = images.extract(image_workers)
+    return parsed
 
+
+def parse_bytes(
+    data: bytes,
+    chapter_override: str = "",
+    fast: bool | None = None,
+) -> ParsedDocument:
+    """
+    메모리의 .docx 바이트를 파싱한다. (임시 파일 · 이미지 추출 없음)
+
+    이미지는 본문에서 참조될 때만 ZIP 에서 읽어 ImageElement.data 로 담는다.
+    image_map 은 {파일명: ""} (로컬 경로 없음), image_base_dir 는 "".
+    fast 는 parse() 와 같다.
+    """
+    if data[:2] != b"PK":
+        raise ValueError(
+            "유효한 .docx 파일이 아닙니다 (ZIP 형식이 아님)\n"
+            "플랫폼에서 변환된 마크다운 버전이 아닌 원본 .docx 파일을 사용하세요."
+        )
+    buf = io.BytesIO(data)
+    with zipfile.ZipFile(buf) as zf:
+        images = ZipImageMap(zf)
+        parsed = _parse_zip(zf, buf, images, "", chapter_override, fast)
+    parsed.image_map = {name: "" for name in images.loaded}
+    return parsed
+
+
+def _parse_zip(zf, source, image_map, image_base_dir: str, chapter_override: str, fast: bool | None) -> ParsedDocument:
+    """열린 docx ZIP → ParsedDocument. source — python-docx 경로가 다시 열 경로 / 스트림"""
+    if _fast_default() if fast is None else fast:
+        return _parse_package(DocxPackage(zf), image_map, image_base_dir, chapter_override)
+    return _parse_document(docx.Document(source), image_map, image_base_dir, chapter_override)
+
+
+def _parse_package(pkg: DocxPackage, image_map, image_base_dir: str, chapter_override: str) -> ParsedDocument:
+    """lxml 경로 — 관계 · 메타 · 블록을 DocxPackage 에서"""
+    return _assemble(pkg.iter_blocks(), pkg.meta, image_map, pkg.rel_map, image_base_dir, chapter_override)
+
+
+def _parse_document(doc_obj, image_map, image_base_dir: str, chapter_override: str) -> ParsedDocument:
+    """열린 docx.Document → ParsedDocument (python-docx 경로)"""
     # 3. 관계 ID 매핑
     rel_map = _build_rel_map(doc_obj)
 
     # 4. 메타 추출
     meta = _extract_meta(doc_obj)
 
-    # 5. 블록 순회 — QA 답변은 실시간 병합
-    raw_elements: list = []
-    prev_element = None
+    return _assemble(_iter_blocks(doc_obj), meta, image_map, rel_map, image_base_dir, chapter_override)
 
-    for block in _iter_block_items(doc_obj):
-        if isinstance(block, docx.text.paragraph.Paragraph):
-            el = classify_paragraph(block, image_map, rel_map, prev_element)
+
+def _classify(blocks, image_map, rel_map: dict[str, str]):
+    """블록 → 요소 스트림. QA 답변은 직전 QAElement 에 실시간 병합 (요소를 내지 않음)"""
+    prev_element = None
+    for block in blocks:
+        if isinstance(block, ParagraphFeatures):
+            el = classify_features(block, image_map, rel_map, prev_element)
             if el is None:
                 # QA 답변이 병합된 경우 — prev_element 는 유지
                 continue
-            raw_elements.append(el)
-            prev_element = el
-
-        elif isinstance(block, docx.table.Table):
-            tbl_el = classify_table(block)
-            raw_elements.append(tbl_el)
-            prev_element = tbl_el
-
-    # 6. 후처리 파이프라인
-    result = raw_elements
-    result = merge_bullet_runs(result)
-    result = merge_conclusion_runs(result)
-    result = absorb_captions(result)
-    result = absorb_prompt_labels(result)
+        else:
+            el = classify_rows(block)
+        prev_element = el
+        yield el
+
+
+def _assemble(
+    blocks,
+    meta: DocMeta,
+    image_map,
+    rel_map: dict[str, str],
+    image_base_dir: str,
+    chapter_override: str,
+) -> ParsedDocument:
+    """블록 분류 + 후처리 (두 경로 공용). blocks — ParagraphFeatures 또는 표 행 목록"""
+    # 5–6. 블록 분류 → 후처리 파이프라인 (한 번 순회)
+    result = list(postprocess(_classify(blocks, image_map, rel_map)))
 
     # 7. 챕터명 보완
     if chapter_override:
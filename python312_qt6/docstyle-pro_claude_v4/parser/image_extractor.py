@@ -9,18 +9,68 @@ image_extractor.py — DocStyle Pro 이미지 추출기
         {"image1.png": "/abs/path/to/temp/images/{uuid}/image1.png"}
     image_base_dir : str
         "/abs/path/to/temp/images/{uuid}/"
+
+docx_parser.parse 는 extract_images 대신 LazyImageMap 을 쓴다 — 분류 중에는
+경로만 정해 두고, 분류가 끝나면 본문이 참조한 이미지만 추출한다
+(참조가 없으면 세션 폴더도 만들지 않는다). 저장소(image_store.py)를 주면
+세션 폴더에는 내용 주소 저장소 파일의 하드 링크만 둔다.
+메모리 변환(docx_parser.parse_bytes, parse(in_memory=True))은 추출 대신
+ZipImageMap 으로 참조된 이미지만 그때그때 읽는다.
 """
 
 import shutil
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .image_store import ImageStore
+
 
 # 지원 이미지 확장자
 SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff"}
 
 
+def validate_docx(docx_path: str) -> Path:
+    """
+    docx_path 가 있고 ZIP(PK) 형식인지 확인해 절대 경로를 반환한다.
+
+    Raises
+    ------
+    FileNotFoundError
+        docx_path 파일이 없을 때
+    ValueError
+        파일이 유효한 docx(ZIP) 형식이 아닐 때
+    """
+    docx_path = Path(docx_path).resolve()
+    if not docx_path.exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {docx_path}")
+
+    # 진짜 ZIP 형식인지 확인 (PK 매직 바이트)
+    with open(docx_path, "rb") as f:
+        magic = f.read(4)
+    if magic[:2] != b"PK":
+        raise ValueError(
+            f"유효한 .docx 파일이 아닙니다 (ZIP 형식이 아님): {docx_path}\n"
+            "플랫폼에서 변환된 마크다운 버전이 아닌 원본 .docx 파일을 사용하세요."
+        )
+    return docx_path
+
+
+def _media_entries(zf: zipfile.ZipFile) -> dict[str, str]:
+    """word/media/ 하위 지원 이미지 {파일명: ZIP 엔트리 이름}"""
+    return {
+        Path(name).name: name
+        for name in zf.namelist()
+        if name.startswith("word/media/") and Path(name).suffix.lower() in SUPPORTED_EXTENSIONS
+    }
+
+
+def _new_session_dir(temp_root: str) -> Path:
+    """세션별 격리 디렉터리 경로 (만들지는 않는다)"""
+    return Path(temp_root).resolve() / uuid.uuid4().hex[:8]
+
+
 def extract_images(docx_path: str, temp_root: str = "./temp/images") -> tuple[dict, str]:
     """
     docx 파일에서 이미지를 모두 추출한다.
@@ -46,50 +96,120 @@ def extract_images(docx_path: str, temp_root: str = "./temp/images") -> tuple[di
     ValueError
         파일이 유효한 docx(ZIP) 형식이 아닐 때
     """
-    docx_path = Path(docx_path).resolve()
-    if not docx_path.exists():
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {docx_path}")
-
-    # 진짜 ZIP 형식인지 확인 (PK 매직 바이트)
-    with open(docx_path, "rb") as f:
-        magic = f.read(4)
-    if magic[:2] != b"PK":
-        raise ValueError(
-            f"유효한 .docx 파일이 아닙니다 (ZIP 형식이 아님): {docx_path}\n"
-            "플랫폼에서 변환된 마크다운 버전이 아닌 원본 .docx 파일을 사용하세요."
-        )
+    docx_path = validate_docx(docx_path)
 
     # 세션별 격리 디렉터리 생성
-    session_id     = uuid.uuid4().hex[:8]
-    output_dir     = Path(temp_root).resolve() / session_id
+    output_dir = _new_session_dir(temp_root)
     output_dir.mkdir(parents=True, exist_ok=True)
 
     image_map: dict[str, str] = {}
 
     with zipfile.ZipFile(docx_path, "r") as zf:
-        for entry in zf.namelist():
-            entry_path = Path(entry)
-
-            # word/media/ 하위 파일만 대상
-            if not entry.startswith("word/media/"):
-                continue
-
-            ext = entry_path.suffix.lower()
-            if ext not in SUPPORTED_EXTENSIONS:
-                continue
-
-            filename    = entry_path.name
+        for filename, entry in _media_entries(zf).items():
             output_path = output_dir / filename
-
             with zf.open(entry) as src, open(output_path, "wb") as dst:
                 shutil.copyfileobj(src, dst)
-
             image_map[filename] = str(output_path)
 
     image_base_dir = str(output_dir) + "/"
     return image_map, image_base_dir
 
 
+class LazyImageMap:
+    """
+    열린 docx ZIP 의 word/media/ 이미지를 파일명으로 조회하되, 추출은 미룬다.
+    (classify_features 의 image_map 자리에 쓰는 읽기 전용 매핑 — get 만 지원)
+
+        images = LazyImageMap(zf, "./temp/images")
+        images.get("image1.png")        # 추출될 절대 경로 (아직 파일 없음) / 없으면 None
+        image_map = images.extract()    # 참조된 것만 추출 → {파일명: 절대 경로}
+
+    get 으로 조회된 이미지만 extract 대상이 된다. extract 는 ZIP 이 열려 있는
+    동안 불러야 하며, 참조된 이미지가 없으면 세션 디렉터리를 만들지 않는다.
+    store 를 주면 같은 내용의 이미지는 저장소에 한 번만 쓰고 세션에는 링크한다.
+    """
+
+    def __init__(self, zf: zipfile.ZipFile, temp_root: str = "./temp/images", store: ImageStore | None = None):
+        self._entries = _media_entries(zf)
+        self._zf = zf
+        self._store = store
+        self.output_dir = _new_session_dir(temp_root)
+        self.base_dir = str(self.output_dir) + "/"
+        self.referenced: dict[str, str] = {}
+
+    def get(self, filename: str, default=None):
+        path = self.referenced.get(filename)
+        if path is None:
+            if filename not in self._entries:
+                return default
+            path = self.referenced[filename] = str(self.output_dir / filename)
+        return path
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _extract_one(self, filename: str) -> bool:
+        """이미지 하나를 세션에 쓴다. 저장소에 새로 쓴 경우 True"""
+        entry = self._entries[filename]
+        if self._store is not None:
+            data = self._zf.read(entry)
+            return self._store.link(data, Path(entry).suffix, self.output_dir / filename)
+        with self._zf.open(entry) as src, open(self.output_dir / filename, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return False
+
+    def extract(self, workers: int = 1) -> dict[str, str]:
+        """
+        참조된 이미지만 세션 디렉터리에 쓴다.
+
+        workers : 2 이상이면 스레드로 병렬 추출 (압축 해제·쓰기는 GIL 밖에서 돈다)
+
+        Returns
+        -------
+        {파일명: 절대 경로} — 참조된 이미지만
+        """
+        if not self.referenced:
+            return {}
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        names = list(self.referenced)
+        if workers > 1 and len(names) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(names))) as ex:
+                added = list(ex.map(self._extract_one, names))
+        else:
+            added = [self._extract_one(name) for name in names]
+        if self._store is not None and any(added):
+            self._store.evict()
+        return dict(self.referenced)
+
+
+class ZipImageMap:
+    """
+    열린 docx ZIP 의 word/media/ 이미지를 파일명으로 지연 조회한다.
+    (classify_paragraph 의 image_map 자리에 쓰는 읽기 전용 매핑 — get 만 지원)
+
+        images = ZipImageMap(zf)
+        images.get("image1.png")   # bytes / 없으면 None
+        images.loaded              # 지금까지 읽은 {파일명: bytes}
+    """
+
+    def __init__(self, zf: zipfile.ZipFile):
+        self._entries = _media_entries(zf)
+        self._zf = zf
+        self.loaded: dict[str, bytes] = {}
+
+    def get(self, filename: str, default=None):
+        data = self.loaded.get(filename)
+        if data is None:
+            entry = self._entries.get(filename)
+            if entry is None:
+                return default
+            data = self.loaded[filename] = self._zf.read(entry)
+        return data
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def cleanup_session(image_base_dir: str) -> None:
     """
     변환 완료 후 임시 이미지 디렉터리를 삭제한다.
@@ -0,0 +1,300 @@
+"""
+image_probe.py — 이미지 헤더만 읽어 크기 · DPI · EXIF 회전 확인
+
+.md 의 [image] 는 크기 정보가 없어 엔진이 최대 폭 · 가로세로 1:2 로 추정했다.
+이 모듈은 픽셀 데이터를 디코딩하지 않고 파일 앞부분(대개 수백 바이트)만 읽어
+표시 크기를 구하고, md_parser 가 ImageElement.width_emu / height_emu 를 채운다.
+
+    info = probe_image("fig1.png")      # ImageInfo / 알 수 없으면 None
+    info.width_emu, info.height_emu
+
+지원 형식
+    PNG  — IHDR, pHYs (IDAT 전까지 청크 헤더만 건너뜀)
+    JPEG — SOFn, JFIF 밀도, EXIF(APP1) 회전 · 해상도
+    GIF · BMP · WebP(VP8 / VP8L / VP8X — 회전 정보는 읽지 않음) · TIFF(IFD0)
+
+- DPI 정보가 없으면 96 DPI 로 본다 (Word 와 같은 기준).
+- EXIF 회전이 90°/270° (5–8) 면 보이는 대로 가로 · 세로를 바꾼다.
+- probe_image 는 경로별로 (mtime, 크기) 가 같으면 다시 읽지 않는다.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import IO, NamedTuple
+
+
+_EMU_PER_INCH = 914400
+_DEFAULT_DPI  = 96
+_CACHE_MAX    = 4096
+
+
+class ImageInfo(NamedTuple):
+    width_px:    int      # 저장된 픽셀 크기 (회전 전)
+    height_px:   int
+    dpi_x:       float
+    dpi_y:       float
+    orientation: int      # EXIF Orientation (1 = 그대로)
+
+    @property
+    def rotated(self) -> bool:
+        return self.orientation in (5, 6, 7, 8)
+
+    @property
+    def width_emu(self) -> int:
+        """보이는 방향 기준 가로 (EMU)"""
+        px, dpi = (self.height_px, self.dpi_y) if self.rotated else (self.width_px, self.dpi_x)
+        return round(px / dpi * _EMU_PER_INCH)
+
+    @property
+    def height_emu(self) -> int:
+        px, dpi = (self.width_px, self.dpi_x) if self.rotated else (self.height_px, self.dpi_y)
+        return round(px / dpi * _EMU_PER_INCH)
+
+
+# ─────────────────────────────────────────────
+# TIFF / EXIF IFD0
+# ─────────────────────────────────────────────
+
+_TAG_WIDTH       = 0x0100
+_TAG_HEIGHT      = 0x0101
+_TAG_ORIENTATION = 0x0112
+_TAG_XRES        = 0x011A
+_TAG_YRES        = 0x011B
+_TAG_RES_UNIT    = 0x0128
+_TIFF_TAGS = {_TAG_WIDTH, _TAG_HEIGHT, _TAG_ORIENTATION, _TAG_XRES, _TAG_YRES, _TAG_RES_UNIT}
+
+
+def _read_ifd0(f: IO[bytes], base: int) -> dict[int, float]:
+    """base 위치의 TIFF 헤더 → IFD0 에서 필요한 태그만 {태그: 값}"""
+    f.seek(base)
+    head = f.read(8)
+    if len(head) < 8 or head[:2] not in (b"II", b"MM"):
+        return {}
+    bo = "<" if head[:2] == b"II" else ">"
+    f.seek(base + struct.unpack(bo + "I", head[4:8])[0])
+    raw = f.read(2)
+    if len(raw) < 2:
+        return {}
+    count = struct.unpack(bo + "H", raw)[0]
+    entries = f.read(12 * count)
+    tags: dict[int, float] = {}
+    rationals: list[tuple[int, int]] = []
+    for i in range(len(entries) // 12):
+        tag, typ, _, value = struct.unpack(bo + "HHI4s", entries[12 * i:12 * i + 12])
+        if tag not in _TIFF_TAGS:
+            continue
+        if typ == 3:     # SHORT
+            tags[tag] = struct.unpack(bo + "H", value[:2])[0]
+        elif typ == 4:   # LONG
+            tags[tag] = struct.unpack(bo + "I", value)[0]
+        elif typ == 5:   # RATIONAL — 값은 오프셋 위치에
+            rationals.append((tag, struct.unpack(bo + "I", value)[0]))
+    for tag, offset in rationals:
+        f.seek(base + offset)
+        raw = f.read(8)
+        if len(raw) == 8:
+            num, den = struct.unpack(bo + "II", raw)
+            if den:
+                tags[tag] = num / den
+    return tags
+
+
+def _tiff_dpi(tags: dict[int, float]) -> tuple[float, float] | None:
+    x, y = tags.get(_TAG_XRES), tags.get(_TAG_YRES)
+    if not x or not y:
+        return None
+    unit = tags.get(_TAG_RES_UNIT, 2)
+    if unit == 3:        # 센티미터
+        return x * 2.54, y * 2.54
+    if unit == 2:        # 인치
+        return x, y
+    return None          # 1 = 단위 없음 (비율만)
+
+
+# ─────────────────────────────────────────────
+# 형식별 헤더
+# ─────────────────────────────────────────────
+
+def _png(f: IO[bytes]) -> ImageInfo | None:
+    f.seek(8)
+    length, ctype = struct.unpack(">I4s", f.read(8))
+    if ctype != b"IHDR":
+        return None
+    w, h = struct.unpack(">II", f.read(8))
+    f.seek(length - 8 + 4, os.SEEK_CUR)   # IHDR 나머지 + CRC
+    dpi = None
+    while True:
+        head = f.read(8)
+        if len(head) < 8:
+            break
+        length, ctype = struct.unpack(">I4s", head)
+        if ctype in (b"IDAT", b"IEND"):
+            break
+        if ctype == b"pHYs":
+            px, py, unit = struct.unpack(">IIB", f.read(9))
+            if unit == 1 and px and py:   # 미터당 픽셀
+                dpi = (px * 0.0254, py * 0.0254)
+            break
+        f.seek(length + 4, os.SEEK_CUR)
+    return _info(w, h, dpi)
+
+
+def _jpeg(f: IO[bytes]) -> ImageInfo | None:
+    f.seek(2)
+    dpi = None
+    exif: dict[int, float] = {}
+    while True:
+        b = f.read(1)
+        while b == b"\xff":
+            b = f.read(1)                 # 채움 바이트
+        if not b:
+            return None
+        marker = b[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue                      # 길이 없는 마커
+        raw = f.read(2)
+        if len(raw) < 2:
+            return None
+        length = struct.unpack(">H", raw)[0]
+        if length < 2:
+            return None                   # 깨진 세그먼트 — 제자리 반복 방지
+        start = f.tell()
+        if marker in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+            h, w = struct.unpack(">xHH", f.read(5))
+            orientation = int(exif.get(_TAG_ORIENTATION, 1))
+            return _info(w, h, dpi or _tiff_dpi(exif), orientation)
+        if marker == 0xE0 and dpi is None:
+            seg = f.read(12)
+            if seg[:5] == b"JFIF\0":
+                unit, dx, dy = struct.unpack(">BHH", seg[7:12])
+                if dx and dy and unit in (1, 2):
+                    dpi = (dx, dy) if unit == 1 else (dx * 2.54, dy * 2.54)
+        elif marker == 0xE1 and not exif:
+            if f.read(6) == b"Exif\0\0":
+                exif = _read_ifd0(f, start + 6)
+        elif marker == 0xDA:
+            return None                   # SOF 없이 스캔 시작
+        f.seek(start + length - 2)
+
+
+def _gif(f: IO[bytes]) -> ImageInfo | None:
+    f.seek(6)
+    w, h = struct.unpack("<HH", f.read(4))
+    return _info(w, h, None)
+
+
+def _bmp(f: IO[bytes]) -> ImageInfo | None:
+    f.seek(14)
+    head = f.read(32)
+    size = struct.unpack("<I", head[:4])[0]
+    if size == 12:                        # OS/2 BITMAPCOREHEADER
+        w, h = struct.unpack("<HH", head[4:8])
+        return _info(w, h, None)
+    w, h = struct.unpack("<ii", head[4:12])
+    dpi = None
+    if size >= 40:
+        px, py = struct.unpack("<ii", head[24:32])
+        if px > 0 and py > 0:
+            dpi = (px * 0.0254, py * 0.0254)
+    return _info(w, abs(h), dpi)
+
+
+def _webp(f: IO[bytes]) -> ImageInfo | None:
+    f.seek(12)
+    head = f.read(18)
+    kind = head[:4]
+    if kind == b"VP8 ":
+        w, h = struct.unpack("<HH", head[14:18])
+        return _info(w & 0x3FFF, h & 0x3FFF, None)
+    if kind == b"VP8L":
+        b = head[9:13]
+        w = 1 + (((b[1] & 0x3F) << 8) | b[0])
+        h = 1 + (((b[3] & 0x0F) << 10) | (b[2] << 2) | ((b[1] & 0xC0) >> 6))
+        return _info(w, h, None)
+    if kind == b"VP8X":
+        w = 1 + int.from_bytes(head[12:15], "little")
+        h = 1 + int.from_bytes(head[15:18], "little")
+        return _info(w, h, None)
+    return None
+
+
+def _tiff(f: IO[bytes]) -> ImageInfo | None:
+    tags = _read_ifd0(f, 0)
+    w, h = tags.get(_TAG_WIDTH), tags.get(_TAG_HEIGHT)
+    if not w or not h:
+        return None
+    return _info(int(w), int(h), _tiff_dpi(tags), int(tags.get(_TAG_ORIENTATION, 1)))
+
+
+def _info(w: int, h: int, dpi: tuple[float, float] | None, orientation: int = 1) -> ImageInfo | None:
+    if w <= 0 or h <= 0:
+        return None
+    dx, dy = dpi if dpi and dpi[0] > 0 and dpi[1] > 0 else (_DEFAULT_DPI, _DEFAULT_DPI)
+    return ImageInfo(w, h, float(dx), float(dy), orientation if 1 <= orientation <= 8 else 1)
+
+
+def _probe(f: IO[bytes]) -> ImageInfo | None:
+    sig = f.read(16)
+    if sig.startswith(b"\x89PNG\r\n\x1a\n"):
+        reader = _png
+    elif sig.startswith(b"\xff\xd8"):
+        reader = _jpeg
+    elif sig[:6] in (b"GIF87a", b"GIF89a"):
+        reader = _gif
+    elif sig.startswith(b"BM"):
+        reader = _bmp
+    elif sig[:4] == b"RIFF" and sig[8:12] == b"WEBP":
+        reader = _webp
+    elif sig[:4] in (b"II*\0", b"MM\0*"):
+        reader = _tiff
+    else:
+        return None
+    try:
+        return reader(f)
+    except (struct.error, IndexError, ValueError, OSError):
+        return None
+
+
+# ─────────────────────────────────────────────
+# 공개 API
+# ─────────────────────────────────────────────
+
+_cache: OrderedDict[str, tuple[int, int, ImageInfo | None]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def probe_bytes(data: bytes) -> ImageInfo | None:
+    """메모리 이미지의 헤더 → ImageInfo (알 수 없는 형식이면 None)"""
+    return _probe(io.BytesIO(data))
+
+
+def probe_image(path: str | os.PathLike) -> ImageInfo | None:
+    """
+    이미지 파일 헤더 → ImageInfo. 파일이 없거나 알 수 없는 형식이면 None.
+    같은 경로의 (mtime, 크기) 가 그대로면 캐시한 결과를 쓴다.
+    """
+    path = os.fspath(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    with _cache_lock:
+        hit = _cache.get(path)
+        if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+            _cache.move_to_end(path)
+            return hit[2]
+    try:
+        with open(path, "rb") as f:
+            info = _probe(f)
+    except OSError:
+        return None
+    with _cache_lock:
+        _cache[path] = (st.st_mtime_ns, st.st_size, info)
+        if len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    return info
@@ -0,0 +1,158 @@
+"""
+image_store.py — 변환 세션이 공유하는 내용 주소 이미지 저장소
+
+같은 책을 템플릿만 바꿔 다시 변환하거나 웹 작업이 동시에 같은 원고를
+변환하면, 세션마다 temp/images/{uuid}/ 에 같은 이미지 바이트를 새로 썼다.
+이 저장소는 이미지를 SHA-256 으로 한 번만 저장하고, 세션 디렉터리에는
+하드 링크만 건다.
+
+    store = get_image_store("./temp/images")
+    store.link(data, ".png", session_dir / "image1.png")
+
+저장 구조
+    {temp_root}/store/{sha[:2]}/{sha}{ext}   이미지 본문 (한 번 쓰면 다시 쓰지 않음)
+    {temp_root}/{uuid}/image1.png            같은 파일의 하드 링크
+
+참조 수
+    파일의 링크 수(st_nlink) − 1 이 그 이미지를 쓰는 세션 수다.
+    cleanup_session 이 세션 디렉터리를 지우면 링크만 사라지므로 별도
+    해제 호출이 없고, 프로세스가 여러 개여도 그대로 맞는다.
+
+축출
+    저장소 용량이 max_bytes 를 넘으면 참조 수가 0 인 이미지부터,
+    가장 오래 쓰지 않은(mtime — 링크할 때마다 갱신) 순서로 지운다.
+    참조 중인 이미지는 지우지 않는다.
+
+하드 링크를 만들 수 없는 파일 시스템이면 세션에 복사한다 (저장소는 그대로).
+DOCSTYLE_IMAGE_STORE_MB=0 이면 저장소를 쓰지 않는다.
+.md 원고의 이미지는 원래 원고 디렉터리를 그대로 참조하므로(복사 없음)
+저장소를 거치지 않는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+from .disk_lru import env_mb, evict_lru
+
+
+_DEFAULT_MAX_BYTES = env_mb("DOCSTYLE_IMAGE_STORE_MB", 512)
+
+STORE_DIRNAME = "store"
+
+
+class ImageStore:
+    """
+    크기 제한이 있는 내용 주소 이미지 저장소.
+
+    Parameters
+    ----------
+    root      : 저장소 디렉터리 (세션 디렉터리와 같은 파일 시스템이어야 링크된다)
+    max_bytes : 전체 이미지 용량 상한
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = _DEFAULT_MAX_BYTES):
+        self.root      = Path(root)
+        self.max_bytes = max_bytes
+        self.hits      = 0
+        self.misses    = 0
+        self._lock     = threading.Lock()
+
+    # ── 저장 ─────────────────────────────────
+
+    def path_for(self, digest: str, ext: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{ext.lower()}"
+
+    def add(self, data: bytes, ext: str) -> Path:
+        """
+        이미지 바이트를 저장하고 저장소 경로를 반환한다.
+        같은 내용이 이미 있으면 쓰지 않고 mtime 만 갱신한다.
+        """
+        target = self.path_for(hashlib.sha256(data).hexdigest(), ext)
+        try:
+            os.utime(target)   # LRU 갱신
+        except FileNotFoundError:
+            pass
+        else:
+            with self._lock:
+                self.hits += 1
+            return target
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_bytes(data)
+        try:
+            os.link(tmp, target)   # 동시에 같은 내용을 넣으면 먼저 들어간 쪽을 쓴다
+        except FileExistsError:
+            pass
+        except OSError:
+            os.replace(tmp, target)   # 링크를 못 만드는 파일 시스템
+        tmp.unlink(missing_ok=True)
+        with self._lock:
+            self.misses += 1
+        return target
+
+    def link(self, data: bytes, ext: str, dest: str | Path) -> bool:
+        """
+        이미지를 저장소에 넣고 dest 에 하드 링크한다 (안 되면 복사).
+
+        Returns
+        -------
+        True — 저장소에 새로 쓴 경우 (축출 점검 필요)
+        """
+        misses = self.misses
+        dest = Path(dest)
+        for _ in range(2):
+            target = self.add(data, ext)
+            try:
+                os.link(target, dest)
+                break
+            except FileNotFoundError:
+                continue   # 그 사이 다른 프로세스가 축출 — 다시 넣는다
+            except OSError:
+                shutil.copyfile(target, dest)
+                break
+        else:
+            dest.write_bytes(data)
+        return self.misses != misses
+
+    # ── 축출 ─────────────────────────────────
+
+    def evict(self) -> None:
+        """용량이 max_bytes 를 넘으면 참조되지 않은 이미지를 오래된 순서로 지운다"""
+        with self._lock:
+            evict_lru(
+                (f for f in self.root.glob("??/*") if not f.name.startswith(".")),
+                self.max_bytes,
+                keep=lambda st: st.st_nlink > 1,
+            )
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+# ─────────────────────────────────────────────
+# 프로세스 전역 저장소 (temp_root 별)
+# ─────────────────────────────────────────────
+
+_stores: dict[Path, ImageStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_image_store(temp_root: str | Path) -> ImageStore | None:
+    """temp_root 아래 store/ 저장소. DOCSTYLE_IMAGE_STORE_MB=0 이면 None"""
+    if _DEFAULT_MAX_BYTES <= 0:
+        return None
+    root = Path(temp_root).resolve() / STORE_DIRNAME
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = ImageStore(root)
+        return store
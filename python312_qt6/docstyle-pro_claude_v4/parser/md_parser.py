@@ -53,10 +53,15 @@ md_parser.py — DocStyle Pro 구조화 마크다운 파서
 
 from __future__ import annotations
 
+import bisect
+import io
+import os
 import re
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterable, Iterator, Optional
 
+from .image_probe import probe_bytes, probe_image
 from .models import (
     BulletsElement,
     ConclusionElement,
@@ -66,6 +71,7 @@ from .models import (
     HRElement,
     EmptyElement,
     ImageElement,
+    ImageResolver,
     ParsedDocument,
     PromptElement,
     QAElement,
@@ -79,10 +85,10 @@ from .models import (
 # ─────────────────────────────────────────────
 
 _RE_FRONTMATTER = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_RE_FM_OPEN     = re.compile(r"^---\s*$")
+_RE_FM_OPEN_WS  = re.compile(r"---\s*")
 _RE_TAG_LINE    = re.compile(r"^\[([^\]|]+)(?:\s*\|\s*([^\]]*))?\]\s*$")
-_RE_H1          = re.compile(r"^#\s+(.+)$")
-_RE_H2          = re.compile(r"^##\s+(.+)$")
-_RE_H3          = re.compile(r"^###\s+(.+)$")
+_RE_HEADING     = re.compile(r"^(#{1,3})\s+(.+)$")   # h1 ~ h3 (#### 이상은 본문)
 _RE_BULLET      = re.compile(r"^[-*]\s+(.+)$")
 _RE_HR          = re.compile(r"^---+\s*$")
 _RE_H1_NUM      = re.compile(r"^(\d+)\.\s+(.+)$")   # "1. 제목" → ("1", "제목")
@@ -121,256 +127,419 @@ def _parse_frontmatter(text: str) -> tuple[DocMeta, str]:
     return meta, body
 
 
+def _body_offset(text: str, body: str) -> int:
+    """프론트매터가 차지한 줄 수 — 본문 첫 줄의 0 기반 줄 번호"""
+    return len(text[: len(text) - len(body)].splitlines())
+
+
+def _read_frontmatter(chunks: Iterator[str]) -> tuple[DocMeta, str, int]:
+    """
+    줄 단위 스트림 앞부분에서 프론트매터만 읽는다.
+
+    _parse_frontmatter 와 같은 결과가 되도록 닫는 --- 뒤의 공백 줄과
+    첫 본문 줄까지 읽은 다음 같은 정규식을 적용한다.
+    (닫는 --- 가 없으면 파일 끝까지 읽게 된다 — 전체 파싱과 같은 결과)
+
+    여는 --- 다음이 빈 줄뿐이면 정규식은 그 빈 줄을 모두 여는 쪽에 넣고
+    그 뒤에서 닫는 --- 를 먼저 찾는다. 빈 프론트매터로 끝나는 것은 그런 ---
+    가 파일 어디에도 없을 때뿐이라, 이때는 그 위치에서 시작한 일치를 얻을
+    때까지(또는 파일 끝까지) 더 읽는다.
+
+    Returns
+    -------
+    (DocMeta, 이미 읽었지만 본문에 속하는 텍스트, 본문 첫 줄 번호)
+    """
+    first = next(chunks, "")
+    if not _RE_FM_OPEN.match(first):
+        return DocMeta(), first, 0
+
+    parts = [first]
+    closing_seen = False
+    buf = ""
+    for chunk in chunks:
+        parts.append(chunk)
+        stripped = chunk.strip()
+        if stripped == "---":
+            closing_seen = True
+        elif stripped and closing_seen:
+            # 새 닫는 --- 후보가 나올 때까지는 다시 맞춰 봐도 결과가 같다
+            closing_seen = False
+            buf = "".join(parts)
+            m = _RE_FRONTMATTER.match(buf)
+            if m and buf[m.end():].strip() and m.start(1) == _frontmatter_open_end(buf):
+                break
+            parts = [buf]
+    else:
+        buf = "".join(parts)
+    meta, body = _parse_frontmatter(buf)
+    return meta, body, _body_offset(buf, body)
+
+
+def _frontmatter_open_end(text: str) -> int:
+    """_RE_FRONTMATTER 가 가장 먼저 시도하는 여는 쪽 끝 — --- 뒤 공백의 마지막 줄바꿈 다음"""
+    end = _RE_FM_OPEN_WS.match(text).end()
+    return text.rfind("\n", 0, end) + 1
+
+
 # ─────────────────────────────────────────────
 # 블록 토크나이저
 # ─────────────────────────────────────────────
 
+# 블록 직전 토크나이저 상태 — 증분 파싱의 재시작 · 수렴 판단에 쓴다
+_FRESH = 0   # 빈 body (새 블록 시작과 같음)
+_CONT  = 1   # 줄이 있는 body
+_OTHER = 2   # 그 밖의 태그 블록 진행 중
+
+# 줄 첫 글자 → 정규식을 더 확인할 줄 종류. 나머지 줄은 정규식 없이 본문으로 간다.
+_LINE_TAG     = 1   # [태그]
+_LINE_HEADING = 2   # # / ## / ###
+_LINE_DASH    = 3   # --- (HR) 또는 - 불릿
+_LINE_STAR    = 4   # * 불릿
+_LINE_KIND = {"[": _LINE_TAG, "#": _LINE_HEADING, "-": _LINE_DASH, "*": _LINE_STAR}
+
+_NO_PARAMS: list[str] = []   # 파라미터 없는 블록 공용 (읽기 전용)
+
+
 class _Block:
-    """파싱 중간 단계 블록"""
-    __slots__ = ("tag", "params", "lines")
+    """
+    파싱 중간 단계 블록
 
-    def __init__(self, tag: str = "body", params: list[str] | None = None):
+    start / end : 원본 줄 범위 (0 기반, end 미포함)
+    first       : lines[0] 의 줄 번호 (태그 블록은 태그 다음 줄)
+    hard        : 태그 행 · 헤딩으로 시작 — 이전 상태와 관계없이 새 블록
+    entry       : 블록 첫 줄을 읽기 직전의 토크나이저 상태
+    elements    : 블록에서 만든 요소 (src_lines 포함) — 블록을 닫을 때 채워진다
+    """
+    __slots__ = ("tag", "params", "lines", "start", "end", "first", "hard", "entry", "elements")
+
+    def __init__(
+        self,
+        tag: str,
+        params: list[str],
+        start: int,
+        first: int,
+        hard: bool = False,
+        entry: int = _FRESH,
+    ):
         self.tag    = tag
-        self.params = params or []
+        self.params = params
         self.lines: list[str] = []
+        self.start  = start
+        self.end    = start
+        self.first  = first
+        self.hard   = hard
+        self.entry  = entry
+        self.elements: list[DocumentElement] = []
 
     def text(self) -> str:
         return "\n".join(self.lines).strip()
 
 
-def _tokenize(body: str) -> list[_Block]:
+def _iter_blocks(
+    lines: Iterable[str],
+    offset: int = 0,
+    meta: DocMeta | None = None,
+    resolve_image: ImageResolver | None = None,
+    split_body: bool = False,
+    entry: int = _FRESH,
+) -> Iterator[_Block]:
     """
-    본문을 블록 단위로 분리.
+    줄 단위로 블록을 만들고, 같은 순회에서 요소까지 만들어 블록이 닫히는 대로 내보낸다.
     각 [태그] 행이 새 블록의 시작점이 된다.
-    """
-    blocks: list[_Block] = []
-    current = _Block("body")
 
-    for raw_line in body.splitlines():
-        line = raw_line.rstrip()
-
-        # 태그 행 감지
-        m = _RE_TAG_LINE.match(line)
-        if m:
-            if current.lines or current.tag != "body":
-                blocks.append(current)
-            tag    = m.group(1).strip().lower()
-            params = [p.strip() for p in m.group(2).split("|")] if m.group(2) else []
-            current = _Block(tag, params)
-            continue
+    줄마다 첫 글자로 종류를 가른 뒤 해당하는 정규식 하나만 확인한다 —
+    대부분을 차지하는 본문 · 빈 줄은 정규식 없이 바로 요소가 된다.
 
-        # 표준 마크다운 헤딩 — 현재 블록을 닫고 새 블록으로
-        if _RE_H1.match(line):
-            if current.lines or current.tag != "body":
-                blocks.append(current)
-            current = _Block("h1")
-            current.lines.append(line[2:].strip())   # "# " 제거
-            blocks.append(current)
-            current = _Block("body")
-            continue
-
-        if _RE_H2.match(line):
-            if current.lines or current.tag != "body":
-                blocks.append(current)
-            current = _Block("h2")
-            current.lines.append(line[3:].strip())
-            blocks.append(current)
-            current = _Block("body")
-            continue
-
-        if _RE_H3.match(line):
-            if current.lines or current.tag != "body":
-                blocks.append(current)
-            current = _Block("h3")
-            current.lines.append(line[4:].strip())
-            blocks.append(current)
-            current = _Block("body")
-            continue
+    offset        : 첫 줄의 줄 번호
+    meta          : chapter_title 요소에 쓸 메타 (없으면 빈 DocMeta)
+    resolve_image : [image] 파일명 resolver (없으면 이미지는 모두 placeholder)
+    split_body    : body 블록을 빈 줄 다음 문단마다 나눈다 (증분 파싱용 —
+                    요소 결과는 같고 블록만 잘게 쪼개진다)
+    entry         : 시작 상태 (_FRESH / _CONT)
+    """
+    meta = meta or DocMeta()
+    resolve_image = resolve_image or _no_image
+    # 반복문 안에서 쓰는 이름은 지역 변수로
+    line_kind    = _LINE_KIND.get
+    match_bullet = _RE_BULLET.match
+    Text, Bullets = TextElement, BulletsElement
+    BODY, BULLETS = ElementType.BODY, ElementType.BULLETS
+
+    current = _Block("body", _NO_PARAMS, offset, offset, False, entry)
+    add_line, add_element = current.lines.append, current.elements.append
+    in_body = True
+    bullets: list[str] = []
+    bullet_start = 0
+    i = offset - 1
+
+    for i, raw_line in enumerate(lines, offset):
+        line = raw_line.rstrip()
+        kind = line_kind(line[:1], 0)
+
+        if kind:
+            opener = None
+            if kind == _LINE_TAG:
+                # 태그 행 — 새 블록 시작
+                m = _RE_TAG_LINE.match(line)
+                if m:
+                    tag, rest = m.group(1, 2)
+                    params = [p.strip() for p in rest.split("|")] if rest else _NO_PARAMS
+                    opener = _Block(tag.strip().lower(), params, i, i + 1, True)
+            elif kind == _LINE_HEADING:
+                # 표준 마크다운 헤딩 — 한 줄짜리 블록
+                m = _RE_HEADING.match(line)
+                if m:
+                    level  = len(m.group(1))
+                    opener = _Block(_HEADING_TAGS[level], _NO_PARAMS, i, i, True)
+                    opener.lines.append(line[level + 1:].strip())
+            elif kind == _LINE_DASH and in_body and not current.lines and (
+                current.hard or current.entry != _CONT
+            ) and _RE_HR.match(line):
+                # HR (---) — 빈 body 에서만
+                opener = _Block("hr", _NO_PARAMS, i, i)
+
+            if opener is not None:
+                # 현재 블록 닫기
+                if in_body:
+                    state = _CONT if current.lines or (current.entry == _CONT and not current.hard) else _FRESH
+                    if bullets:
+                        add_element(Bullets(type=BULLETS, items=bullets, src_lines=(bullet_start, i)))
+                        bullets = []
+                    if current.lines or current.tag != "body":
+                        current.end = i
+                        yield current
+                else:
+                    state = _OTHER
+                    current.end = i
+                    yield _finish_block(current, meta, resolve_image)
+
+                if not opener.hard:   # HR
+                    opener.end = i + 1
+                    opener.elements.append(HRElement(type=ElementType.HR, src_lines=(i, i + 1)))
+                    yield opener
+                    current, in_body = _Block("body", _NO_PARAMS, i + 1, i + 1), True
+                elif kind == _LINE_HEADING:
+                    opener.entry = state
+                    opener.end = i + 1
+                    yield _finish_block(opener, meta, resolve_image)
+                    current, in_body = _Block("body", _NO_PARAMS, i + 1, i + 1), True
+                else:
+                    opener.entry = state
+                    current, in_body = opener, opener.tag == "body"
+                add_line, add_element = current.lines.append, current.elements.append
+                continue
 
-        # HR (---)
-        if _RE_HR.match(line) and current.tag == "body" and not current.lines:
-            blocks.append(_Block("hr"))
+        # 태그 블록 내용
+        if not in_body:
+            add_line(line)
             continue
 
-        current.lines.append(line)
-
-    if current.lines or current.tag != "body":
-        blocks.append(current)
-
-    return blocks
+        # 빈 줄 다음 문단에서 body 블록 나누기 (빈 줄에서 불릿은 이미 닫혔다)
+        if split_body and line and current.lines and not current.lines[-1]:
+            current.end = i
+            yield current
+            current = _Block("body", _NO_PARAMS, i, i, False, _CONT)
+            add_line, add_element = current.lines.append, current.elements.append
+        add_line(line)
+
+        # body 줄 → 불릿 항목 / 본문 요소
+        if kind >= _LINE_DASH:
+            bm = match_bullet(line)
+            if bm:
+                if not bullets:
+                    bullet_start = i
+                bullets.append(bm.group(1).strip())
+                continue
+        if bullets:
+            add_element(Bullets(type=BULLETS, items=bullets, src_lines=(bullet_start, i)))
+            bullets = []
+        if line:
+            add_element(Text(type=BODY, text=line.lstrip(), src_lines=(i, i + 1)))
+
+    if in_body:
+        if bullets:
+            add_element(Bullets(type=BULLETS, items=bullets, src_lines=(bullet_start, i + 1)))
+        if current.lines or current.tag != "body":
+            current.end = i + 1
+            yield current
+    else:
+        current.end = i + 1
+        yield _finish_block(current, meta, resolve_image)
+
+
+def _tokenize(
+    body: str,
+    offset: int = 0,
+    meta: DocMeta | None = None,
+    resolve_image: ImageResolver | None = None,
+) -> list[_Block]:
+    """본문을 블록 단위로 분리. offset 은 본문 첫 줄의 줄 번호."""
+    return list(_iter_blocks(body.splitlines(), offset, meta, resolve_image))
 
 
 # ─────────────────────────────────────────────
-# 블록 → dataclass 변환
+# 태그 블록 → dataclass 변환
 # ─────────────────────────────────────────────
 
-def _convert_block(block: _Block, meta: DocMeta, image_dir: str) -> list[DocumentElement]:
-    """블록 하나를 dataclass 목록으로 변환"""
-
-    tag   = block.tag
-    text  = block.text()
-    lines = [l for l in block.lines if l.strip()]
-
-    # ── chapter_title ──────────────────────────
-    if tag == "chapter_title":
-        sub = getattr(meta, "sub", "")
-        return [TextElement(
-            type=ElementType.CHAPTER_TITLE,
-            text=meta.title,
-            phase=meta.chapter,
-            sub=sub,
+def dir_image_resolver(image_dir: str) -> ImageResolver:
+    """image_dir 안에 파일이 있으면 그 경로를 돌려주는 기본 이미지 resolver"""
+    base = Path(image_dir)
+
+    def _resolve(filename: str) -> str | None:
+        local_path = str(base / filename)
+        try:
+            return local_path if Path(local_path).exists() else None
+        except OSError:   # 파일명으로 쓸 수 없는 문자열 (편집 중인 원고 등)
+            return None
+
+    return _resolve
+
+
+def _no_image(filename: str) -> None:
+    return None
+
+
+def _finish_block(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> _Block:
+    """닫힌 태그 · 헤딩 블록의 요소를 만들고 src_lines 를 블록 범위로 채운다"""
+    build = _TAG_BUILDERS.get(block.tag, _build_unknown)
+    elements = build(block, meta, resolve_image)
+    span = (block.start, block.end)
+    for el in elements:
+        el.src_lines = span
+    block.elements = elements
+    return block
+
+
+def _content_lines(block: _Block) -> list[str]:
+    return [l for l in block.lines if l]   # 줄은 이미 rstrip 되어 있다
+
+
+def _build_chapter_title(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    return [TextElement(
+        type=ElementType.CHAPTER_TITLE,
+        text=meta.title,
+        phase=meta.chapter,
+        sub=getattr(meta, "sub", ""),
+    )]
+
+
+def _build_h1(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    text = block.text()
+    m = _RE_H1_NUM.match(text)
+    if m:
+        return [TextElement(type=ElementType.H1, num=m.group(1), text=m.group(2))]
+    return [TextElement(type=ElementType.H1, num="•", text=text)]
+
+
+def _text_builder(elem_type: ElementType):
+    """블록 텍스트 전체를 담는 단일 TextElement (h2 · h3 · 텍스트 박스)"""
+    def _build(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+        return [TextElement(type=elem_type, text=block.text())]
+    return _build
+
+
+def _build_conclusion(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    return [ConclusionElement(type=ElementType.CONCLUSION, lines=_content_lines(block))]
+
+
+def _build_qa(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    question = ""
+    answers: list[str] = []
+    for l in _content_lines(block):
+        if l.startswith("Q:") or l.startswith("Q："):
+            question = l[2:].strip()
+        elif l.startswith("A:") or l.startswith("A："):
+            answers.append(l[2:].strip())
+    return [QAElement(type=ElementType.QA, question=question, answers=answers)]
+
+
+def _build_prompt(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    label = block.params[0] if block.params else ""
+    return [PromptElement(type=ElementType.PROMPT, label=label, text=block.text())]
+
+
+def _build_image(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    caption  = block.params[0] if block.params else ""
+    lines    = _content_lines(block)
+    filename = lines[0].strip() if lines else ""
+    found = resolve_image(filename) if filename else None
+    if found is not None:
+        in_memory = isinstance(found, (bytes, bytearray, memoryview))
+        data = bytes(found) if in_memory else None
+        # 헤더만 읽어 표시 크기를 채운다 — 모르면 0 (엔진이 최대 폭으로 추정)
+        info = probe_bytes(data) if in_memory else probe_image(found)
+        return [ImageElement(
+            type=ElementType.IMAGE,
+            filename=filename,
+            local_path="" if in_memory else str(found),
+            width_emu=info.width_emu if info else 0,
+            height_emu=info.height_emu if info else 0,
+            caption=caption,
+            data=data,
         )]
+    return [TextElement(type=ElementType.IMAGE_PLACEHOLDER, text=caption or filename)]
 
-    # ── h1 ─────────────────────────────────────
-    if tag == "h1":
-        m = _RE_H1_NUM.match(text)
-        if m:
-            return [TextElement(type=ElementType.H1, num=m.group(1), text=m.group(2))]
-        return [TextElement(type=ElementType.H1, num="•", text=text)]
-
-    # ── h2 ─────────────────────────────────────
-    if tag == "h2":
-        return [TextElement(type=ElementType.H2, text=text)]
-
-    # ── h3 ─────────────────────────────────────
-    if tag == "h3":
-        return [TextElement(type=ElementType.H3, text=text)]
-
-    # ── 텍스트 박스 단일 타입들 ─────────────────
-    if tag in {"insight", "tip", "warning", "quote"}:
-        type_map = {
-            "insight": ElementType.INSIGHT,
-            "tip":     ElementType.TIP,
-            "warning": ElementType.WARNING,
-            "quote":   ElementType.QUOTE,
-        }
-        return [TextElement(type=type_map[tag], text=text)]
-
-    # ── conclusion ────────────────────────────
-    if tag == "conclusion":
-        return [ConclusionElement(
-            type=ElementType.CONCLUSION,
-            lines=lines,
-        )]
 
-    # ── qa ────────────────────────────────────
-    if tag == "qa":
-        question = ""
-        answers: list[str] = []
-        for l in lines:
-            if l.startswith("Q:") or l.startswith("Q："):
-                question = l[2:].strip()
-            elif l.startswith("A:") or l.startswith("A："):
-                answers.append(l[2:].strip())
-        return [QAElement(
-            type=ElementType.QA,
-            question=question,
-            answers=answers,
-        )]
+def _build_table2(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    col1 = block.params[0] if len(block.params) > 0 else ""
+    col2 = block.params[1] if len(block.params) > 1 else ""
+    rows = []
+    for l in _content_lines(block):
+        parts = [p.strip() for p in l.split("|")]
+        if len(parts) >= 2:
+            rows.append([parts[0], parts[1]])
+    return [TableElement(type=ElementType.TABLE2, col1=col1, col2=col2, rows=rows)]
 
-    # ── prompt ────────────────────────────────
-    if tag == "prompt":
-        label = block.params[0] if block.params else ""
-        return [PromptElement(
-            type=ElementType.PROMPT,
-            label=label,
-            text=text,
-        )]
 
-    # ── image ─────────────────────────────────
-    if tag == "image":
-        caption  = block.params[0] if block.params else ""
-        filename = lines[0].strip() if lines else ""
-        local_path = str(Path(image_dir) / filename) if filename else ""
-        if filename and Path(local_path).exists():
-            return [ImageElement(
-                type=ElementType.IMAGE,
-                filename=filename,
-                local_path=local_path,
-                width_emu=0,
-                height_emu=0,
-                caption=caption,
-            )]
-        return [TextElement(
-            type=ElementType.IMAGE_PLACEHOLDER,
-            text=caption or filename,
-        )]
+def _build_table3(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    headers = block.params[:3] if block.params else []
+    rows = []
+    for l in _content_lines(block):
+        parts = [p.strip() for p in l.split("|")]
+        if len(parts) >= 3:
+            rows.append(parts[:3])
+    return [TableElement(type=ElementType.TABLE3, headers=headers, rows=rows)]
 
-    # ── table2 ────────────────────────────────
-    if tag == "table2":
-        col1 = block.params[0] if len(block.params) > 0 else ""
-        col2 = block.params[1] if len(block.params) > 1 else ""
-        rows = []
-        for l in lines:
-            parts = [p.strip() for p in l.split("|")]
-            if len(parts) >= 2:
-                rows.append([parts[0], parts[1]])
-        return [TableElement(
-            type=ElementType.TABLE2,
-            col1=col1, col2=col2,
-            rows=rows,
-        )]
 
-    # ── table3 ────────────────────────────────
-    if tag == "table3":
-        headers = block.params[:3] if block.params else []
-        rows = []
-        for l in lines:
-            parts = [p.strip() for p in l.split("|")]
-            if len(parts) >= 3:
-                rows.append(parts[:3])
-        return [TableElement(
-            type=ElementType.TABLE3,
-            headers=headers,
-            rows=rows,
-        )]
+def _build_hr(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    return [HRElement(type=ElementType.HR)]
 
-    # ── hr ────────────────────────────────────
-    if tag == "hr":
-        return [HRElement(type=ElementType.HR)]
 
-    # ── empty ─────────────────────────────────
-    if tag == "empty":
-        return [EmptyElement(type=ElementType.EMPTY)]
+def _build_empty(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    return [EmptyElement(type=ElementType.EMPTY)]
 
-    # ── body (기본) ───────────────────────────
-    if tag == "body":
-        results: list[DocumentElement] = []
-        bullet_buffer: list[str] = []
 
-        for l in block.lines:
-            # 불릿 항목
-            bm = _RE_BULLET.match(l)
-            if bm:
-                bullet_buffer.append(bm.group(1).strip())
-                continue
-
-            # 불릿 버퍼 flush
-            if bullet_buffer:
-                results.append(BulletsElement(
-                    type=ElementType.BULLETS,
-                    items=bullet_buffer[:],
-                ))
-                bullet_buffer = []
-
-            stripped = l.strip()
-            if stripped:
-                results.append(TextElement(type=ElementType.BODY, text=stripped))
-
-        if bullet_buffer:
-            results.append(BulletsElement(
-                type=ElementType.BULLETS,
-                items=bullet_buffer,
-            ))
-
-        return results
-
-    # ── 알 수 없는 태그 → body 처리 ─────────────
+def _build_unknown(block: _Block, meta: DocMeta, resolve_image: ImageResolver) -> list[DocumentElement]:
+    """알 수 없는 태그 → body 처리"""
+    text = block.text()
     if text:
         return [TextElement(type=ElementType.BODY, text=text)]
     return []
 
 
+# body 는 _iter_blocks 가 줄 단위로 직접 만든다
+_TAG_BUILDERS = {
+    "chapter_title": _build_chapter_title,
+    "h1":            _build_h1,
+    "h2":            _text_builder(ElementType.H2),
+    "h3":            _text_builder(ElementType.H3),
+    "insight":       _text_builder(ElementType.INSIGHT),
+    "tip":           _text_builder(ElementType.TIP),
+    "warning":       _text_builder(ElementType.WARNING),
+    "quote":         _text_builder(ElementType.QUOTE),
+    "conclusion":    _build_conclusion,
+    "qa":            _build_qa,
+    "prompt":        _build_prompt,
+    "image":         _build_image,
+    "table2":        _build_table2,
+    "table3":        _build_table3,
+    "hr":            _build_hr,
+    "empty":         _build_empty,
+}
+
+_HEADING_TAGS = {1: "h1", 2: "h2", 3: "h3"}
+
+
 # ─────────────────────────────────────────────
 # 메인 파서
 # ─────────────────────────────────────────────
@@ -402,25 +571,42 @@ def parse_md(
     image_dir = str(Path(image_dir).resolve()) + "/"
 
     raw = md_path.read_text(encoding="utf-8")
+    return parse_md_text(raw, image_dir=image_dir)
+
+
+def parse_md_text(
+    text: str,
+    image_resolver: ImageResolver | None = None,
+    image_dir: str = "",
+) -> ParsedDocument:
+    """
+    메모리의 구조화 마크다운 문자열을 파싱한다. (파일 없이 — 웹 업로드 등)
+
+    Parameters
+    ----------
+    text           : 원고 문자열
+    image_resolver : [image] 블록 파일명 → 로컬 경로 / 이미지 바이트 / None.
+                     참조된 이미지만 필요할 때 호출된다. None 이면 image_dir
+                     디렉터리에서 찾는다 (dir_image_resolver).
+    image_dir      : 기본 resolver 가 볼 디렉터리 · image_base_dir.
+                     resolver 와 image_dir 가 모두 없으면 이미지는 찾지 않는다
+                     (전부 IMAGE_PLACEHOLDER — 업로드 원고가 서버 경로를 보지 않게).
+    """
+    if image_dir:
+        image_dir = str(Path(image_dir).resolve()) + "/"
+    resolve_image = image_resolver or (dir_image_resolver(image_dir) if image_dir else _no_image)
 
     # 1. 프론트매터 파싱
-    meta, body = _parse_frontmatter(raw)
+    meta, body = _parse_frontmatter(text)
 
     # DocMeta 에 sub 속성이 없으면 동적으로 추가
     if not hasattr(meta, "sub"):
         meta.sub = ""  # type: ignore[attr-defined]
 
-    # 2. 블록 토크나이징
-    blocks = _tokenize(body)
-
-    # 3. 블록 → dataclass
+    # 2. 토크나이징 + 블록 → dataclass (한 번 순회, 줄 번호는 프론트매터 포함 파일 기준)
     elements: list[DocumentElement] = []
-    for block in blocks:
-        converted = _convert_block(block, meta, image_dir)
-        elements.extend(converted)
-
-    # 4. 빈 요소 제거
-    elements = [e for e in elements if e is not None]
+    for block in _iter_blocks(body.splitlines(), _body_offset(text, body), meta, resolve_image):
+        elements.extend(block.elements)
 
     return ParsedDocument(
         meta=meta,
@@ -430,6 +616,265 @@ def parse_md(
     )
 
 
+def stream_md(
+    source: str | os.PathLike | IO,
+    image_dir: str = "",
+) -> ParsedDocument:
+    """
+    parse_md 의 스트리밍 버전.
+
+    프론트매터만 바로 읽고, elements 는 블록이 닫힐 때마다 요소를 내보내는
+    생성기다. (한 번만 순회 가능 — len() 불가)
+    bridge/json_builder.write_json 과 함께 쓰면 원고 크기와 관계없이
+    일정한 메모리로 엔진 입력을 만들 수 있다.
+
+    Parameters
+    ----------
+    source    : .md 경로 또는 열린 텍스트 / 바이너리 스트림 (UTF-8)
+    image_dir : 이미지 디렉터리 (비어있으면 .md 와 같은 디렉터리,
+                이름 없는 스트림이면 현재 디렉터리)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        md_path = Path(source).resolve()
+        if not md_path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {md_path}")
+        stream: IO[str] = open(md_path, encoding="utf-8")
+        owned = True
+        base = md_path.parent
+    else:
+        stream = source if isinstance(source, io.TextIOBase) else io.TextIOWrapper(source, encoding="utf-8")
+        owned = False
+        name = getattr(source, "name", None)
+        base = Path(name).resolve().parent if isinstance(name, str) and name else Path.cwd()
+
+    if not image_dir:
+        image_dir = str(base)
+    image_dir = str(Path(image_dir).resolve()) + "/"
+    resolve_image = dir_image_resolver(image_dir)
+
+    try:
+        chunks = iter(stream)
+        meta, head, offset = _read_frontmatter(chunks)
+    except BaseException:
+        if owned:
+            stream.close()
+        raise
+
+    def _lines() -> Iterator[str]:
+        yield from head.splitlines()
+        for chunk in chunks:
+            yield from chunk.splitlines()
+
+    def _elements() -> Iterator[DocumentElement]:
+        try:
+            for block in _iter_blocks(_lines(), offset, meta, resolve_image):
+                yield from block.elements
+        finally:
+            if owned:
+                stream.close()
+
+    return ParsedDocument(
+        meta=meta,
+        elements=_elements(),   # type: ignore[arg-type]  # 지연 생성
+        image_map={},
+        image_base_dir=image_dir,
+    )
+
+
+def iter_md_elements(
+    source: str | os.PathLike | IO,
+    image_dir: str = "",
+) -> Iterator[DocumentElement]:
+    """구조화 마크다운을 줄 단위로 읽으며 DocumentElement 를 하나씩 내보낸다"""
+    return stream_md(source, image_dir).elements
+
+
+def list_image_refs(md_path: str, image_dir: str = "") -> list[str]:
+    """
+    [image] 블록이 참조하는 이미지 파일의 절대 경로 목록.
+    전체 파싱 없이 토크나이징만 수행한다. (변환 캐시 키 계산용)
+    """
+    md_path = Path(md_path).resolve()
+    if not image_dir:
+        image_dir = str(md_path.parent)
+
+    _, body = _parse_frontmatter(md_path.read_text(encoding="utf-8"))
+
+    refs: list[str] = []
+    for block in _tokenize(body):
+        if block.tag != "image":
+            continue
+        lines = _content_lines(block)
+        if lines:
+            refs.append(str(Path(image_dir).resolve() / lines[0].strip()))
+    return refs
+
+
+# ─────────────────────────────────────────────
+# 증분 파싱 (편집기용)
+# ─────────────────────────────────────────────
+
+def _block_start(block: _Block) -> int:
+    return block.start
+
+
+def _element_start(el: DocumentElement) -> int:
+    return el.src_lines[0]
+
+
+class IncrementalMdParser:
+    """
+    편집기용 증분 파서.
+
+        inc = IncrementalMdParser(text, image_dir)
+        inc.document                         # parse_md 와 같은 ParsedDocument (src_lines 포함)
+        a, b, c = inc.edit(10, 11, ["고친 문단"])
+        # document.elements[a:c] 가 새 요소 (편집 전 [a:b] 를 대체)
+
+    편집 범위 앞의 안전한 재시작 지점(태그 · 헤딩 행, 빈 body, 빈 줄 다음 문단)
+    부터 다시 토크나이징하고, 편집 범위 뒤에서 이전 블록과 상태가 같아지는
+    지점(수렴)을 만나면 멈춘 뒤 나머지 블록 · 요소를 그대로 재사용한다.
+    줄 수가 바뀌면 뒤쪽 블록 · 요소의 줄 번호만 옮긴다.
+
+    프론트매터(또는 그 바로 다음 줄)를 고치면 전체를 다시 파싱한다.
+    document 는 제자리에서 갱신되므로 parse_cache 가 가진 객체를 넘기면 안 된다.
+    """
+
+    def __init__(self, text: str, image_dir: str = "", image_resolver: ImageResolver | None = None):
+        self._image_dir = str(Path(image_dir or ".").resolve()) + "/"
+        self._resolve_image = image_resolver or dir_image_resolver(self._image_dir)
+        self._lines: list[str] = text.splitlines()
+        # str.splitlines 기준 줄 경계(\v · \f · \u2028 등 포함)로 끝나는지
+        self._final_newline = bool(text) and len((text + "x").splitlines()) > len(self._lines)
+        self._blocks: list[_Block] = []
+        self.document = ParsedDocument(image_map={}, image_base_dir=self._image_dir)
+        self._reparse_all()
+
+    @property
+    def lines(self) -> list[str]:
+        return self._lines
+
+    def text(self) -> str:
+        """현재 원고 — text().splitlines() 가 lines 와 같다"""
+        if not self._lines:
+            return ""
+        # 마지막 줄이 비어 있으면 줄바꿈으로 끝나야 splitlines 가 그 줄을 살린다
+        end = "\n" if self._final_newline or not self._lines[-1] else ""
+        return "\n".join(self._lines) + end
+
+    def _reparse_all(self) -> None:
+        text = self.text()
+        meta, body = _parse_frontmatter(text)
+        self._body_start = _body_offset(text, body)
+        # 첫 줄이 "---" 인데 프론트매터가 없거나 다음 줄이 비어 있으면 (여는 --- 뒤 공백을
+        # 어디까지 먹는지가 달라질 수 있어) 뒤쪽 편집도 프론트매터 범위를 바꿀 수 있다
+        lines = self._lines
+        self._always_full = bool(lines) and bool(_RE_FM_OPEN.match(lines[0])) and (
+            self._body_start == 0 or (len(lines) > 1 and not lines[1].strip())
+        )
+        self._blocks = list(_iter_blocks(
+            self._lines[self._body_start:], self._body_start, meta, self._resolve_image, split_body=True,
+        ))
+
+        elements: list[DocumentElement] = []
+        for block in self._blocks:
+            elements.extend(block.elements)
+        self.document.meta = meta
+        self.document.elements = elements
+
+    def _restart_index(self, start: int) -> int:
+        """start 줄 편집 전 상태를 알 수 있는 가장 가까운 블록 인덱스 (없으면 -1)"""
+        blocks = self._blocks
+        j = bisect.bisect_right(blocks, start, key=_block_start) - 1
+        while j >= 0:
+            b = blocks[j]
+            if b.hard and b.start < start:
+                return j
+            if b.start <= start:
+                if b.entry == _FRESH and not b.hard:
+                    return j
+                if b.entry == _CONT and not b.hard and b.start > 0 and not self._lines[b.start - 1].strip():
+                    return j
+                if b.hard and b.entry == _FRESH:
+                    return j
+            j -= 1
+        return -1
+
+    def edit(self, start: int, end: int, new_lines: list[str]) -> tuple[int, int, int]:
+        """
+        [start, end) 줄(0 기반)을 new_lines 로 바꾸고 영향받은 블록만 다시 파싱한다.
+
+        Returns
+        -------
+        (요소 시작 인덱스, 편집 전 끝 인덱스, 편집 후 끝 인덱스)
+        """
+        if not 0 <= start <= end <= len(self._lines):
+            raise ValueError(f"잘못된 편집 범위: [{start}, {end}) / {len(self._lines)}줄")
+        new_lines = [part for line in new_lines for part in (line.splitlines() or [""])]
+        elements = self.document.elements
+        n_before = len(elements)
+
+        if start <= self._body_start or self._always_full:
+            self._lines[start:end] = new_lines
+            self._reparse_all()
+            return 0, n_before, len(self.document.elements)
+
+        delta = len(new_lines) - (end - start)
+        self._lines[start:end] = new_lines
+        new_end = start + len(new_lines)
+        blocks = self._blocks
+
+        j = self._restart_index(start)
+        if j < 0:
+            b0, restart, entry = 0, self._body_start, _FRESH
+        else:
+            b0, restart = j, blocks[j].start
+            entry = _FRESH if blocks[j].hard else blocks[j].entry
+        e0 = bisect.bisect_left(elements, restart, key=_element_start)
+
+        # 다시 토크나이징 — 편집 뒤에서 이전 블록과 같은 상태로 시작하는 블록을 만나면 중단
+        meta = self.document.meta
+        fresh_blocks: list[_Block] = []
+        b1 = len(blocks)
+        for block in _iter_blocks(
+            islice(self._lines, restart, None), restart, meta, self._resolve_image,
+            split_body=True, entry=entry,
+        ):
+            if block.start >= new_end:
+                old_start = block.start - delta
+                k = bisect.bisect_left(blocks, old_start, lo=b0, key=_block_start)
+                if k < len(blocks) and blocks[k].start == old_start and (
+                    block.hard or (not blocks[k].hard and blocks[k].entry == block.entry)
+                ):
+                    blocks[k].entry = block.entry
+                    b1 = k
+                    break
+            fresh_blocks.append(block)
+        # 태그 · 헤딩 행에서 다시 시작했으면 그 앞 상태는 이전 값을 유지
+        if j >= 0 and blocks[j].hard and fresh_blocks and fresh_blocks[0].start == restart:
+            fresh_blocks[0].entry = blocks[j].entry
+
+        e1 = bisect.bisect_left(elements, blocks[b1].start, key=_element_start) if b1 < len(blocks) else n_before
+
+        fresh_elements: list[DocumentElement] = []
+        for block in fresh_blocks:
+            fresh_elements.extend(block.elements)
+
+        blocks[b0:b1] = fresh_blocks
+        elements[e0:e1] = fresh_elements
+
+        if delta:
+            for block in islice(blocks, b0 + len(fresh_blocks), None):
+                block.start += delta
+                block.end   += delta
+                block.first += delta
+            for el in islice(elements, e0 + len(fresh_elements), None):
+                a, b = el.src_lines
+                el.src_lines = (a + delta, b + delta)
+
+        return e0, e1, e0 + len(fresh_elements)
+
+
 # ─────────────────────────────────────────────
 # 단독 실행 테스트
 # ─────────────────────────────────────────────
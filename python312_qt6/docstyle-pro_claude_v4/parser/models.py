@@ -3,13 +3,20 @@ models.py — DocStyle Pro 파싱 결과 데이터 모델
 
 모든 파서 모듈은 이 파일의 dataclass만 반환한다.
 JSON 직렬화는 bridge/json_builder.py 에서 담당한다.
+
+요소 dataclass 는 __slots__ 를 쓴다 (요소마다 __dict__ 없음 — 5만 단락 원고에서
+요소 하나당 메모리가 크게 준다). 선언하지 않은 속성은 붙일 수 없다.
+많은 문서를 오래 보관할 때는 ElementStore(열 단위 저장소)로 더 줄일 수 있다.
 """
 
 from __future__ import annotations
 
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
 
 # ─────────────────────────────────────────────
@@ -40,11 +47,24 @@ class ElementType(str, Enum):
     CAPTION           = "caption"        # 이미지 직후 짧은 설명 (내부 처리용)
 
 
+# 열거형 멤버와 빈 문자열("")은 원래 하나씩만 있어 모든 요소가 공유한다.
+# 여러 요소에 되풀이되는 짧은 이름표(프롬프트 라벨, 표 헤더)는 intern 해서 공유한다.
+_INTERN_MAX = 32
+
+
+def intern_label(s: str) -> str:
+    """짧은 문자열을 intern (같은 값이면 같은 객체)"""
+    return sys.intern(s) if type(s) is str and len(s) <= _INTERN_MAX else s
+
+
 # ─────────────────────────────────────────────
 # 개별 요소 dataclass
 # ─────────────────────────────────────────────
+#
+# src_lines — 원본 .md 의 (시작 줄, 끝 줄) 0 기반 · 끝 미포함.
+# md_parser 만 채운다 (docx 는 None). 비교(==)에서는 제외.
 
-@dataclass
+@dataclass(slots=True)
 class TextElement:
     """h1 ~ h3, body, quote, insight, tip, warning"""
     type:   ElementType
@@ -55,35 +75,43 @@ class TextElement:
     indent: int         = 0      # body 들여쓰기 DXA
     bold:   bool        = False
     italic: bool        = False
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class QAElement:
     type:     ElementType = ElementType.QA
     question: str         = ""
     answers:  list[str]   = field(default_factory=list)
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptElement:
     type:   ElementType = ElementType.PROMPT
     label:  str         = ""
     text:   str         = ""
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
+    def __post_init__(self):
+        self.label = intern_label(self.label)
 
-@dataclass
+
+@dataclass(slots=True)
 class ConclusionElement:
     type:  ElementType = ElementType.CONCLUSION
     lines: list[str]   = field(default_factory=list)
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BulletsElement:
     type:  ElementType = ElementType.BULLETS
     items: list[str]   = field(default_factory=list)
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageElement:
     type:       ElementType = ElementType.IMAGE
     filename:   str         = ""    # image1.png
@@ -91,9 +119,11 @@ class ImageElement:
     width_emu:  int         = 0
     height_emu: int         = 0
     caption:    str         = ""
+    data:       bytes | None = field(default=None, compare=False, repr=False)   # 메모리 이미지 (local_path 대신)
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableElement:
     type:    ElementType  = ElementType.TABLE2
     col1:    str          = ""     # table2 헤더
@@ -102,18 +132,26 @@ class TableElement:
     rows:    list         = field(default_factory=list)
     # table2 rows: [[왼쪽, 오른쪽], ...]
     # table3 rows: [[col1, col2, col3], ...]
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
+    def __post_init__(self):
+        self.col1 = intern_label(self.col1)
+        self.col2 = intern_label(self.col2)
+        self.headers = [intern_label(h) for h in self.headers]
 
-@dataclass
+
+@dataclass(slots=True)
 class HRElement:
     type: ElementType = ElementType.HR
     size: int         = 4
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmptyElement:
     type:   ElementType = ElementType.EMPTY
     height: int         = 120
+    src_lines: tuple[int, int] | None = field(default=None, compare=False, repr=False)
 
 
 # ─────────────────────────────────────────────
@@ -134,6 +172,10 @@ DocumentElement = (
 )
 
 
+# 이미지 파일명 → 로컬 경로(str) / 이미지 바이트 / None(없음 — placeholder)
+ImageResolver = Callable[[str], "str | bytes | None"]
+
+
 @dataclass
 class DocMeta:
     """문서 메타 정보"""
@@ -143,6 +185,15 @@ class DocMeta:
     sub:     str = ""   # 챕터 부제 (DS-ChapterTitle 에서 추출)
 
 
+@dataclass
+class ChapterInfo:
+    """parse_book 으로 합친 문서의 챕터 하나 — elements[start:end]"""
+    path:  str     = ""
+    meta:  DocMeta = field(default_factory=DocMeta)
+    start: int     = 0
+    end:   int     = 0
+
+
 @dataclass
 class ParsedDocument:
     """
@@ -154,3 +205,110 @@ class ParsedDocument:
     image_map:     dict[str, str] = field(default_factory=dict)
     # image_map = {"image1.png": "temp/images/abc123/image1.png"}
     image_base_dir: str           = ""
+    chapters:      list[ChapterInfo] = field(default_factory=list)   # parse_book 만 채움
+
+    def compact(self) -> ParsedDocument:
+        """elements 를 ElementStore 로 바꾼 복사본 (이미 저장소면 그대로)"""
+        if isinstance(self.elements, ElementStore):
+            return self
+        return ParsedDocument(
+            meta=self.meta,
+            elements=ElementStore(self.elements),
+            image_map=self.image_map,
+            image_base_dir=self.image_base_dir,
+            chapters=self.chapters,
+        )
+
+
+# ─────────────────────────────────────────────
+# 열 단위 요소 저장소 (선택)
+# ─────────────────────────────────────────────
+
+_TYPES = list(ElementType)
+_TYPE_CODE = {t: i for i, t in enumerate(_TYPES)}
+_OBJECT = 0xFF                 # TextElement 가 아닌 요소 — 객체를 그대로 보관
+_NO_LINE = -1                  # src_lines 없음
+_TEXT_EXTRA_DEFAULT = ("", "", "", 0, False, False)   # num, sub, phase, indent, bold, italic
+
+
+class ElementStore(Sequence):
+    """
+    읽기 전용 열 단위 요소 목록 — ParsedDocument.elements 자리에 쓸 수 있다.
+
+    요소의 대부분인 TextElement 를 객체 대신 열로 나눠 보관한다.
+        타입      array('B')  (ElementType 번호, 다른 요소는 0xFF)
+        본문      list[str]   (같은 문자열은 하나만)
+        src_lines array('q')  (시작, 끝 — 없으면 -1)
+        나머지 필드 (num, sub, phase, indent, bold, italic) 는 기본값이 아닐 때만 dict 에
+
+    다른 요소(표 · 이미지 · Q&A 등)는 객체를 그대로 둔다.
+    인덱스로 읽을 때마다 TextElement 를 새로 만들므로 꺼낸 요소를 고쳐도
+    저장소에는 반영되지 않는다. 고칠 때는 list(store) 로 풀어서 쓴다.
+    """
+
+    __slots__ = ("_types", "_text", "_lines", "_extra", "_objects")
+
+    def __init__(self, elements=()):
+        self._types:   array              = array("B")
+        self._text:    list[str]          = []
+        self._lines:   array              = array("q")
+        self._extra:   dict[int, tuple]   = {}
+        self._objects: dict[int, object]  = {}
+        self.extend(elements)
+
+    def extend(self, elements) -> None:
+        types, text, lines = self._types, self._text, self._lines
+        extra, objects = self._extra, self._objects
+        strings: dict[str, str] = {}
+        for el in elements:
+            i = len(types)
+            if type(el) is not TextElement:
+                types.append(_OBJECT)
+                text.append("")
+                lines.extend((_NO_LINE, _NO_LINE))
+                objects[i] = el
+                continue
+            types.append(_TYPE_CODE[el.type])
+            text.append(strings.setdefault(el.text, el.text))
+            lines.extend(el.src_lines or (_NO_LINE, _NO_LINE))
+            rest = (el.num, el.sub, el.phase, el.indent, el.bold, el.italic)
+            if rest != _TEXT_EXTRA_DEFAULT:
+                extra[i] = rest
+
+    def append(self, el: DocumentElement) -> None:
+        self.extend((el,))
+
+    def _element(self, i: int, code: int) -> DocumentElement:
+        if code == _OBJECT:
+            return self._objects[i]
+        start = self._lines[2 * i]
+        src = None if start == _NO_LINE else (start, self._lines[2 * i + 1])
+        extra = self._extra.get(i)
+        if extra is None:
+            return TextElement(_TYPES[code], self._text[i], src_lines=src)
+        return TextElement(_TYPES[code], self._text[i], *extra, src)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._element(i, self._types[i]) for i in range(*index.indices(len(self._types)))]
+        if index < 0:
+            index += len(self._types)
+        if not 0 <= index < len(self._types):
+            raise IndexError("ElementStore index out of range")
+        return self._element(index, self._types[index])
+
+    def __iter__(self) -> Iterator[DocumentElement]:
+        element = self._element
+        for i, code in enumerate(self._types):
+            yield element(i, code)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (ElementStore, list)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"ElementStore({len(self)} elements)"
@@ -0,0 +1,281 @@
+"""
+parse_cache.py — ParsedDocument 메모이제이션
+
+같은 파일로 템플릿만 바꿔 미리보기를 반복하면 parse_md / parse_docx 와
+이미지 추출이 매번 다시 돈다. 이 캐시는 (경로, mtime, 크기, 파서 옵션) 을
+키로 ParsedDocument 를 보관해 두 번째부터는 파싱을 건너뛰게 한다.
+
+    doc, hit = get_parse_cache().parse(path, "docx", loader, options=(chapter,))
+
+계층
+    1. 메모리 LRU (기본 16개)
+    2. 디스크 (선택) — pickle + zlib 압축, DOCSTYLE_PARSE_CACHE_DIR 로 활성화
+
+DOCSTYLE_PARSE_CACHE_COMPACT=1 이면 보관할 때 elements 를 ElementStore(열 단위)로
+바꿔 메모리를 줄인다. 적중한 결과의 elements 는 읽기 전용 시퀀스가 된다.
+
+docx 결과의 image_map 은 temp/images/{uuid}/ 의 추출 이미지를 가리키므로
+캐시에 들어간 세션 디렉터리는 변환 후 지우지 않고, 항목이 캐시에서
+빠질 때(또는 프로세스 종료 시) 정리한다.
+
+.md 결과는 참조 이미지의 유무로 placeholder 여부가 갈리므로, 호출자가
+file_states(list_image_refs(...)) 를 options 에 넣어 이미지 추가 · 교체 · 삭제도
+키에 반영한다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import os
+import pickle
+import threading
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable
+
+from .image_extractor import cleanup_session
+from .models import ImageElement, ParsedDocument
+
+
+_DEFAULT_MAX_ENTRIES      = 16
+_DEFAULT_MAX_DISK_ENTRIES = 64
+_DEFAULT_COMPACT          = os.getenv("DOCSTYLE_PARSE_CACHE_COMPACT", "0") == "1"
+
+# 모델/파서 구조가 바뀌면 올린다 — 디스크 항목 무효화
+_DISK_SCHEMA = 5
+
+
+class ParseCache:
+    """
+    Parameters
+    ----------
+    max_entries      : 메모리 보관 개수
+    disk_dir         : 디스크 계층 디렉터리 (None 이면 메모리만)
+    max_disk_entries : 디스크 보관 개수
+    compact          : True 면 elements 를 ElementStore 로 바꿔 보관
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        disk_dir: str | Path | None = None,
+        max_disk_entries: int = _DEFAULT_MAX_DISK_ENTRIES,
+        compact: bool = _DEFAULT_COMPACT,
+    ):
+        self.max_entries      = max_entries
+        self.disk_dir         = Path(disk_dir) if disk_dir else None
+        self.max_disk_entries = max_disk_entries
+        self.compact          = compact
+        self.hits   = 0
+        self.misses = 0
+        self._mem: OrderedDict[tuple, ParsedDocument] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ── 키 ───────────────────────────────────
+
+    @staticmethod
+    def make_key(path: str, kind: str, options: tuple = ()) -> tuple:
+        p  = Path(path).resolve()
+        st = p.stat()
+        return (str(p), st.st_mtime_ns, st.st_size, kind, options)
+
+    @staticmethod
+    def _disk_name(key: tuple) -> str:
+        return hashlib.sha256(repr((_DISK_SCHEMA, key)).encode("utf-8")).hexdigest() + ".bin"
+
+    # ── 공개 API ─────────────────────────────
+
+    def parse(
+        self,
+        path: str,
+        kind: str,
+        loader: Callable[[], ParsedDocument],
+        options: tuple = (),
+    ) -> tuple[ParsedDocument, bool]:
+        """
+        캐시에 있으면 그 결과를, 없으면 loader() 결과를 저장 후 반환.
+
+        Returns
+        -------
+        (ParsedDocument, 적중 여부)
+        """
+        key = self.make_key(path, kind, options)
+        doc = self.get(key)
+        if doc is not None:
+            return doc, True
+        doc = loader()
+        self.put(key, doc)
+        return doc, False
+
+    def get(self, key: tuple) -> ParsedDocument | None:
+        """
+        make_key() 키로 조회 (없으면 None — 미적중으로 센다).
+        여러 파일을 한꺼번에 병렬 파싱할 때처럼 loader 를 바로 부를 수 없으면
+        get() 으로 빠진 것만 골라 파싱한 뒤 put() 한다.
+        """
+        with self._lock:
+            doc = self._mem.get(key)
+            if doc is not None:
+                self._mem.move_to_end(key)
+                self.hits += 1
+                return doc
+
+        doc = self._disk_get(key)
+        if doc is not None:
+            with self._lock:
+                self.hits += 1
+            self._mem_put(key, doc)
+            return doc
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: tuple, doc: ParsedDocument) -> None:
+        if self.compact:
+            doc = doc.compact()
+        replaced = self._mem_put(key, doc)
+        self._disk_put(key, doc)
+        # 디스크 항목도 새 결과로 바뀌었으니 밀려난 결과의 이미지는 더 참조되지 않는다
+        if replaced is not None and self.disk_dir is not None:
+            self._release_images(replaced)
+
+    def clear(self) -> None:
+        with self._lock:
+            docs = list(self._mem.values())
+            self._mem.clear()
+        if self.disk_dir is None:
+            for doc in docs:
+                self._release_images(doc)
+
+    # ── 메모리 계층 ──────────────────────────
+
+    def _mem_put(self, key: tuple, doc: ParsedDocument) -> ParsedDocument | None:
+        """
+        메모리 계층에 넣는다. 같은 키에 이미지 디렉터리가 다른 결과가 있었으면
+        (두 스레드가 같은 파일을 동시에 놓쳐 각자 파싱한 경우) 그 결과를 반환한다.
+        """
+        evicted: list[ParsedDocument] = []
+        replaced = None
+        with self._lock:
+            old = self._mem.pop(key, None)
+            if old is not None and old is not doc and old.image_base_dir != doc.image_base_dir:
+                replaced = old
+            self._mem[key] = doc
+            self._mem.move_to_end(key)
+            while len(self._mem) > self.max_entries:
+                _, old = self._mem.popitem(last=False)
+                evicted.append(old)
+        # 디스크 계층이 있으면 이미지 디렉터리는 디스크 항목이 계속 참조
+        if self.disk_dir is None:
+            for old in evicted:
+                self._release_images(old)
+            if replaced is not None:
+                self._release_images(replaced)
+        return replaced
+
+    def _in_memory(self, image_base_dir: str) -> bool:
+        with self._lock:
+            return any(d.image_base_dir == image_base_dir for d in self._mem.values())
+
+    @staticmethod
+    def _release_images(doc: ParsedDocument) -> None:
+        # .md 는 원본 디렉터리를 가리키므로 추출 세션(docx)만 정리
+        if doc.image_map and doc.image_base_dir:
+            try:
+                cleanup_session(doc.image_base_dir)
+            except OSError:
+                pass
+
+    # ── 디스크 계층 ──────────────────────────
+
+    def _disk_get(self, key: tuple) -> ParsedDocument | None:
+        if self.disk_dir is None:
+            return None
+        f = self.disk_dir / self._disk_name(key)
+        try:
+            doc = pickle.loads(zlib.decompress(f.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except Exception:
+            f.unlink(missing_ok=True)
+            return None
+        if not _images_present(doc):
+            f.unlink(missing_ok=True)
+            return None
+        os.utime(f)
+        return doc
+
+    def _disk_put(self, key: tuple, doc: ParsedDocument) -> None:
+        if self.disk_dir is None:
+            return
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            f = self.disk_dir / self._disk_name(key)
+            tmp = f.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(zlib.compress(pickle.dumps(doc, pickle.HIGHEST_PROTOCOL), 6))
+            os.replace(tmp, f)
+        except Exception:
+            return
+        self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        files = sorted(self.disk_dir.glob("*.bin"), key=lambda f: f.stat().st_mtime_ns)
+        for f in files[: max(0, len(files) - self.max_disk_entries)]:
+            try:
+                doc = pickle.loads(zlib.decompress(f.read_bytes()))
+                if not self._in_memory(doc.image_base_dir):
+                    self._release_images(doc)
+            except Exception:
+                pass
+            f.unlink(missing_ok=True)
+
+
+def file_states(paths: list[str]) -> tuple:
+    """캐시 키용 파일 상태 — 경로별 (mtime, 크기), 없으면 None"""
+    states = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            states.append((path, None))
+        else:
+            states.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(states)
+
+
+def _images_present(doc: ParsedDocument) -> bool:
+    """디스크에서 되살린 결과가 가리키는 이미지가 아직 남아있는지"""
+    for path in doc.image_map.values():
+        if not os.path.exists(path):
+            return False
+    for el in doc.elements:
+        if isinstance(el, ImageElement) and el.local_path and not os.path.exists(el.local_path):
+            return False
+    return True
+
+
+# ─────────────────────────────────────────────
+# 프로세스 전역 캐시
+# ─────────────────────────────────────────────
+
+_cache: ParseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ParseCache(disk_dir=os.getenv("DOCSTYLE_PARSE_CACHE_DIR") or None)
+        return _cache
+
+
+def _cleanup_at_exit() -> None:
+    if _cache is not None:
+        _cache.clear()
+
+
+atexit.register(_cleanup_at_exit)
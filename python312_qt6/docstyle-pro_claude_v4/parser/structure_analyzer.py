@@ -27,7 +27,7 @@ DS-Caption        → caption
 from __future__ import annotations
 
 import re
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 from docx.oxml.ns import qn
 from docx.shared import Pt
@@ -43,6 +43,7 @@ from .models import (
     QAElement,
     TableElement,
     TextElement,
+    intern_label,
 )
 
 
@@ -107,17 +108,23 @@ def _all_bold(para) -> bool:
     return bool(runs) and all(r.bold for r in runs)
 
 
+_RE_SPACES = re.compile(r"\s+")
+
+
+def clean_text(text: str) -> str:
+    """연속 공백을 하나로 — 단락 텍스트 정규화 (docx_fast 공용)"""
+    return _RE_SPACES.sub(" ", text).strip()
+
+
 def _clean_text(para) -> str:
-    return re.sub(r"\s+", " ", para.text).strip()
+    return clean_text(para.text)
 
 
 def _has_image(para) -> bool:
     return bool(para._p.findall(".//" + qn("w:drawing")))
 
 
-def _is_list_para(para) -> bool:
-    if "list" in _style_name(para):
-        return True
+def _has_numbering(para) -> bool:
     return para._p.find(".//" + qn("w:numPr")) is not None
 
 
@@ -142,17 +149,54 @@ def _extract_image_rel_id(para) -> tuple[str, int, int]:
 # Prompt 라벨 파싱
 # ─────────────────────────────────────────────
 
+_RE_PROMPT_LABEL = re.compile(r"^(.{1,30})[:：]\s*(.+)$")
+_RE_LABEL_ONLY   = re.compile(r"^(.{1,30})[:：]\s*$")
+
+
 def _parse_prompt_label(text: str) -> tuple[str, str]:
     """
     'PrompT 라벨: 본문 텍스트' 또는 '라벨:' + 다음 줄 텍스트
     단일 단락인 경우 ':' 앞을 라벨로 처리.
     """
-    m = re.match(r"^(.{1,30})[:：]\s*(.+)$", text)
+    m = _RE_PROMPT_LABEL.match(text)
     if m:
         return m.group(1).strip(), m.group(2).strip()
     return "", text
 
 
+# ─────────────────────────────────────────────
+# 단락 특징
+# ─────────────────────────────────────────────
+
+class ParagraphFeatures(NamedTuple):
+    """
+    분류 규칙이 보는 단락 정보.
+    python-docx Paragraph (paragraph_features) 와 lxml 경로(docx_fast)가
+    같은 값을 만들고, 분류는 classify_features 한 곳에서 한다.
+    """
+    style:    str                           # 스타일 이름 (소문자)
+    text:     str                           # clean_text 적용
+    size:     float                         # 최대 폰트 크기(pt)
+    indent:   int                           # 왼쪽 들여쓰기 (EMU)
+    all_bold: bool
+    is_list:  bool
+    image:    tuple[str, int, int] | None   # 이미지 단락이면 (rId, cx, cy)
+
+
+def paragraph_features(para) -> ParagraphFeatures:
+    """python-docx Paragraph → ParagraphFeatures"""
+    style = _style_name(para)   # para.style 조회는 비싸다 — 한 번만
+    return ParagraphFeatures(
+        style=style,
+        text=_clean_text(para),
+        size=_font_size_pt(para),
+        indent=_indent_twips(para),
+        all_bold=_all_bold(para),
+        is_list="list" in style or _has_numbering(para),
+        image=_extract_image_rel_id(para) if _has_image(para) else None,
+    )
+
+
 # ─────────────────────────────────────────────
 # 단락 분류 (핵심 함수)
 # ─────────────────────────────────────────────
@@ -170,29 +214,39 @@ def classify_paragraph(
     Parameters
     ----------
     para          : docx Paragraph
-    image_map     : {"image1.png": "/abs/path/..."}
+    image_map     : {"image1.png": "/abs/path/..."} — 값이 bytes 면 메모리 이미지
+                    (get 만 쓰므로 image_extractor.ZipImageMap 도 가능)
     rel_map       : {"rId5": "image1.png"}
     prev_element  : 직전 요소 (QA 답변 병합, 캡션 흡수에 사용)
     """
-    style  = _style_name(para)
-    text   = _clean_text(para)
-    size   = _font_size_pt(para)
-    indent = _indent_twips(para)
+    return classify_features(paragraph_features(para), image_map, rel_map, prev_element)
+
+
+def classify_features(
+    f: ParagraphFeatures,
+    image_map: dict[str, str],
+    rel_map: dict[str, str],
+    prev_element: Optional[DocumentElement] = None,
+) -> Optional[DocumentElement]:
+    """classify_paragraph 의 분류 규칙 — 단락 대신 ParagraphFeatures 를 받는다"""
+    style, text, size, indent = f.style, f.text, f.size, f.indent
 
     # ── 1순위: 이미지 단락 ────────────────────
-    if _has_image(para):
-        r_id, w_emu, h_emu = _extract_image_rel_id(para)
+    if f.image is not None:
+        r_id, w_emu, h_emu = f.image
         filename   = rel_map.get(r_id, "")
-        local_path = image_map.get(filename, "")
+        found      = image_map.get(filename, "")
         caption    = text   # 같은 단락에 텍스트가 있으면 캡션으로
-        if local_path:
+        if found:
+            in_memory = isinstance(found, bytes)
             return ImageElement(
                 type=ElementType.IMAGE,
                 filename=filename,
-                local_path=local_path,
+                local_path="" if in_memory else found,
                 width_emu=w_emu,
                 height_emu=h_emu,
                 caption=caption,
+                data=found if in_memory else None,
             )
         return TextElement(
             type=ElementType.IMAGE_PLACEHOLDER,
@@ -256,7 +310,7 @@ def classify_paragraph(
         return TextElement(type=ElementType.H3, text=text)
 
     # ── 4순위: 목록 ──────────────────────────
-    if _is_list_para(para):
+    if f.is_list:
         return TextElement(type=ElementType.BULLETS, text=text)
 
     # ── 5순위: 폰트 크기 추론 ────────────────
@@ -268,7 +322,7 @@ def classify_paragraph(
         return TextElement(type=ElementType.H3, text=text)
 
     # ── 6순위: Bold + 짧은 문장 → h3 추정 ───
-    if _all_bold(para) and len(text) <= 60:
+    if f.all_bold and len(text) <= 60:
         return TextElement(type=ElementType.H3, text=text)
 
     # ── 7순위: 들여쓰기 → quote 추정 ─────────
@@ -283,11 +337,17 @@ def classify_paragraph(
 # 표 분류
 # ─────────────────────────────────────────────
 
+def table_rows(tbl) -> list[list[str]]:
+    """python-docx Table → 셀 텍스트 행 목록 (병합 셀은 python-docx 규칙대로 반복)"""
+    return [[cell.text.strip() for cell in row.cells] for row in tbl.rows]
+
+
 def classify_table(tbl) -> TableElement:
-    raw_rows: list[list[str]] = []
-    for row in tbl.rows:
-        raw_rows.append([cell.text.strip() for cell in row.cells])
+    return classify_rows(table_rows(tbl))
 
+
+def classify_rows(raw_rows: list[list[str]]) -> TableElement:
+    """셀 텍스트 행 목록 → table2 / table3"""
     if not raw_rows:
         return TableElement(type=ElementType.TABLE2, rows=[])
 
@@ -311,114 +371,166 @@ def classify_table(tbl) -> TableElement:
 
 
 # ─────────────────────────────────────────────
-# 후처리 1: 불릿 단락 병합
+# 후처리 파이프라인 (한 번 순회)
 # ─────────────────────────────────────────────
-
-def merge_bullet_runs(elements: list) -> list:
-    """연속된 BULLETS TextElement → BulletsElement 병합"""
-    merged: list = []
-    i = 0
-    while i < len(elements):
-        el = elements[i]
-        if isinstance(el, TextElement) and el.type == ElementType.BULLETS:
-            items = [el.text]
-            while i + 1 < len(elements):
-                nxt = elements[i + 1]
-                if isinstance(nxt, TextElement) and nxt.type == ElementType.BULLETS:
-                    items.append(nxt.text)
-                    i += 1
-                else:
-                    break
-            merged.append(BulletsElement(type=ElementType.BULLETS, items=items))
+#
+# 분류된 요소를 하나씩 받으며 직전 출력 요소(last)를 한 칸 붙잡아 두고,
+# 규칙이 last 와 새 요소(el)를 보고 합치거나 바꾼다.
+#
+#     rule.step(last, el) -> None | (emit_last, new_last)
+#
+# None 이면 다음 규칙에 넘기고, 아무 규칙도 처리하지 않으면 last 를 내보내고
+# el 을 붙잡는다. 처리했으면
+#     emit_last : last 를 내보낼지 (False 면 계속 붙잡거나 버린다)
+#     new_last  : 새로 붙잡을 요소
+# 예) el 을 last 에 흡수 — (False, last) / el 을 새 요소로 바꿔 시작 — (True, new)
+#     last 를 버리고 el 로 교체 — (False, el)
+#
+# 규칙은 변환마다 새로 만든다 (POSTPROCESS_RULES 에는 클래스를 등록).
+# 예전의 단계별 함수(merge_bullet_runs 등)는 규칙 하나짜리 파이프라인이다.
+
+class _RunRule:
+    """같은 타입 TextElement 연속 단락 → 목록 요소 하나"""
+    elem_type: ElementType
+
+    def __init__(self):
+        self._open = None   # 지금 모으는 중인 목록 요소
+
+    def make(self, text: str):
+        raise NotImplementedError
+
+    def add(self, merged, text: str) -> None:
+        raise NotImplementedError
+
+    def step(self, last, el):
+        if not (isinstance(el, TextElement) and el.type == self.elem_type):
+            return None
+        if last is not None and last is self._open:
+            self.add(last, el.text)
+            return False, last
+        self._open = self.make(el.text)
+        return True, self._open
+
+
+class BulletRunRule(_RunRule):
+    """연속된 BULLETS TextElement → BulletsElement"""
+    elem_type = ElementType.BULLETS
+
+    def make(self, text: str):
+        return BulletsElement(type=ElementType.BULLETS, items=[text])
+
+    def add(self, merged, text: str) -> None:
+        merged.items.append(text)
+
+
+class ConclusionRunRule(_RunRule):
+    """연속된 CONCLUSION TextElement (DS-Conclusion 여러 줄) → ConclusionElement"""
+    elem_type = ElementType.CONCLUSION
+
+    def make(self, text: str):
+        return ConclusionElement(type=ElementType.CONCLUSION, lines=[text])
+
+    def add(self, merged, text: str) -> None:
+        merged.lines.append(text)
+
+
+class CaptionRule:
+    """IMAGE / IMAGE_PLACEHOLDER 직후 CAPTION → 이미지 caption 필드에 흡수 (이미지당 하나)"""
+
+    def __init__(self):
+        self._done = None   # 이미 캡션을 흡수한 이미지
+
+    def step(self, last, el):
+        if not (isinstance(el, TextElement) and el.type == ElementType.CAPTION):
+            return None
+        if last is None or last is self._done:
+            return None
+        if isinstance(last, ImageElement):
+            last.caption = el.text
+        elif isinstance(last, TextElement) and last.type == ElementType.IMAGE_PLACEHOLDER:
+            last.text = el.text
         else:
-            merged.append(el)
-        i += 1
-    return merged
+            return None
+        self._done = last
+        return False, last
 
 
-# ─────────────────────────────────────────────
-# 후처리 2: DS-Conclusion 연속 단락 병합
-# ─────────────────────────────────────────────
+class PromptLabelRule:
+    """
+    라벨 없는 DS-Prompt 바로 앞 body 단락이 '라벨:' 패턴이면
+    그 텍스트를 PromptElement.label 로 옮기고 body 단락은 버린다.
+    """
 
-def merge_conclusion_runs(elements: list) -> list:
+    def step(self, last, el):
+        if not (isinstance(el, PromptElement) and not el.label):
+            return None
+        if not (isinstance(last, TextElement) and last.type == ElementType.BODY):
+            return None
+        m = _RE_LABEL_ONLY.match(last.text)
+        if not m:
+            return None
+        el.label = intern_label(m.group(1).strip())
+        return False, el
+
+
+# 기본 규칙 (적용 순서)
+POSTPROCESS_RULES: list[type] = [BulletRunRule, ConclusionRunRule, CaptionRule, PromptLabelRule]
+
+
+def register_rule(rule: type, before: type | None = None) -> None:
     """
-    연속된 CONCLUSION TextElement → ConclusionElement 병합.
-    DS-Conclusion 스타일 단락 여러 줄을 lines 로 모은다.
+    후처리 규칙 클래스를 기본 파이프라인에 추가한다.
+    before 를 주면 그 규칙 앞에 넣는다 (같은 요소를 먼저 처리할 기회).
     """
-    merged: list = []
-    i = 0
-    while i < len(elements):
-        el = elements[i]
-        if isinstance(el, TextElement) and el.type == ElementType.CONCLUSION:
-            lines = [el.text]
-            while i + 1 < len(elements):
-                nxt = elements[i + 1]
-                if isinstance(nxt, TextElement) and nxt.type == ElementType.CONCLUSION:
-                    lines.append(nxt.text)
-                    i += 1
-                else:
-                    break
-            merged.append(ConclusionElement(
-                type=ElementType.CONCLUSION,
-                lines=lines,
-            ))
+    if rule in POSTPROCESS_RULES:
+        return
+    if before is None:
+        POSTPROCESS_RULES.append(rule)
+    else:
+        POSTPROCESS_RULES.insert(POSTPROCESS_RULES.index(before), rule)
+
+
+def postprocess(
+    elements: Iterable[DocumentElement],
+    rules: Iterable[type] | None = None,
+) -> Iterator[DocumentElement]:
+    """
+    분류된 요소 스트림 → 병합된 요소 스트림 (한 번 순회, 중간 리스트 없음).
+
+    rules : 규칙 클래스 목록 (기본 POSTPROCESS_RULES)
+    """
+    steps = [r().step for r in (POSTPROCESS_RULES if rules is None else rules)]
+    last = None
+    for el in elements:
+        for step in steps:
+            handled = step(last, el)
+            if handled is not None:
+                emit, new_last = handled
+                break
         else:
-            merged.append(el)
-        i += 1
-    return merged
+            emit, new_last = True, el
+        if emit and last is not None:
+            yield last
+        last = new_last
+    if last is not None:
+        yield last
 
 
-# ─────────────────────────────────────────────
-# 후처리 3: 이미지 뒤 캡션 흡수
-# ─────────────────────────────────────────────
+def merge_bullet_runs(elements: list) -> list:
+    """연속된 BULLETS TextElement → BulletsElement 병합"""
+    return list(postprocess(elements, [BulletRunRule]))
+
+
+def merge_conclusion_runs(elements: list) -> list:
+    """연속된 CONCLUSION TextElement → ConclusionElement 병합"""
+    return list(postprocess(elements, [ConclusionRunRule]))
+
 
 def absorb_captions(elements: list) -> list:
     """IMAGE / IMAGE_PLACEHOLDER 직후 CAPTION → 이미지 caption 필드에 흡수"""
-    result = []
-    i = 0
-    while i < len(elements):
-        el = elements[i]
-        result.append(el)
-        is_img = isinstance(el, ImageElement) or (
-            isinstance(el, TextElement) and el.type == ElementType.IMAGE_PLACEHOLDER
-        )
-        if is_img and i + 1 < len(elements):
-            nxt = elements[i + 1]
-            if isinstance(nxt, TextElement) and nxt.type == ElementType.CAPTION:
-                if isinstance(el, ImageElement):
-                    el.caption = nxt.text
-                else:
-                    el.text = nxt.text
-                i += 1
-        i += 1
-    return result
-
+    return list(postprocess(elements, [CaptionRule]))
 
-# ─────────────────────────────────────────────
-# 후처리 4: Prompt 라벨 보완
-# (DS-Prompt 앞 단락이 "라벨:" 형식이면 라벨로 흡수)
-# ─────────────────────────────────────────────
 
 def absorb_prompt_labels(elements: list) -> list:
-    """
-    DS-Prompt 바로 앞 body 단락이 '라벨:' 패턴이면
-    해당 텍스트를 PromptElement.label 로 이동하고 body 단락을 제거한다.
-    """
-    result = []
-    i = 0
-    while i < len(elements):
-        el = elements[i]
-        if (
-            isinstance(el, PromptElement)
-            and not el.label
-            and result
-        ):
-            prev = result[-1]
-            if isinstance(prev, TextElement) and prev.type == ElementType.BODY:
-                m = re.match(r"^(.{1,30})[:：]\s*$", prev.text)
-                if m:
-                    el.label = m.group(1).strip()
-                    result.pop()   # 라벨 body 단락 제거
-        result.append(el)
-        i += 1
-    return result
+    """DS-Prompt 바로 앞 '라벨:' body 단락 → PromptElement.label"""
+    return list(postprocess(elements, [PromptLabelRule]))
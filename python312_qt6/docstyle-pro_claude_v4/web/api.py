@@ -1,14 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
-import shutil
-import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel, Field
 
 from bridge.ai_organizer import (
@@ -19,11 +19,13 @@ from bridge.ai_organizer import (
     inline_edit,
     organize_text,
 )
-from bridge.converter import convert
+from bridge.converter import convert_bytes_async
+from bridge.engine_pool import get_pool
 from gui.structure_doctor import (
     inspect_markdown_structure,
     normalize_markdown_structure,
 )
+from web.jobs import get_job_queue, shutdown_job_queue
 
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -131,7 +133,15 @@ class AiSettingsUpdateRequest(BaseModel):
     groq_key: str = ""
 
 
-app = FastAPI(title="DocStyle Pro API", version="1.0.0")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # 재시작 전에 남은 변환 작업을 다시 큐에 넣는다
+    await asyncio.to_thread(get_job_queue)
+    yield
+    shutdown_job_queue()
+
+
+app = FastAPI(title="DocStyle Pro API", version="1.0.0", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -242,6 +252,15 @@ def health() -> dict:
     return {"ok": True}
 
 
+@app.get("/health/engine")
+def health_engine() -> dict:
+    try:
+        workers = get_pool().health_check()
+    except Exception as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    return {"ok": all(w.get("ok", True) for w in workers), "workers": workers}
+
+
 @app.get("/templates")
 def list_templates() -> dict:
     return {"templates": _parse_template_registry()}
@@ -278,12 +297,7 @@ def update_ai_settings(req: AiSettingsUpdateRequest) -> dict:
     return {"ok": True}
 
 
-@app.post("/convert")
-async def convert_document(
-    file: UploadFile = File(...),
-    template_id: str = Form("01"),
-    custom_settings: str = Form("{}"),
-) -> Response:
+def _validate_upload(file: UploadFile, custom_settings: str) -> tuple[str, dict]:
     suffix = Path(file.filename or "").suffix.lower()
     if suffix not in {".md", ".docx"}:
         raise HTTPException(status_code=400, detail="Only .md or .docx is supported")
@@ -296,41 +310,113 @@ async def convert_document(
         raise HTTPException(
             status_code=400, detail=f"Invalid custom_settings JSON: {exc}"
         ) from exc
+    return suffix, settings
 
-    temp_dir = Path(tempfile.mkdtemp(prefix="docstyle_web_"))
-    input_path = temp_dir / f"input{suffix}"
-    output_path = temp_dir / "output.docx"
 
+async def _run_until_disconnect(request: Request, coro, poll_interval: float = 0.5):
+    """
+    coro 를 작업으로 실행하면서 클라이언트 연결을 감시한다.
+    연결이 끊기면 작업을 취소한다 — convert_bytes_async 는 이때 렌더 중인 Node 워커를 종료한다.
+    """
+    task = asyncio.ensure_future(coro)
     try:
-        data = await file.read()
-        input_path.write_bytes(data)
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise HTTPException(status_code=499, detail="Client disconnected")
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
 
-        result = convert(
-            input_path=str(input_path),
-            output_path=str(output_path),
+@app.post("/convert")
+async def convert_document(
+    request: Request,
+    file: UploadFile = File(...),
+    template_id: str = Form("01"),
+    custom_settings: str = Form("{}"),
+) -> Response:
+    suffix, settings = _validate_upload(file, custom_settings)
+
+    # 업로드 → 파싱은 메모리에서, 렌더는 상주 워커 풀(작업 큐와 같은 풀)로
+    data = await file.read()
+    result = await _run_until_disconnect(
+        request,
+        convert_bytes_async(
+            data,
+            input_type=suffix.lstrip("."),
             template_id=template_id,
             custom_settings=settings,
-            keep_temp=False,
-        )
+            engine="pool",
+        ),
+    )
 
-        if not result.success or not output_path.exists():
-            raise HTTPException(
-                status_code=500, detail=result.error or "convert failed"
-            )
+    if not result.success:
+        raise HTTPException(status_code=500, detail=result.error or "convert failed")
 
-        payload = output_path.read_bytes()
-        headers = {
-            "Content-Disposition": f'attachment; filename="docstyle_{template_id}.docx"',
-            "X-DocStyle-Elements": str(result.element_count),
-            "X-DocStyle-Images": str(result.image_count),
-        }
-        return Response(
-            content=payload,
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers=headers,
-        )
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    headers = {
+        "Content-Disposition": f'attachment; filename="docstyle_{template_id}.docx"',
+        "X-DocStyle-Elements": str(result.element_count),
+        "X-DocStyle-Images": str(result.image_count),
+    }
+    return Response(
+        content=result.data,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        headers=headers,
+    )
+
+
+@app.post("/jobs/convert", status_code=202)
+async def submit_convert_job(
+    file: UploadFile = File(...),
+    template_id: str = Form("01"),
+    custom_settings: str = Form("{}"),
+) -> dict:
+    suffix, settings = _validate_upload(file, custom_settings)
+    data = await file.read()
+    job = await asyncio.to_thread(
+        get_job_queue().submit,
+        data,
+        suffix,
+        template_id=template_id,
+        settings=settings,
+        filename=file.filename or "",
+    )
+    return {"job_id": job["id"], "status": job["status"]}
+
+
+@app.get("/jobs/{job_id}")
+def get_convert_job(job_id: str) -> dict:
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/jobs/{job_id}/result")
+def get_convert_job_result(job_id: str) -> FileResponse:
+    queue = get_job_queue()
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    path = queue.result_path(job_id)
+    if path is None:
+        detail = job["error"] if job["status"] == "failed" else f"Job is {job['status']}"
+        raise HTTPException(status_code=409, detail=detail)
+    return FileResponse(
+        path,
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        filename=f"docstyle_{job['template_id']}.docx",
+        headers={
+            "X-DocStyle-Elements": str(job["element_count"]),
+            "X-DocStyle-Images": str(job["image_count"]),
+        },
+    )
 
 
 @app.post("/ai/organize")
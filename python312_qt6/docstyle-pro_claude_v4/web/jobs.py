@@ -0,0 +1,391 @@
+"""
+jobs.py — 웹 변환 백그라운드 작업 큐
+
+    queue = get_job_queue()
+    job = queue.submit(data, ".md", template_id="01", settings={})
+    queue.get(job["id"])   # {"status": "running", "progress": 60, ...}
+
+- 작업 상태는 SQLite 테이블 하나에 저장한다 ({DOCSTYLE_JOBS_DIR}/jobs.sqlite3)
+- 입력 / 결과 파일은 {DOCSTYLE_JOBS_DIR}/{job_id}/ 아래
+- 변환은 DOCSTYLE_JOB_WORKERS 개(기본 2) 스레드에서 convert() 로 실행하고
+  progress_callback 값을 그대로 progress / message 에 기록한다
+- 작업은 실행 직전에 queued → running 조건부 UPDATE 로 가져가며 owner(프로세스)와
+  heartbeat 를 기록한다. 실행 중에는 DOCSTYLE_JOB_LEASE / 3 초마다 heartbeat 를 갱신한다
+- heartbeat 가 DOCSTYLE_JOB_LEASE 초(기본 60) 넘게 멈춘 running 작업(죽은 프로세스)만
+  queued 로 되돌려 다시 실행한다 — 시작 시와 heartbeat 주기마다.
+  같은 DOCSTYLE_JOBS_DIR 를 여러 프로세스가 써도(uvicorn --workers N) 살아 있는
+  프로세스의 작업을 가로채지 않고, 작업마다 한 번만 실행된다
+- 끝난 작업은 DOCSTYLE_JOB_TTL 초(기본 86400)가 지나면 시작 시 정리한다
+
+상태: queued → running → done | failed
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from bridge.converter import convert
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            TEXT PRIMARY KEY,
+    status        TEXT NOT NULL,
+    progress      INTEGER NOT NULL DEFAULT 0,
+    message       TEXT NOT NULL DEFAULT '',
+    filename      TEXT NOT NULL DEFAULT '',
+    template_id   TEXT NOT NULL,
+    settings      TEXT NOT NULL DEFAULT '{}',
+    input_path    TEXT NOT NULL,
+    output_path   TEXT NOT NULL,
+    error         TEXT NOT NULL DEFAULT '',
+    element_count INTEGER NOT NULL DEFAULT 0,
+    image_count   INTEGER NOT NULL DEFAULT 0,
+    created_at    REAL NOT NULL,
+    started_at    REAL,
+    finished_at   REAL,
+    owner         TEXT NOT NULL DEFAULT '',
+    heartbeat     REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+"""
+
+# 이전 스키마 DB 에 없을 수 있는 열
+_ADDED_COLUMNS = (
+    ("owner", "TEXT NOT NULL DEFAULT ''"),
+    ("heartbeat", "REAL"),
+)
+
+# GET /jobs/{id} 로 내보내는 열
+_PUBLIC_FIELDS = (
+    "id", "status", "progress", "message", "filename", "template_id", "error",
+    "element_count", "image_count", "created_at", "started_at", "finished_at",
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+# ─────────────────────────────────────────────
+# 작업 테이블
+# ─────────────────────────────────────────────
+
+class JobStore:
+    """SQLite 작업 테이블 (스레드 안전 — 연결 하나를 잠금으로 공유)"""
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            cols = {r["name"] for r in self._conn.execute("PRAGMA table_info(jobs)")}
+            for name, decl in _ADDED_COLUMNS:
+                if name not in cols:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {decl}")
+
+    def insert(self, job: dict) -> None:
+        cols = ", ".join(job)
+        marks = ", ".join("?" for _ in job)
+        with self._lock:
+            self._conn.execute(f"INSERT INTO jobs ({cols}) VALUES ({marks})", tuple(job.values()))
+
+    def update(self, job_id: str, **fields) -> None:
+        sets = ", ".join(f"{k} = ?" for k in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {sets} WHERE id = ?", (*fields.values(), job_id))
+
+    def get(self, job_id: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def claim(self, job_id: str, owner: str) -> bool:
+        """queued 작업을 owner 의 running 으로 가져간다. 다른 워커 · 프로세스가 먼저 가져갔으면 False"""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = 'running', progress = 0, message = '', started_at = ?, "
+                "owner = ?, heartbeat = ? WHERE id = ? AND status = 'queued'",
+                (now, owner, now, job_id),
+            )
+        return cur.rowcount == 1
+
+    def heartbeat(self, owner: str) -> None:
+        """owner 가 실행 중인 작업의 임대를 연장한다"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET heartbeat = ? WHERE owner = ? AND status = 'running'",
+                (time.time(), owner),
+            )
+
+    def requeue(self, message: str, stale_before: float, all_queued: bool = True) -> list[dict]:
+        """
+        heartbeat 가 stale_before 보다 오래된 running 작업을 queued 로 되돌리고
+        다시 실행할 작업을 반환한다 (생성 순). 한 트랜잭션에서 처리한다.
+
+        all_queued : True 면 queued 작업 전체, False 면 이번에 되돌린 작업만
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                stale = [r["id"] for r in self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'running' "
+                    "AND (heartbeat IS NULL OR heartbeat < ?)",
+                    (stale_before,),
+                )]
+                self._conn.executemany(
+                    "UPDATE jobs SET status = 'queued', progress = 0, message = ?, started_at = NULL, "
+                    "owner = '', heartbeat = NULL WHERE id = ?",
+                    [(message, job_id) for job_id in stale],
+                )
+                if all_queued:
+                    rows = self._conn.execute(
+                        "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at"
+                    ).fetchall()
+                else:
+                    marks = ", ".join("?" for _ in stale)
+                    rows = self._conn.execute(
+                        f"SELECT * FROM jobs WHERE id IN ({marks}) ORDER BY created_at", stale
+                    ).fetchall() if stale else []
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return [dict(r) for r in rows]
+
+    def expired(self, before: float) -> list[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?", (before,)
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ─────────────────────────────────────────────
+# 작업 큐
+# ─────────────────────────────────────────────
+
+class JobQueue:
+    """
+    변환 작업 큐.
+
+    Parameters
+    ----------
+    jobs_dir : 작업 DB 와 입력 / 결과 파일을 둘 디렉터리
+    workers  : 동시에 실행할 변환 수
+    engine   : convert() 엔진 모드 (기본 "pool" — 상주 Node 워커 재사용)
+    ttl      : 끝난 작업을 보관할 시간(초)
+    lease    : heartbeat 가 이만큼(초) 멈춘 running 작업은 죽은 것으로 보고 다시 실행
+    """
+
+    def __init__(
+        self,
+        jobs_dir: str | Path,
+        workers: int = 2,
+        engine: str = "pool",
+        ttl: float = 86400,
+        lease: float = 60,
+    ):
+        self.jobs_dir = Path(jobs_dir)
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.store = JobStore(self.jobs_dir / "jobs.sqlite3")
+        self.engine = engine
+        self.ttl = ttl
+        self.lease = lease
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="docstyle-job")
+        self._closed = False
+        self._stop = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+
+    def start(self) -> int:
+        """만료 작업 정리 후 남은 작업을 다시 큐에 넣는다. 재개한 작업 수를 반환."""
+        for job in self.store.expired(time.time() - self.ttl):
+            shutil.rmtree(self.jobs_dir / job["id"], ignore_errors=True)
+            self.store.delete(job["id"])
+        pending = self.store.requeue("재시작 후 대기 중", time.time() - self.lease)
+        for job in pending:
+            self._executor.submit(self._run, job["id"])
+        if self._heartbeat_thread is None:
+            self._heartbeat_thread = threading.Thread(
+                target=self._heartbeat_loop, name="docstyle-job-heartbeat", daemon=True,
+            )
+            self._heartbeat_thread.start()
+        return len(pending)
+
+    def submit(
+        self,
+        data: bytes,
+        suffix: str,
+        template_id: str = "01",
+        settings: dict | None = None,
+        filename: str = "",
+    ) -> dict:
+        """입력 바이트를 저장하고 작업을 큐에 넣는다"""
+        if self._closed:
+            raise RuntimeError("작업 큐가 종료되었습니다")
+        job_id = uuid.uuid4().hex
+        job_dir = self.jobs_dir / job_id
+        job_dir.mkdir(parents=True)
+        input_path = job_dir / f"input{suffix}"
+        input_path.write_bytes(data)
+
+        self.store.insert({
+            "id": job_id,
+            "status": "queued",
+            "filename": filename,
+            "template_id": template_id,
+            "settings": json.dumps(settings or {}, ensure_ascii=False),
+            "input_path": str(input_path),
+            "output_path": str(job_dir / "output.docx"),
+            "created_at": time.time(),
+        })
+        self._executor.submit(self._run, job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> dict | None:
+        """공개 상태 — 내부 경로 / 설정은 빼고 반환"""
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        return {k: job[k] for k in _PUBLIC_FIELDS}
+
+    def result_path(self, job_id: str) -> Path | None:
+        """끝난 작업의 결과 .docx 경로 (없으면 None)"""
+        job = self.store.get(job_id)
+        if job is None or job["status"] != "done":
+            return None
+        path = Path(job["output_path"])
+        return path if path.exists() else None
+
+    def shutdown(self) -> None:
+        """
+        새 작업을 막고 워커를 정리한다. 실행 중이던 작업은 running 으로 남고,
+        heartbeat 가 멈춰 lease 가 지나면 다른 프로세스나 다음 start() 가 다시 실행한다.
+        """
+        self._closed = True
+        self._stop.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ── 내부
+
+    def _heartbeat_loop(self) -> None:
+        """lease / 3 초마다 임대를 연장하고, 임대가 끝난 다른 프로세스의 작업을 넘겨받는다"""
+        while not self._stop.wait(self.lease / 3):
+            try:
+                self.store.heartbeat(self.owner)
+                stale = self.store.requeue("작업자 중단 후 대기 중", time.time() - self.lease, all_queued=False)
+            except sqlite3.Error:
+                continue   # DB 가 잠시 잠겨 있으면 다음 주기에
+            for job in stale:
+                if self._closed:
+                    return
+                self._executor.submit(self._run, job["id"])
+
+    def _run(self, job_id: str) -> None:
+        if self._closed or not self.store.claim(job_id, self.owner):
+            return   # 종료 중이거나 이미 다른 워커 · 프로세스가 가져감
+        job = self.store.get(job_id)
+        if job is None:
+            return
+
+        def _progress(pct: int, msg: str = "") -> None:
+            self.store.update(job_id, progress=int(pct), message=msg)
+
+        try:
+            result = convert(
+                input_path=job["input_path"],
+                output_path=job["output_path"],
+                template_id=job["template_id"],
+                custom_settings=json.loads(job["settings"] or "{}"),
+                keep_temp=False,
+                progress_callback=_progress,
+                engine=self.engine,
+            )
+        except Exception as e:   # convert() 는 보통 ConvertResult 로 보고하지만 방어적으로
+            self.store.update(job_id, status="failed", error=str(e), finished_at=time.time())
+            return
+
+        if result.success and Path(job["output_path"]).exists():
+            self.store.update(
+                job_id,
+                status="done",
+                progress=100,
+                element_count=result.element_count,
+                image_count=result.image_count,
+                finished_at=time.time(),
+            )
+        else:
+            self.store.update(
+                job_id, status="failed", error=result.error or "convert failed", finished_at=time.time(),
+            )
+        try:
+            Path(job["input_path"]).unlink()
+        except OSError:
+            pass
+
+
+# ─────────────────────────────────────────────
+# 프로세스 공용 큐
+# ─────────────────────────────────────────────
+
+_queue: JobQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    프로세스 공용 작업 큐 (처음 호출 시 생성 · 재개).
+
+    DOCSTYLE_JOBS_DIR    작업 디렉터리 (기본 temp/jobs)
+    DOCSTYLE_JOB_WORKERS 동시 변환 수 (기본 2)
+    DOCSTYLE_JOB_TTL     끝난 작업 보관 시간(초, 기본 86400)
+    DOCSTYLE_JOB_LEASE   running 작업 임대 시간(초, 기본 60)
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(
+                os.getenv("DOCSTYLE_JOBS_DIR") or ROOT / "temp" / "jobs",
+                workers=_env_int("DOCSTYLE_JOB_WORKERS", 2),
+                ttl=_env_int("DOCSTYLE_JOB_TTL", 86400),
+                lease=_env_int("DOCSTYLE_JOB_LEASE", 60),
+            )
+            _queue.start()
+        return _queue
+
+
+def shutdown_job_queue() -> None:
+    global _queue
+    with _queue_lock:
+        if _queue is not None:
+            _queue.shutdown()
+            _queue = None